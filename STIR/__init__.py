@@ -3,6 +3,8 @@ STIR (Soil Tillage Intensity Rating) calculation module.
 
 This module provides models and utilities for calculating soil tillage
 intensity ratings based on field operations and machine parameters.
+The stir_batch module evaluates many operations, or a depth x speed sweep of one
+machine, at once with NumPy.
 """
 
 from .data.model_machine import Machine
@@ -69,6 +69,11 @@ class CustomMachineTool:
     def is_empty(self) -> bool:
         """Check if this tool has any meaningful data."""
         return not self.name.strip()
+    
+    def copy(self) -> 'CustomMachineTool':
+        """Create a copy of this tool."""
+        return CustomMachineTool(self.name, self.rotates, self.depth, self.depth_uom,
+                                 self.surface_area_disturbed, self.tillage_type_factor)
 
 
 class CustomMachine:
@@ -142,6 +147,11 @@ class CustomMachine:
         """Get list of tools that have meaningful data (not empty)."""
         return [tool for tool in self.tools if not tool.is_empty()]
     
+    def copy(self) -> 'CustomMachine':
+        """Create a copy of this machine, with copies of its tools."""
+        return CustomMachine(self.name, self.speed, self.speed_uom, self.picture, self.notes,
+                             [tool.copy() for tool in self.tools])
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert custom machine to dictionary representation.
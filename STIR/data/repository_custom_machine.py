@@ -3,11 +3,15 @@ Repository for managing custom machines data.
 
 This module provides functionality to read, write, and manage custom machines
 stored in CSV format.
+
+The CSV file is parsed once and kept in memory with a name index; it is parsed again
+only when its modification time or size changes (e.g. edited outside the app). Writes
+go to a temporary file that replaces the CSV file, so a crash never leaves it half-written.
 """
 
 import csv
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from .model_custom_machine import CustomMachine, CustomMachineTool
 from common.utils import resource_path
 
@@ -33,21 +37,43 @@ class CustomMachineRepository:
         """
         self.csv_file = csv_file
         self.csv_path = resource_path(f"STIR/data/{csv_file}")
-    
-    def load_all(self) -> List[CustomMachine]:
-        """
-        Load all custom machines from the CSV file.
         
-        Returns:
-            List[CustomMachine]: List of all custom machines
-        """
+        # In-memory copy of the CSV file; handed out as copies so callers can edit them freely
+        self._machines: List[CustomMachine] = []
+        self._machines_by_name: Dict[str, CustomMachine] = {}  # First machine of each name
+        self._file_signature: Optional[Tuple[int, int]] = None  # (mtime, size) the cache was read at
+        self._loaded = False
+    
+    def _get_file_signature(self) -> Optional[Tuple[int, int]]:
+        """Get the (modification time, size) of the CSV file, or None if it does not exist."""
+        try:
+            stat = os.stat(self.csv_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+    
+    def _get_machines(self) -> List[CustomMachine]:
+        """Get the cached machines, reading the CSV file on first use or after it changed."""
+        signature = self._get_file_signature()
+        if not self._loaded or signature != self._file_signature:
+            self._set_cache(self._read_csv(self.csv_path) if signature is not None else [])
+            self._file_signature = signature
+        return self._machines
+    
+    def _set_cache(self, machines: List[CustomMachine]):
+        """Replace the cached machines and rebuild the name index."""
+        self._machines = machines
+        self._machines_by_name = {}
+        for machine in machines:
+            self._machines_by_name.setdefault(machine.name, machine)
+        self._loaded = True
+    
+    def _read_csv(self, path: str) -> List[CustomMachine]:
+        """Read custom machines from a CSV file, skipping rows that fail to load."""
         machines = []
         
-        if not os.path.exists(self.csv_path):
-            return machines
-        
         try:
-            with open(self.csv_path, 'r', newline='', encoding='utf-8') as file:
+            with open(path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.DictReader(file)
                 for row in reader:
                     try:
@@ -62,6 +88,15 @@ class CustomMachineRepository:
         
         return machines
     
+    def load_all(self) -> List[CustomMachine]:
+        """
+        Load all custom machines.
+        
+        Returns:
+            List[CustomMachine]: List of all custom machines
+        """
+        return [machine.copy() for machine in self._get_machines()]
+    
     def save_all(self, machines: List[CustomMachine]) -> bool:
         """
         Save all custom machines to the CSV file.
@@ -72,29 +107,40 @@ class CustomMachineRepository:
         Returns:
             bool: True if successful, False otherwise
         """
+        machines = [machine.copy() for machine in machines]
+        if not self._write_csv(machines):
+            return False
+        
+        self._set_cache(machines)
+        self._file_signature = self._get_file_signature()
+        return True
+    
+    def _write_csv(self, machines: List[CustomMachine]) -> bool:
+        """Write machines to a temporary file and move it over the CSV file."""
+        temp_path = f"{self.csv_path}.tmp"
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
             
-            with open(self.csv_path, 'w', newline='', encoding='utf-8') as file:
-                if not machines:
-                    # Write header only if no machines
-                    writer = csv.writer(file)
-                    writer.writerow(self._get_fieldnames())
-                    return True
-                
-                # Write data
-                fieldnames = self._get_fieldnames()
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
+            with open(temp_path, 'w', newline='', encoding='utf-8') as file:
+                writer = csv.DictWriter(file, fieldnames=self._get_fieldnames())
                 writer.writeheader()
                 
                 for machine in machines:
                     writer.writerow(machine.to_dict())
-                    
+                
+                file.flush()
+                os.fsync(file.fileno())
+            
+            os.replace(temp_path, self.csv_path)
             return True
             
         except Exception as e:
             print(f"Error saving custom machines CSV: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
             return False
     
     def add_machine(self, machine: CustomMachine) -> bool:
@@ -107,9 +153,7 @@ class CustomMachineRepository:
         Returns:
             bool: True if successful, False otherwise
         """
-        machines = self.load_all()
-        machines.append(machine)
-        return self.save_all(machines)
+        return self.save_all(self._get_machines() + [machine])
     
     def update_machine(self, old_name: str, updated_machine: CustomMachine) -> bool:
         """
@@ -122,14 +166,14 @@ class CustomMachineRepository:
         Returns:
             bool: True if successful, False if machine not found
         """
-        machines = self.load_all()
-        
-        for i, machine in enumerate(machines):
-            if machine.name == old_name:
-                machines[i] = updated_machine
-                return self.save_all(machines)
+        machines = self._get_machines()
+        old_machine = self._machines_by_name.get(old_name)
+        if old_machine is None:
+            return False
         
-        return False
+        machines = list(machines)
+        machines[machines.index(old_machine)] = updated_machine
+        return self.save_all(machines)
     
     def delete_machine(self, name: str) -> bool:
         """
@@ -141,15 +185,11 @@ class CustomMachineRepository:
         Returns:
             bool: True if successful, False if machine not found
         """
-        machines = self.load_all()
-        original_count = len(machines)
-        
-        machines = [machine for machine in machines if machine.name != name]
-        
-        if len(machines) < original_count:
-            return self.save_all(machines)
+        machines = self._get_machines()
+        if name not in self._machines_by_name:
+            return False
         
-        return False
+        return self.save_all([machine for machine in machines if machine.name != name])
     
     def find_by_name(self, name: str) -> Optional[CustomMachine]:
         """
@@ -161,13 +201,9 @@ class CustomMachineRepository:
         Returns:
             CustomMachine: The machine if found, None otherwise
         """
-        machines = self.load_all()
-        
-        for machine in machines:
-            if machine.name == name:
-                return machine
-        
-        return None
+        self._get_machines()
+        machine = self._machines_by_name.get(name)
+        return machine.copy() if machine is not None else None
     
     def get_machine_by_name(self, name: str) -> Optional[CustomMachine]:
         """
@@ -188,8 +224,7 @@ class CustomMachineRepository:
         Returns:
             List[str]: List of machine names
         """
-        machines = self.load_all()
-        return [machine.name for machine in machines]
+        return [machine.name for machine in self._get_machines()]
     
     def _get_fieldnames(self) -> List[str]:
         """Get the fieldnames for the CSV file."""
@@ -219,7 +254,7 @@ class CustomMachineRepository:
         Returns:
             bool: True if successful, False otherwise
         """
-        machines = self.load_all()
+        machines = self._get_machines()
         
         try:
             with open(export_path, 'w', newline='', encoding='utf-8') as file:
@@ -263,9 +298,7 @@ class CustomMachineRepository:
             if replace_existing:
                 return self.save_all(imported_machines)
             else:
-                existing_machines = self.load_all()
-                all_machines = existing_machines + imported_machines
-                return self.save_all(all_machines)
+                return self.save_all(self._get_machines() + imported_machines)
                 
         except Exception as e:
             print(f"Error importing custom machines: {e}")
@@ -13,10 +13,11 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QScrollArea,
                                QFrame, QSizePolicy)
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QPixmap
-from typing import List
+from typing import List, Optional
 from ..data.model_custom_machine import CustomMachine
 from ..data.repository_custom_machine import CustomMachineRepository
 from .custom_machine_editor_dialog import NewCustomMachineDialog
+from common.thumbnail_cache import load_thumbnail
 from common.utils import resource_path
 
 
@@ -60,15 +61,9 @@ class CustomMachineCard(QFrame):
         if self.machine.picture:
             # Try custom machines folder first
             custom_image_path = resource_path(f"STIR/data/images/custom_machines/{self.machine.picture}")
-            if os.path.exists(custom_image_path):
-                pixmap = QPixmap(custom_image_path)
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(190, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    image_label.setPixmap(scaled_pixmap)
-                else:
-                    image_label.setText("Missing\npicture")
-            else:
-                image_label.setText("Missing\npicture")
+            image_label.setText("Loading...")
+            load_thumbnail(image_label, custom_image_path, 190, 150,
+                           lambda pixmap, label=image_label: self.set_image(label, pixmap))
         else:
             image_label.setText("No\npicture")
             
@@ -201,6 +196,14 @@ class CustomMachineCard(QFrame):
         # Add the complete right container to main layout
         main_layout.addLayout(right_container)
     
+    def set_image(self, image_label: QLabel, pixmap: Optional[QPixmap]):
+        """Show the machine picture, or a placeholder if it is missing or unreadable."""
+        if pixmap is not None:
+            image_label.setText("")
+            image_label.setPixmap(pixmap)
+        else:
+            image_label.setText("Missing\npicture")
+    
     def get_machine_notes(self) -> str:
         """Get notes for this machine from the custom machines CSV."""
         try:
@@ -228,7 +231,7 @@ class CustomMachineManagerDialog(QDialog):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.machine_repo = CustomMachineRepository()
+        self.machine_repo = CustomMachineRepository.get_instance()
         
         self.setWindowTitle("Manage Custom Machines")
         self.setModal(True)
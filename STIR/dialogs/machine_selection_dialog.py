@@ -15,6 +15,7 @@ from ..data.model_custom_machine import CustomMachine
 from ..data.repository_machine import MachineRepository
 from ..data.repository_custom_machine import CustomMachineRepository
 from .custom_machine_editor_dialog import NewCustomMachineDialog
+from common.thumbnail_cache import load_thumbnail
 from common.utils import resource_path
 
 
@@ -155,30 +156,21 @@ class MachineSelectionDialog(QDialog):
             image_label.setAlignment(Qt.AlignCenter)
             image_label.setStyleSheet("background-color: #ffffff; border-radius: 4px;")
             
-            # Load and set the picture
-            image_loaded = False
+            # Load the picture in the background, with a placeholder until it arrives
+            is_custom = self.is_custom_machine(machine)
             if machine.picture:
                 # Determine image path based on machine type
-                if self.is_custom_machine(machine):
+                if is_custom:
                     image_path = resource_path(f"STIR/data/images/custom_machines/{machine.picture}")
                 else:
                     image_path = resource_path(f"STIR/data/images/machines/{machine.picture}")
                 
-                pixmap = QPixmap(image_path)
-                if not pixmap.isNull():
-                    # Scale pixmap to fit label while maintaining aspect ratio
-                    scaled_pixmap = pixmap.scaled(150, 110, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    image_label.setPixmap(scaled_pixmap)
-                    image_loaded = True
-            
-            # If no image could be loaded, show appropriate placeholder
-            if not image_loaded:
-                if self.is_custom_machine(machine):
-                    image_label.setText("Custom\nMachine")
-                    image_label.setStyleSheet("background-color: #ffffff; border-radius: 4px; color: #666; font-size: 10px; font-weight: bold;")
-                else:
-                    image_label.setText("No Image\nAvailable")
-                    image_label.setStyleSheet("background-color: #ffffff; border-radius: 4px; color: #666; font-size: 10px;")
+                image_label.setText("Loading...")
+                image_label.setStyleSheet("background-color: #ffffff; border-radius: 4px; color: #999; font-size: 10px;")
+                load_thumbnail(image_label, image_path, 150, 110,
+                               lambda pixmap, label=image_label, custom=is_custom: self.set_card_image(label, pixmap, custom))
+            else:
+                self.set_card_image(image_label, None, is_custom)
 
             card_layout.addWidget(image_label)
             
@@ -226,6 +218,19 @@ class MachineSelectionDialog(QDialog):
             
             grid_layout.addWidget(machine_card, row, col)
     
+    def set_card_image(self, image_label: QLabel, pixmap: Optional[QPixmap], is_custom: bool):
+        """Show a machine picture on its card, or the appropriate placeholder if there is none."""
+        if pixmap is not None:
+            image_label.setText("")
+            image_label.setStyleSheet("background-color: #ffffff; border-radius: 4px;")
+            image_label.setPixmap(pixmap)
+        elif is_custom:
+            image_label.setText("Custom\nMachine")
+            image_label.setStyleSheet("background-color: #ffffff; border-radius: 4px; color: #666; font-size: 10px; font-weight: bold;")
+        else:
+            image_label.setText("No Image\nAvailable")
+            image_label.setStyleSheet("background-color: #ffffff; border-radius: 4px; color: #666; font-size: 10px;")
+    
     def select_machine(self, machine_name: str):
         """Handle machine selection and close dialog."""
         self.selected_machine_name = machine_name
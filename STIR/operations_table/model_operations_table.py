@@ -3,11 +3,15 @@ STIR Operations Table Model
 
 A Qt model for managing STIR operations with grouped display functionality.
 Provides a clean Model/View architecture for the operations table.
+
+Edits are announced as targeted row moves, inserts, removals and dataChanged ranges
+rather than model resets, and the season STIR total is kept as a running sum updated
+by the edited operation only, so long multi-year tillage plans stay responsive.
 """
 
 from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex, Signal
 from PySide6.QtGui import QFont
-from typing import List, Any, Optional, Dict
+from typing import List, Any, Optional, Dict, Tuple
 from collections import defaultdict
 import math
 
@@ -41,6 +45,8 @@ class STIROperationsTableModel(QAbstractTableModel):
         # Data storage
         self._operations: List[Operation] = []
         self._row_data: List[Dict] = []  # Maps display rows to data
+        self._display_row_of: List[int] = []  # Maps operation indexes to display rows
+        self._total_stir = 0.0  # Running sum of the operations' STIR values
         self._machine_repo = MachineRepository.get_instance()
         self._custom_machine_repo = CustomMachineRepository.get_instance()
         
@@ -116,13 +122,14 @@ class STIROperationsTableModel(QAbstractTableModel):
             return False
         
         column = index.column()
+        old_stir = operation.stir_value or 0
         
         try:
             if column == 0:  # Group
                 new_group = str(value).strip()
                 if new_group != operation.operation_group:
                     operation.operation_group = new_group
-                    self._rebuild_display_data()
+                    self._update_display_rows(operation, "move")
                     self._emit_signals()
                     return True
                     
@@ -159,7 +166,10 @@ class STIROperationsTableModel(QAbstractTableModel):
                         operation.machine_name = ""
                         operation.custom_machine_tools = None
                     
-                    self._rebuild_display_data()
+                    # Every column of the row may show new machine parameters
+                    self.dataChanged.emit(self.index(index.row(), 0),
+                                          self.index(index.row(), self.columnCount() - 1), [Qt.DisplayRole])
+                    self._update_total_stir(operation, old_stir)
                     self._emit_signals()
                     return True
                     
@@ -181,6 +191,7 @@ class STIROperationsTableModel(QAbstractTableModel):
                             operation.adjust_custom_machine_depth(depth_cm, "cm")
                             operation.calculate_stir()
                             self.dataChanged.emit(index, index, [Qt.DisplayRole])
+                            self._update_total_stir(operation, old_stir)
                             self._emit_signals()
                             return True
                 else:
@@ -194,6 +205,7 @@ class STIROperationsTableModel(QAbstractTableModel):
                         operation.depth = new_depth
                         operation.calculate_stir()
                         self.dataChanged.emit(index, index, [Qt.DisplayRole])
+                        self._update_total_stir(operation, old_stir)
                         self._emit_signals()
                         return True
                     
@@ -217,6 +229,7 @@ class STIROperationsTableModel(QAbstractTableModel):
                     operation.speed = new_speed
                     operation.calculate_stir()
                     self.dataChanged.emit(index, index, [Qt.DisplayRole])
+                    self._update_total_stir(operation, old_stir)
                     self._emit_signals()
                     return True
                     
@@ -233,6 +246,7 @@ class STIROperationsTableModel(QAbstractTableModel):
                     operation.surface_area_disturbed = new_area
                     operation.calculate_stir()
                     self.dataChanged.emit(index, index, [Qt.DisplayRole])
+                    self._update_total_stir(operation, old_stir)
                     self._emit_signals()
                     return True
                     
@@ -244,6 +258,7 @@ class STIROperationsTableModel(QAbstractTableModel):
                     operation.field_tilled = new_field_tilled
                     operation.calculate_stir()
                     self.dataChanged.emit(index, index, [Qt.DisplayRole])
+                    self._update_total_stir(operation, old_stir)
                     self._emit_signals()
                     return True
                     
@@ -253,6 +268,7 @@ class STIROperationsTableModel(QAbstractTableModel):
                     operation.number_of_passes = new_passes
                     operation.calculate_stir()
                     self.dataChanged.emit(index, index, [Qt.DisplayRole])
+                    self._update_total_stir(operation, old_stir)
                     self._emit_signals()
                     return True
                     
@@ -302,6 +318,7 @@ class STIROperationsTableModel(QAbstractTableModel):
         """Set the operations to display in the table."""
         self.beginResetModel()
         self._operations = operations or []
+        self._total_stir = sum(op.stir_value or 0 for op in self._operations)
         self._rebuild_display_data()
         self.endResetModel()
         self._emit_signals()
@@ -329,24 +346,19 @@ class STIROperationsTableModel(QAbstractTableModel):
         
         # Insert the operation
         self._operations.insert(insert_index, operation)
+        self._total_stir += operation.stir_value or 0
         
-        # Rebuild display
-        self.beginResetModel()
-        self._rebuild_display_data()
-        self.endResetModel()
-        
+        self._update_display_rows(operation, "insert")
         self._emit_signals()
         return insert_index
     
     def remove_operation(self, operation_index: int) -> bool:
         """Remove an operation by its index. Returns True if successful."""
         if 0 <= operation_index < len(self._operations):
-            self._operations.pop(operation_index)
-            
-            self.beginResetModel()
-            self._rebuild_display_data()
-            self.endResetModel()
+            operation = self._operations.pop(operation_index)
+            self._total_stir -= operation.stir_value or 0
             
+            self._update_display_rows(operation, "remove")
             self._emit_signals()
             return True
         
@@ -362,25 +374,31 @@ class STIROperationsTableModel(QAbstractTableModel):
     
     def get_display_row_from_operation_index(self, operation_index: int) -> int:
         """Get the display row for an operation index. Returns -1 if not found."""
-        for row, row_info in enumerate(self._row_data):
-            if (row_info.get("type") == self.ROW_TYPE_OPERATION and 
-                row_info.get("operation_index") == operation_index):
-                return row
+        if 0 <= operation_index < len(self._display_row_of):
+            return self._display_row_of[operation_index]
         return -1
     
     def get_total_stir(self) -> float:
-        """Calculate the total STIR value for all operations (rounded up to next integer)."""
-        total = sum(op.stir_value for op in self._operations if op.stir_value is not None)
-        return math.ceil(total)
+        """Get the total STIR value for all operations (rounded up to next integer)."""
+        return math.ceil(self._total_stir)
     
     # --- Private Methods ---
     
     def _rebuild_display_data(self):
         """Rebuild the display row data with operations grouped by operation_group."""
-        self._row_data.clear()
-        
+        self._set_row_data(self._build_display_rows())
+    
+    def _set_row_data(self, row_data: List[Dict]):
+        """Install new display rows and index the display row of each operation."""
+        self._row_data = row_data
+        self._display_row_of = [-1] * len(self._operations)
+        for row, row_info in enumerate(row_data):
+            self._display_row_of[row_info["operation_index"]] = row
+    
+    def _build_display_rows(self) -> List[Dict]:
+        """Build the display rows: operations grouped by operation_group, groups in chronological order."""
         if not self._operations:
-            return
+            return []
         
         # Group operations by operation_group
         grouped_operations = self._group_operations_by_group()
@@ -399,24 +417,72 @@ class STIROperationsTableModel(QAbstractTableModel):
                 sorted_groups.append(group)
         
         # Build display rows - operations only, no headers
+        row_data = []
         for group_name in sorted_groups:
-            operations_in_group = grouped_operations[group_name]
-            
-            # Add operations directly without group header
-            for operation in operations_in_group:
-                operation_index = self._operations.index(operation)
-                operation_info = {
+            for operation_index, operation in grouped_operations[group_name]:
+                row_data.append({
                     "type": self.ROW_TYPE_OPERATION,
                     "operation": operation,
                     "operation_index": operation_index
-                }
-                self._row_data.append(operation_info)
+                })
+        return row_data
+    
+    def _update_display_rows(self, operation: Operation, change: str):
+        """
+        Regroup the display rows after one operation was inserted, removed or changed group.
+        
+        The change is announced as a single row insert, removal or move when the other rows
+        keep their order (falling back to a model reset when group order changed), followed
+        by a dataChanged over the rows whose group dividers may have changed.
+        
+        Args:
+            operation: The inserted, removed or regrouped operation
+            change: "insert", "remove" or "move"
+        """
+        new_row_data = self._build_display_rows()
+        old_rows = [row_info["operation"] for row_info in self._row_data]
+        new_rows = [row_info["operation"] for row_info in new_row_data]
+        old_row = next((row for row, op in enumerate(old_rows) if op is operation), -1)
+        new_row = next((row for row, op in enumerate(new_rows) if op is operation), -1)
+        
+        others_kept_order = (len(old_rows) - (old_row >= 0) == len(new_rows) - (new_row >= 0) and all(
+            a is b for a, b in zip((op for op in old_rows if op is not operation),
+                                   (op for op in new_rows if op is not operation))))
+        if not others_kept_order:
+            self.beginResetModel()
+            self._set_row_data(new_row_data)
+            self.endResetModel()
+            return
+        
+        if change == "insert":
+            self.beginInsertRows(QModelIndex(), new_row, new_row)
+            self._set_row_data(new_row_data)
+            self.endInsertRows()
+        elif change == "remove":
+            self.beginRemoveRows(QModelIndex(), old_row, old_row)
+            self._set_row_data(new_row_data)
+            self.endRemoveRows()
+        elif new_row != old_row:
+            destination = new_row + 1 if new_row > old_row else new_row
+            self.beginMoveRows(QModelIndex(), old_row, old_row, QModelIndex(), destination)
+            self._set_row_data(new_row_data)
+            self.endMoveRows()
+        else:
+            self._set_row_data(new_row_data)
+        
+        # Repaint the changed row and its old and new neighbours (group dividers)
+        rows = [row for row in (old_row, new_row) if row >= 0]
+        first = max(min(rows) - 1, 0)
+        last = min(max(rows) + 1, len(self._row_data) - 1)
+        if first <= last:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1),
+                                  [Qt.DisplayRole])
     
-    def _group_operations_by_group(self) -> Dict[str, List[Operation]]:
-        """Group operations by their operation_group."""
+    def _group_operations_by_group(self) -> Dict[str, List[Tuple[int, Operation]]]:
+        """Group operations, with their indexes, by their operation_group."""
         grouped = defaultdict(list)
         
-        for operation in self._operations:
+        for operation_index, operation in enumerate(self._operations):
             if not hasattr(operation, 'operation_group'):
                 print(f"Warning: Invalid operation object found: {type(operation)}. Skipping.")
                 continue
@@ -426,7 +492,7 @@ class STIROperationsTableModel(QAbstractTableModel):
             if " (" in group_name:
                 group_name = group_name.split(" (")[0]
             
-            grouped[group_name].append(operation)
+            grouped[group_name].append((operation_index, operation))
         
         return dict(grouped)
     
@@ -518,6 +584,10 @@ class STIROperationsTableModel(QAbstractTableModel):
         
         return None
     
+    def _update_total_stir(self, operation: Operation, old_stir: float):
+        """Replace an edited operation's previous STIR value in the running total."""
+        self._total_stir += (operation.stir_value or 0) - old_stir
+    
     def _emit_signals(self):
         """Emit change signals."""
         total_stir = self.get_total_stir()
@@ -0,0 +1,207 @@
+"""
+Vectorized STIR Calculation Functions.
+Same formulas as Operation.calculate_stir / calculate_custom_machine_stir, applied to
+N operations (standard machines and flattened custom machine tools) at once with NumPy,
+plus a depth x speed sweep of a single machine.
+
+Results match the scalar path exactly, rounding included: tool STIRs are multiplied in
+the same operand order and summed tool by tool in the same order.
+
+Packing reads every Operation attribute in Python and costs more than the scalar path
+itself, so batching pays off when packed inputs are evaluated repeatedly or for sweeps,
+not for a single pass over a season.
+"""
+
+from dataclasses import dataclass
+from typing import List
+import numpy as np
+
+from .data.model_operation import Operation
+
+# Conversion factors used by the Operation model
+INCH_TO_CM = 2.54
+MPH_TO_KMH = 1.60934
+
+@dataclass
+class STIRBatchInputs:
+    """Operations packed into padded [N x tools] arrays, one tool slot per custom machine tool."""
+    depth_cm: np.ndarray               # [N x T] tool depths [cm]
+    surface_area_disturbed: np.ndarray # [N x T] surface area disturbed by each tool [%]
+    tillage_type_factor: np.ndarray    # [N x T]
+    rotates: np.ndarray                # [N x T] bool
+    active: np.ndarray                 # [N x T] bool, tool slots that contribute to the STIR
+    speed_kmh: np.ndarray              # [N] operation speeds [km/h]
+    field_tilled: np.ndarray           # [N] field tilled [%]
+    passes: np.ndarray                 # [N] number of passes
+
+@dataclass
+class BatchSTIRResult:
+    """Container for batch STIR calculation results"""
+    operation_stir: np.ndarray  # Per-operation STIR, rounded as Operation.stir_value
+    season_stir: float          # Sum of the operation STIRs, as Season.get_total_stir
+
+def _depth_to_cm(depth: float, depth_uom: str) -> float:
+    """Convert a depth to centimeters, as the Operation model does."""
+    return depth * INCH_TO_CM if depth_uom.lower() == 'inch' else depth
+
+def _speed_to_kmh(speed: float, speed_uom: str) -> float:
+    """Convert a speed to km/h, as the Operation model does."""
+    return speed * MPH_TO_KMH if speed_uom.lower() == 'mph' else speed
+
+def pack_operations(operations: List[Operation]) -> STIRBatchInputs:
+    """
+    Pack operations into padded arrays.
+
+    A standard machine fills one tool slot with the operation's own parameters; a custom
+    machine fills one slot per tool. Empty tools and custom tools at or above the surface
+    (depth <= 0) are inactive, as in calculate_custom_machine_stir.
+
+    Args:
+        operations: List of Operation objects
+
+    Returns:
+        STIRBatchInputs with one row per operation
+    """
+    width = max([1] + [len(op.custom_machine_tools) for op in operations if op.is_custom_machine()])
+
+    # Flat per-slot lists, reshaped to [N x width] once
+    depth_cm, surface, tillage, rotates, active = [], [], [], [], []
+    for op in operations:
+        if not op.is_custom_machine():
+            depth_cm.append(_depth_to_cm(op.depth, op.depth_uom))
+            surface.append(op.surface_area_disturbed)
+            tillage.append(op.tillage_type_factor)
+            rotates.append(op.machine_rotates)
+            active.append(True)
+            used = 1
+        else:
+            for tool in op.custom_machine_tools:
+                tool_depth_cm = _depth_to_cm(tool.depth, tool.depth_uom)
+                depth_cm.append(tool_depth_cm)
+                surface.append(tool.surface_area_disturbed)
+                tillage.append(tool.tillage_type_factor)
+                rotates.append(tool.rotates)
+                active.append(tool_depth_cm > 0 and not tool.is_empty())
+            used = len(op.custom_machine_tools)
+
+        padding = width - used
+        if padding:
+            for values, empty in ((depth_cm, 0.0), (surface, 0.0), (tillage, 0.0), (rotates, False), (active, False)):
+                values.extend([empty] * padding)
+
+    shape = (len(operations), width)
+    return STIRBatchInputs(
+        depth_cm=np.array(depth_cm, dtype=float).reshape(shape),
+        surface_area_disturbed=np.array(surface, dtype=float).reshape(shape),
+        tillage_type_factor=np.array(tillage, dtype=float).reshape(shape),
+        rotates=np.array(rotates, dtype=bool).reshape(shape),
+        active=np.array(active, dtype=bool).reshape(shape),
+        speed_kmh=np.array([_speed_to_kmh(op.speed, op.speed_uom) for op in operations], dtype=float),
+        field_tilled=np.array([op.field_tilled for op in operations], dtype=float),
+        passes=np.array([op.number_of_passes for op in operations], dtype=float),
+    )
+
+def calculate_tool_stir_batch(depth_cm, speed_kmh, surface_area_disturbed, tillage_type_factor,
+                              rotates, field_tilled) -> np.ndarray:
+    """
+    Calculate the STIR of single tools/machines, broadcasting the inputs against each other.
+
+    Args:
+        depth_cm: Working depths [cm]
+        speed_kmh: Operating speeds [km/h]
+        surface_area_disturbed: Surface area disturbed [%]
+        tillage_type_factor: Tillage intensity factors
+        rotates: Whether each tool has rotating/powered components
+        field_tilled: Field tilled [%]
+
+    Returns:
+        Unrounded STIR per tool, for a single pass
+    """
+    speed_kmh = np.asarray(speed_kmh, dtype=float)
+    surface_fraction = np.asarray(surface_area_disturbed, dtype=float) / 100.0
+    field_tilled_fraction = np.asarray(field_tilled, dtype=float) / 100.0
+
+    # Same operand order as Operation._calculate_single_tool_stir
+    speed_term = np.where(rotates, (11 - speed_kmh) * 0.5, speed_kmh * 0.5)
+    return ((np.asarray(tillage_type_factor, dtype=float) * 3.25) * speed_term * np.asarray(depth_cm, dtype=float)
+            * surface_fraction * field_tilled_fraction)
+
+def _sum_tools(tool_stir: np.ndarray, active: np.ndarray) -> np.ndarray:
+    """Sum the active tools over the last axis, one tool at a time like the scalar loop."""
+    total = np.zeros(tool_stir.shape[:-1])
+    for j in range(tool_stir.shape[-1]):
+        total = total + np.where(active[..., j], tool_stir[..., j], 0.0)
+    return total
+
+def calculate_operations_stir_batch(inputs: STIRBatchInputs) -> np.ndarray:
+    """
+    Calculate the STIR of N operations.
+
+    Returns:
+        [N] STIR per operation, rounded as Operation.stir_value
+    """
+    tool_stir = calculate_tool_stir_batch(inputs.depth_cm, inputs.speed_kmh[:, None], inputs.surface_area_disturbed,
+                                          inputs.tillage_type_factor, inputs.rotates, inputs.field_tilled[:, None])
+    return np.round(_sum_tools(tool_stir, inputs.active) * inputs.passes)
+
+def calculate_season_stir_batch(operations: List[Operation]) -> BatchSTIRResult:
+    """
+    Calculate per-operation and season STIR in one pass.
+
+    Returns:
+        BatchSTIRResult with the per-operation array and the season total
+    """
+    operation_stir = calculate_operations_stir_batch(pack_operations(operations))
+    return BatchSTIRResult(operation_stir=operation_stir, season_stir=float(operation_stir.sum()))
+
+def sweep_depth_speed(operation: Operation, depths, speeds, depth_uom: str = "cm",
+                      speed_uom: str = "km/h") -> np.ndarray:
+    """
+    Calculate the STIR of a machine over a grid of depths and speeds.
+
+    Each grid point equals setting the operation's depth (adjust_custom_machine_depth for
+    custom machines, which shifts every tool by the same amount) and speed, then calling
+    calculate_stir. The operation itself is not modified.
+
+    Args:
+        operation: Operation with the machine to sweep
+        depths: [D] depths, in depth_uom
+        speeds: [S] speeds, in speed_uom
+        depth_uom: Unit of the depths ("cm" or "inch")
+        speed_uom: Unit of the speeds ("km/h" or "mph")
+
+    Returns:
+        [D x S] STIR per depth and speed, rounded as Operation.stir_value
+    """
+    depths = np.asarray(depths, dtype=float)
+    speeds = np.asarray(speeds, dtype=float)
+    depth_cm = depths * INCH_TO_CM if depth_uom.lower() == 'inch' else depths
+    speed_kmh = speeds * MPH_TO_KMH if speed_uom.lower() == 'mph' else speeds
+
+    if not operation.is_custom_machine():
+        tool_stir = calculate_tool_stir_batch(depth_cm[:, None], speed_kmh[None, :], operation.surface_area_disturbed,
+                                              operation.tillage_type_factor, operation.machine_rotates,
+                                              operation.field_tilled)
+        return np.round(tool_stir * operation.number_of_passes)
+
+    # Custom machine: shift the tool depths as adjust_custom_machine_depth does, clamped at the surface
+    tools = [tool for tool in operation.custom_machine_tools if not tool.is_empty()]
+    if not tools:
+        return np.zeros((depths.size, speeds.size))
+    tool_depth_cm = np.array([_depth_to_cm(tool.depth, tool.depth_uom) for tool in tools])
+    tool_in_inch = np.array([tool.depth_uom.lower() == 'inch' for tool in tools])
+    depth_change_cm = depth_cm - _depth_to_cm(operation.depth, operation.depth_uom)
+    new_tool_depth_cm = np.maximum(0.0, tool_depth_cm[None, :] + depth_change_cm[:, None])  # [D x T]
+
+    # Inch tools store their depth back in inches, and calculate_stir converts it again
+    new_tool_depth_cm = np.where(tool_in_inch, new_tool_depth_cm / INCH_TO_CM * INCH_TO_CM, new_tool_depth_cm)
+
+    tool_stir = calculate_tool_stir_batch(
+        new_tool_depth_cm[:, None, :], speed_kmh[None, :, None],
+        np.array([tool.surface_area_disturbed for tool in tools]),
+        np.array([tool.tillage_type_factor for tool in tools]),
+        np.array([tool.rotates for tool in tools]),
+        operation.field_tilled,
+    )  # [D x S x T]
+    active = np.broadcast_to((new_tool_depth_cm > 0)[:, None, :], tool_stir.shape)
+    return np.round(_sum_tools(tool_stir, active) * operation.number_of_passes)
@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the LORENZO POZZI EIQ App.
+
+These scripts are not part of the application and are not bundled with it. Run them
+from the project root, e.g. 'python -m benchmarks.catalog_cache'.
+"""
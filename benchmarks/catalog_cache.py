@@ -0,0 +1,35 @@
+"""
+Cold (CSV) vs warm (snapshot) catalog load benchmark.
+
+Usage: python -m benchmarks.catalog_cache
+"""
+
+from typing import Dict, Tuple
+from data.catalog_cache import clear_catalog_cache, get_load_stats
+
+
+def compare_startup_timings() -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Measure cold (CSV) and warm (snapshot) catalog loads for products and active ingredients.
+
+    Returns:
+        Tuple of (cold_seconds, warm_seconds) dictionaries by catalog name
+    """
+    from data.repository_AI import AIRepository
+    from data.repository_product import ProductRepository
+
+    def load_all():
+        ProductRepository().get_all_products()
+        AIRepository().get_all_ingredients()
+        return {name: stats.seconds for name, stats in get_load_stats().items()}
+
+    clear_catalog_cache()
+    cold = load_all()
+    warm = load_all()
+    return cold, warm
+
+
+if __name__ == "__main__":
+    cold, warm = compare_startup_timings()
+    for name in cold:
+        print(f"{name}: cold {cold[name] * 1000:.1f} ms, warm {warm[name] * 1000:.1f} ms")
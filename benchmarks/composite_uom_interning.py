@@ -0,0 +1,77 @@
+"""
+CompositeUOM interning benchmark.
+
+Patches CompositeUOM at runtime to count allocations and to disable interning, then
+recalculates a synthetic season both ways.
+
+Usage: python -m benchmarks.composite_uom_interning
+"""
+
+import time
+from typing import Dict
+from common.calculations.layer_1_interface import eiq_calculator
+from common.calculations.layer_2_uom_std import EIQUOMStandardizer
+from data.repository_product import ProductRepository
+from data.repository_UOM import CompositeUOM, UOMRepository
+
+
+def benchmark_composite_uom_interning(applications: int = 200, repeat: int = 5) -> Dict:
+    """
+    Measure CompositeUOM allocations and time for a full season recalculation,
+    with interning and with a fresh parse for every CompositeUOM request.
+    
+    Args:
+        applications: Number of applications in the synthetic season
+        repeat: Number of recalculations of the season
+        
+    Returns:
+        Dict with allocation counts and seconds for both modes
+    """
+    products = [p for p in ProductRepository.get_instance().get_all_products()
+                if p.rate_uom and p.label_maximum_rate and p.get_ai_data()]
+    season = [products[i % len(products)] for i in range(applications)]
+    user_preferences = {'default_row_spacing': 34.0, 'default_row_spacing_unit': 'inch',
+                        'default_seeding_rate': 20, 'default_seeding_rate_unit': 'cwt/acre'}
+    
+    allocations = 0
+    original_init = CompositeUOM.__init__
+    original_intern = CompositeUOM.__dict__['intern']
+    
+    def counting_init(self, uom_string):
+        nonlocal allocations
+        allocations += 1
+        original_init(self, uom_string)
+    
+    def run(interned: bool) -> Dict:
+        nonlocal allocations
+        allocations = 0
+        CompositeUOM._interned.clear()
+        CompositeUOM.intern = original_intern if interned else classmethod(lambda cls, uom_string: cls(uom_string))
+        UOMRepository.get_instance().clear_conversion_cache()
+        EIQUOMStandardizer.clear_standardized_ai_cache()
+        
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for product in season:
+                eiq_calculator.calculate_product_field_eiq(
+                    product.get_ai_data(), product.label_maximum_rate, product.rate_uom, 1, user_preferences
+                )
+        return {"allocations": allocations, "seconds": time.perf_counter() - start}
+    
+    CompositeUOM.__init__ = counting_init
+    try:
+        uninterned = run(interned=False)
+        interned = run(interned=True)
+    finally:
+        CompositeUOM.__init__ = original_init
+        CompositeUOM.intern = original_intern
+    
+    return {"applications": applications, "repeat": repeat, "interned": interned, "uninterned": uninterned}
+
+
+if __name__ == "__main__":
+    results = benchmark_composite_uom_interning()
+    print(f"{results['applications']} applications x {results['repeat']} recalculations")
+    for mode in ("uninterned", "interned"):
+        print(f"{mode}: {results[mode]['allocations']} CompositeUOM allocations, "
+              f"{results[mode]['seconds'] * 1000:.1f} ms")
@@ -0,0 +1,69 @@
+"""
+Scalar vs vectorized (NumPy) EIQ engine benchmark on random standardized inputs.
+
+Usage: python -m benchmarks.eiq_batch_engine
+"""
+
+import time
+import numpy as np
+from common.calculations.layer_3_eiq_batch import MAX_BATCH_AIS, calculate_scenario_batch
+from common.calculations.layer_3_eiq_math import calculate_field_eiq_product, calculate_field_eiq_scenario
+
+
+def benchmark_batch_engine(count: int = 10000, seed: int = 0) -> dict:
+    """
+    Compare the scalar layer 3 functions with the batch engine on random standardized inputs.
+
+    Returns:
+        dict with scalar/batch timings and the largest relative difference
+    """
+    rng = np.random.default_rng(seed)
+    ai_counts = rng.integers(1, MAX_BATCH_AIS + 1, count)
+    rates = rng.uniform(0.05, 20.0, count)
+    concentrations = rng.uniform(0.01, 0.9, (count, MAX_BATCH_AIS))
+    eiqs = rng.uniform(5.0, 150.0, (count, MAX_BATCH_AIS))
+    areas = rng.uniform(0.5, 50.0, count)
+
+    # Blank the unused slots and make some applications invalid
+    unused = np.arange(MAX_BATCH_AIS)[None, :] >= ai_counts[:, None]
+    concentrations[unused] = 0.0
+    eiqs[unused] = 0.0
+    rates[rng.random(count) < 0.02] = 0.0
+    field_area = float(areas.sum())
+
+    start = time.perf_counter()
+    scalar_eiqs = []
+    for i in range(count):
+        standardized_ais = [
+            {'name': f"AI {j + 1}", 'concentration_per_unit': concentrations[i, j], 'eiq_per_kg': eiqs[i, j]}
+            for j in range(ai_counts[i])
+        ]
+        scalar_eiqs.append(calculate_field_eiq_product(standardized_ais, rates[i], 1).field_eiq_per_ha)
+    scalar_scenario = calculate_field_eiq_scenario(
+        [{'field_eiq': eiq, 'area': area} for eiq, area in zip(scalar_eiqs, areas)], field_area
+    ).field_eiq_per_ha
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = calculate_scenario_batch(rates, concentrations, eiqs, areas, field_area)
+    batch_seconds = time.perf_counter() - start
+
+    scalar_eiqs = np.array(scalar_eiqs)
+    max_relative_error = float(np.max(np.abs(result.field_eiq_per_ha - scalar_eiqs) / np.maximum(np.abs(scalar_eiqs), 1e-12)))
+    return {
+        'applications': count,
+        'scalar_seconds': scalar_seconds,
+        'batch_seconds': batch_seconds,
+        'max_relative_error': max_relative_error,
+        'scenario_difference': abs(result.scenario_eiq_per_ha - scalar_scenario),
+    }
+
+
+if __name__ == "__main__":
+    for size in (10000, 100000):
+        stats = benchmark_batch_engine(size)
+        print(f"{stats['applications']} applications: scalar {stats['scalar_seconds'] * 1000:.1f} ms, "
+              f"batch {stats['batch_seconds'] * 1000:.1f} ms "
+              f"({stats['scalar_seconds'] / stats['batch_seconds']:.0f}x), "
+              f"max rel error {stats['max_relative_error']:.1e}, "
+              f"scenario diff {stats['scenario_difference']:.1e}")
@@ -0,0 +1,89 @@
+"""
+Season EIQ recalculation timing: synchronous against the background
+EIQCalculationService, with the longest event loop stall of each. No display is needed.
+
+Usage: python -m benchmarks.eiq_calculation_service --applications 1000
+"""
+
+import time
+from typing import List
+from PySide6.QtCore import QCoreApplication, QElapsedTimer, QEventLoop, QTimer
+from data.model_application import Application
+from data.repository_product import ProductRepository
+from season_planner_page.models.eiq_calculation_service import EIQCalculationService, calculate_scenario_eiq
+
+
+def _synthetic_season(applications: int) -> List[Application]:
+    """A season cycling through catalog products that have label rates and AI data."""
+    products = [p for p in ProductRepository.get_instance().get_filtered_products()
+                if p.rate_uom and p.label_maximum_rate and p.get_ai_data()]
+    return [Application(product_type=product.product_type, product_name=product.product_name,
+                        rate=float(product.label_maximum_rate), rate_uom=product.rate_uom, area=10.0,
+                        application_method=product.application_method)
+            for product in (products[i % len(products)] for i in range(applications))]
+
+
+def benchmark_service(applications: int = 1000, tick_ms: int = 5) -> dict:
+    """
+    Compare a synchronous season recalculation with one through the service.
+
+    A timer ticking every tick_ms stands in for the GUI: the longest gap between its
+    ticks is how long the event loop was blocked. Needs a QCoreApplication.
+
+    Returns:
+        dict with the synchronous time, the service's round trip and the longest event
+        loop stall of each mode, in seconds
+    """
+    season = _synthetic_season(applications)
+    service = EIQCalculationService.get_instance()
+    calculate_scenario_eiq(season[:10], 10.0, "acre")  # Warm the conversion caches
+
+    start = time.perf_counter()
+    calculate_scenario_eiq(season, 10.0, "acre")
+    sync_seconds = time.perf_counter() - start
+
+    loop = QEventLoop()
+    clock = QElapsedTimer()
+    longest_stall = 0
+    results = []
+
+    def tick():
+        nonlocal longest_stall
+        longest_stall = max(longest_stall, clock.restart())
+
+    timer = QTimer()
+    timer.setInterval(tick_ms)
+    timer.timeout.connect(tick)
+    service.scenario_calculated.connect(lambda key, result: (results.append(result), loop.quit()))
+
+    clock.start()
+    timer.start()
+    start = time.perf_counter()
+    service.request_scenario("benchmark", season, 10.0, "acre")
+    loop.exec()
+    async_seconds = time.perf_counter() - start
+    timer.stop()
+
+    return {
+        'applications': applications,
+        'sync_seconds': sync_seconds,
+        'async_seconds': async_seconds,
+        'worker_seconds': results[0].seconds,
+        'async_stall_seconds': max(longest_stall - tick_ms, 0) / 1000,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Time a season EIQ recalculation with and without the worker thread.")
+    parser.add_argument("-n", "--applications", type=int, default=1000, help="applications in the synthetic season")
+    args = parser.parse_args()
+
+    app = QCoreApplication([])
+    stats = benchmark_service(args.applications)
+    print(f"Season of {stats['applications']} applications")
+    print(f"  synchronous:     {stats['sync_seconds'] * 1000:7.1f} ms with the event loop blocked throughout")
+    print(f"  service:         {stats['async_seconds'] * 1000:7.1f} ms until delivered "
+          f"({stats['worker_seconds'] * 1000:.1f} ms on the worker)")
+    print(f"  longest stall:   {stats['async_stall_seconds'] * 1000:7.1f} ms")
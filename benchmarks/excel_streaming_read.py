@@ -0,0 +1,75 @@
+"""
+Excel import read benchmark: fully loaded workbooks (the previous import path) against
+the parser's streaming read-only read.
+
+Usage: python -m benchmarks.excel_streaming_read [files...]  (default: test_data/x*.xlsx)
+"""
+
+import os, time, tracemalloc
+from openpyxl import load_workbook
+from season_planner_page.import_export.excel_parser import ExcelScenarioParser
+
+
+def benchmark_streaming_read(file_paths):
+    """
+    Compare reading workbooks fully loaded (the previous import path) with the streaming read.
+
+    Each file is timed over a few runs; peak Python memory is measured in a separate
+    run with tracemalloc, which slows the read down.
+
+    Args:
+        file_paths: Excel files to read
+
+    Returns:
+        List of dicts per file: rows read, full/streaming seconds and peak bytes
+    """
+    parser = ExcelScenarioParser()
+
+    def read_full(path):
+        worksheet = load_workbook(path, data_only=True).active
+        return [[cell if cell is not None else '' for cell in row] for row in worksheet.iter_rows(values_only=True)]
+
+    def read_streaming(path):
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            return parser._read_worksheet(workbook.active)[1]
+        finally:
+            workbook.close()
+
+    def measure(read, path, runs=3):
+        start = time.perf_counter()
+        for _ in range(runs):
+            rows = read(path)
+        seconds = (time.perf_counter() - start) / runs
+
+        tracemalloc.start()
+        read(path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return len(rows), seconds, peak
+
+    results = []
+    for path in file_paths:
+        full_rows, full_seconds, full_peak = measure(read_full, path)
+        streaming_rows, streaming_seconds, streaming_peak = measure(read_streaming, path)
+        results.append({
+            'file': os.path.basename(path),
+            'full_rows': full_rows,
+            'streaming_rows': streaming_rows,
+            'full_seconds': full_seconds,
+            'streaming_seconds': streaming_seconds,
+            'full_peak_bytes': full_peak,
+            'streaming_peak_bytes': streaming_peak,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    import glob, sys
+
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join("test_data", "x*.xlsx")))
+    print(f"{'file':<20} {'rows':>11} {'full ms':>9} {'stream ms':>9} {'full KiB':>9} {'stream KiB':>10}")
+    for stats in benchmark_streaming_read(paths):
+        print(f"{stats['file']:<20} {stats['full_rows']:>5}/{stats['streaming_rows']:<5} "
+              f"{stats['full_seconds'] * 1000:9.1f} {stats['streaming_seconds'] * 1000:9.1f} "
+              f"{stats['full_peak_bytes'] / 1024:9.0f} {stats['streaming_peak_bytes'] / 1024:10.0f}")
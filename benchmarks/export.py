@@ -0,0 +1,60 @@
+"""
+Excel export timing: time and peak traced memory of exporting many scenarios into one
+workbook with ExcelScenarioExporter.write_workbook.
+
+Usage: python -m benchmarks.export test_data --scenarios 300 --repeat 10
+"""
+
+import copy, os, tempfile, time, tracemalloc
+from season_planner_page.import_export.batch_calculator import find_workbooks
+from season_planner_page.import_export.excel_parser import ExcelScenarioParser
+from season_planner_page.import_export.exporter import ExcelScenarioExporter
+
+
+def benchmark_export(scenario_count: int = 300, repeat: int = 1, directory: str = "test_data") -> dict:
+    """
+    Export many scenarios into one workbook.
+
+    The scenarios cycle through the workbooks of a directory; each one's applications
+    are repeated to make larger seasons.
+
+    Returns:
+        dict with the scenario and application counts, seconds and peak traced memory (bytes)
+    """
+    parser = ExcelScenarioParser()
+    templates = [scenario for scenario, _ in map(parser.parse_file, find_workbooks(directory)) if scenario]
+    scenarios = [copy.deepcopy(templates[i % len(templates)]) for i in range(scenario_count)]
+    for scenario in scenarios:
+        scenario.applications = scenario.applications * repeat
+
+    with tempfile.TemporaryDirectory(prefix="eiq_export_") as temp_dir:
+        tracemalloc.start()
+        start = time.perf_counter()
+        ExcelScenarioExporter().write_workbook(scenarios, os.path.join(temp_dir, "export.xlsx"))
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'scenarios': len(scenarios),
+        'applications': sum(len(scenario.applications) for scenario in scenarios),
+        'seconds': seconds,
+        'peak_bytes': peak,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    from PySide6.QtWidgets import QApplication
+
+    parser = argparse.ArgumentParser(description="Time exporting many scenarios into one Excel workbook.")
+    parser.add_argument("directory", nargs="?", default="test_data", help="workbooks the scenarios are copied from")
+    parser.add_argument("-n", "--scenarios", type=int, default=300, help="number of scenarios to export")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="repeat each scenario's applications this many times")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication([])
+    stats = benchmark_export(args.scenarios, args.repeat, args.directory)
+    print(f"{stats['scenarios']} scenarios, {stats['applications']} applications: "
+          f"{stats['seconds']:.2f} s, peak {stats['peak_bytes'] / 2**20:.1f} MiB")
@@ -0,0 +1,54 @@
+"""
+Parallel Excel import timing: parses a directory of workbooks through ScenarioImportJob
+and reports the time per file. No display is needed.
+
+Usage: python -m benchmarks.multi_import test_data --workers 4
+"""
+
+import os, time
+from typing import List
+from PySide6.QtCore import QCoreApplication, QEventLoop
+from season_planner_page.import_export.batch_calculator import find_workbooks
+from season_planner_page.import_export.multi_import import FileImportResult, ScenarioImportJob
+
+
+def import_directory(directory: str, workers: int = None) -> List[FileImportResult]:
+    """
+    Parse every workbook in a directory through ScenarioImportJob, blocking until done.
+
+    Needs a QCoreApplication (or QApplication) to deliver the job's signals.
+
+    Args:
+        directory: Directory containing the Excel files
+        workers: Number of processes (default: CPU count)
+
+    Returns:
+        List of FileImportResult in file name order
+    """
+    job = ScenarioImportJob(find_workbooks(directory), workers)
+    results = []
+    loop = QEventLoop()
+    job.finished.connect(lambda job_results: (results.extend(job_results), loop.quit()))
+    job.start()
+    if job.is_running:
+        loop.exec()
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    app = QCoreApplication([])
+    parser = argparse.ArgumentParser(description="Parse a directory of Excel files in parallel and report timings.")
+    parser.add_argument("directory", help="directory containing the Excel files")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = import_directory(args.directory, args.workers)
+    elapsed = time.perf_counter() - start
+    for result in results:
+        status = f"{len(result.scenario.applications)} applications" if result.ok else "failed"
+        print(f"  {os.path.basename(result.file):<24} {status:<18} {len(result.unmatched_products)} unmatched  "
+              f"{result.seconds * 1000:6.0f} ms")
+    print(f"{len(results)} files in {elapsed:.2f} s")
@@ -0,0 +1,103 @@
+"""
+Product name matcher benchmark: throughput and match quality of ProductNameMatcher
+against the substring and word-overlap scan it replaced, on misspelled product names
+from a directory of workbooks.
+
+Usage: python -m benchmarks.product_matcher test_data
+"""
+
+import time
+from typing import List
+from data.repository_product import ProductRepository
+from season_planner_page.import_export.batch_calculator import find_workbooks
+from season_planner_page.import_export.excel_parser import ExcelScenarioParser
+from season_planner_page.import_export.product_matcher import ProductNameMatcher
+
+
+def legacy_find_similar_product(excel_name: str, available_products: List):
+    """The substring-then-word-overlap scan the matcher replaced."""
+    excel_lower = excel_name.lower()
+    for product in available_products:
+        db_lower = product.product_name.lower()
+        if excel_lower in db_lower or db_lower in excel_lower:
+            return product
+
+    excel_words = set(excel_lower.split())
+    best_match, best_score = None, 0
+    for product in available_products:
+        overlap = len(excel_words.intersection(set(product.product_name.lower().split())))
+        if overlap > best_score and overlap >= 2:
+            best_score, best_match = overlap, product
+    return best_match
+
+
+def _misspellings(name: str) -> List[str]:
+    """Deterministic variants of a product name as they appear in grower files."""
+    variants = [name.lower(), name.replace(" ", "") if " " in name else name + " 4L"]
+    if len(name) > 4:
+        middle = len(name) // 2
+        variants.append(name[:middle] + name[middle + 1:])                                # dropped letter
+        variants.append(name[:middle - 1] + name[middle] + name[middle - 1] + name[middle + 1:])  # swapped letters
+    return variants
+
+
+def benchmark_matcher(directory: str = "test_data") -> dict:
+    """
+    Measure matching throughput and quality on the product names of a directory of workbooks.
+
+    Each product name found in the workbooks is misspelled a few ways; a suggestion is
+    correct when it has the original name.
+
+    Returns:
+        dict with names, misspellings, build time, throughput and accuracy of the
+        matcher and of the legacy scan
+    """
+    products = ProductRepository.get_instance().get_filtered_products()
+    parser = ExcelScenarioParser()
+
+    names = set()
+    for path in find_workbooks(directory):
+        _, preview_info = parser.parse_file(path)
+        if preview_info:
+            names.update(product.product_name for product in preview_info['product_validation']['product_mapping'].values()
+                         if product is not None)
+    queries = [(variant, name.lower()) for name in sorted(names) for variant in _misspellings(name)]
+
+    start = time.perf_counter()
+    matcher = ProductNameMatcher(products)
+    build_seconds = time.perf_counter() - start
+
+    def run(find):
+        start = time.perf_counter()
+        found = [find(variant) for variant, _ in queries]
+        seconds = time.perf_counter() - start
+        correct = sum(1 for product, (_, expected) in zip(found, queries)
+                      if product is not None and product.product_name.lower() == expected)
+        return seconds, correct
+
+    matcher_seconds, matcher_correct = run(matcher.find_best)
+    legacy_seconds, legacy_correct = run(lambda variant: legacy_find_similar_product(variant, products))
+
+    return {
+        'products': len(products),
+        'names': len(names),
+        'queries': len(queries),
+        'build_seconds': build_seconds,
+        'matcher_per_second': len(queries) / matcher_seconds,
+        'matcher_accuracy': matcher_correct / len(queries),
+        'legacy_per_second': len(queries) / legacy_seconds,
+        'legacy_accuracy': legacy_correct / len(queries),
+    }
+
+
+if __name__ == "__main__":
+    import os, sys
+    from PySide6.QtWidgets import QApplication
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication([])
+    stats = benchmark_matcher(sys.argv[1] if len(sys.argv) > 1 else "test_data")
+    print(f"{stats['names']} workbook product names, {stats['queries']} misspelled queries, "
+          f"{stats['products']} catalog products (index built in {stats['build_seconds'] * 1000:.1f} ms)")
+    print(f"  matcher: {stats['matcher_per_second']:,.0f} names/s, {stats['matcher_accuracy']:.0%} correct")
+    print(f"  legacy:  {stats['legacy_per_second']:,.0f} names/s, {stats['legacy_accuracy']:.0%} correct")
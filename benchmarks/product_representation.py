@@ -0,0 +1,76 @@
+"""
+Slotted Product vs __dict__-based object benchmark.
+
+Usage: python -m benchmarks.product_representation
+"""
+
+import time, tracemalloc
+from types import SimpleNamespace
+from data.model_product import Product
+from data.repository_product import ProductRepository
+
+
+def benchmark_product_representation(repeat=100):
+    """
+    Compare the slotted Product with an equivalent __dict__-based object.
+    
+    Measures the memory held by the whole catalog and the time to read
+    display_name/number_of_ai for every product, as the products table does.
+    
+    Args:
+        repeat (int): Number of passes over the catalog for the access benchmark
+        
+    Returns:
+        dict: Memory in bytes and access time in seconds for both representations
+    """
+    rows = [product.to_dict() for product in ProductRepository.get_instance().get_all_products()]
+    for row in rows:
+        row["regulator number"] = row.pop("reg. #")
+        row["application method"] = row.pop("use")
+    fields = [slot for slot in Product.__slots__ if not slot.startswith("_")]
+    
+    def legacy_display_name(product):
+        # Previous behaviour: rebuild the AI list through getattr on every call
+        names = [getattr(product, f"ai{idx}") for idx in range(1, 5) if getattr(product, f"ai{idx}")]
+        return f"{product.product_name} ({', '.join(names)})" if names else product.product_name
+    
+    def legacy_number_of_ai(product):
+        return sum(1 for idx in range(1, 5) if getattr(product, f"ai{idx}", None))
+    
+    tracemalloc.start()
+    slotted = [Product.from_dict(row) for row in rows]
+    slotted_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    legacy = [SimpleNamespace(**{field: getattr(product, field) for field in fields}) for product in slotted]
+    legacy_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for product in slotted:
+            product.display_name, product.number_of_ai
+    slotted_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for product in legacy:
+            legacy_display_name(product), legacy_number_of_ai(product)
+    legacy_seconds = time.perf_counter() - start
+    
+    return {
+        "products": len(slotted),
+        "slotted_bytes": slotted_bytes,
+        "legacy_bytes": legacy_bytes,
+        "slotted_seconds": slotted_seconds,
+        "legacy_seconds": legacy_seconds,
+    }
+
+
+if __name__ == "__main__":
+    results = benchmark_product_representation()
+    print(f"{results['products']} products")
+    print(f"Memory: slotted {results['slotted_bytes'] / 1024:.0f} KiB, dict-based {results['legacy_bytes'] / 1024:.0f} KiB")
+    print(f"display_name + number_of_ai: slotted {results['slotted_seconds'] * 1000:.1f} ms, "
+          f"dict-based {results['legacy_seconds'] * 1000:.1f} ms")
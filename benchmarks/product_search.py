@@ -0,0 +1,108 @@
+"""
+Ranked product search benchmark: per-keystroke latency of the search index against a
+linear scan, and the time to build the import dialog's product mapping table.
+
+Usage: python -m benchmarks.product_search
+"""
+
+from time import perf_counter
+from common.widgets.product_selection import ProductSearchIndex, get_product_display_name
+from data.repository_product import ProductRepository
+
+
+def benchmark_product_search(products=None, repeat: int = 20) -> dict:
+    """
+    Time ranked product search per keystroke, index against a linear scan.
+
+    Every prefix of a set of product names (and of substrings of them) is searched, as
+    when the names are typed one character at a time.
+
+    Args:
+        products: Products to search (default: the full product catalog)
+        repeat: Number of times each keystroke is searched
+
+    Returns:
+        dict with build time, mean/max index latency, mean scan latency and mismatches
+    """
+    if products is None:
+        products = ProductRepository.get_instance().get_all_products()
+
+    def linear_scan(search_term):
+        """Reference ranking: the per-keystroke scan the index replaces."""
+        exact_matches, starts_with_matches, contains_matches = [], [], []
+        for product in products:
+            product_name_lower = product.product_name.lower()
+            display_name = get_product_display_name(product)
+            if product_name_lower == search_term:
+                exact_matches.append(display_name)
+            elif product_name_lower.startswith(search_term):
+                starts_with_matches.append(display_name)
+            elif search_term in product_name_lower:
+                contains_matches.append(display_name)
+        return sorted(exact_matches) + sorted(starts_with_matches) + sorted(contains_matches)
+
+    start = perf_counter()
+    index = ProductSearchIndex(products)
+    build_seconds = perf_counter() - start
+
+    typed = sorted({product.product_name.lower() for product in products})[::max(1, len(products) // 50)]
+    typed += [name[len(name) // 2:] for name in typed]
+    terms = [name[:length] for name in typed for length in range(1, len(name) + 1)]
+
+    index_latencies, scan_seconds, mismatches = [], 0.0, 0
+    for term in terms:
+        start = perf_counter()
+        for _ in range(repeat):
+            results = index.search(term)
+        index_latencies.append((perf_counter() - start) / repeat)
+
+        start = perf_counter()
+        expected = linear_scan(term)
+        scan_seconds += perf_counter() - start
+        mismatches += results != expected
+
+    return {
+        'products': len(products),
+        'keystrokes': len(terms),
+        'build_seconds': build_seconds,
+        'index_mean_seconds': sum(index_latencies) / len(terms),
+        'index_max_seconds': max(index_latencies),
+        'scan_mean_seconds': scan_seconds / len(terms),
+        'mismatches': mismatches,
+    }
+
+
+def benchmark_mapping_widget(unmatched: int = 100) -> dict:
+    """
+    Time building the import dialog's product mapping table, one search field per unmatched name.
+
+    Args:
+        unmatched: Number of unmatched product names in the table
+
+    Returns:
+        dict with the number of rows and the build time
+    """
+    from season_planner_page.import_export.import_dialog import ProductMappingWidget
+
+    products = ProductRepository.get_instance().get_filtered_products()
+    names = [f"Unmatched product {index}" for index in range(unmatched)]
+    start = perf_counter()
+    widget = ProductMappingWidget(names, products)
+    seconds = perf_counter() - start
+    widget.deleteLater()
+    return {'rows': unmatched, 'seconds': seconds}
+
+
+if __name__ == "__main__":
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication([])
+    stats = benchmark_product_search()
+    print(f"{stats['products']} products, {stats['keystrokes']} keystrokes, "
+          f"index built in {stats['build_seconds'] * 1000:.1f} ms")
+    print(f"  index: mean {stats['index_mean_seconds'] * 1e6:.0f} us, max {stats['index_max_seconds'] * 1e6:.0f} us")
+    print(f"  scan:  mean {stats['scan_mean_seconds'] * 1e6:.0f} us")
+    print(f"  mismatches: {stats['mismatches']}")
+
+    stats = benchmark_mapping_widget()
+    print(f"Product mapping table with {stats['rows']} rows built in {stats['seconds'] * 1000:.0f} ms")
@@ -0,0 +1,102 @@
+"""
+Scalar vs vectorized (NumPy) STIR engine benchmark on random operations, plus a depth x
+speed grid against sweep_depth_speed.
+
+Usage: python -m benchmarks.stir_batch_engine
+"""
+
+import time
+import numpy as np
+from STIR.data.model_custom_machine import CustomMachineTool
+from STIR.data.model_operation import Operation
+from STIR.stir_batch import calculate_operations_stir_batch, pack_operations, sweep_depth_speed
+
+
+def benchmark_batch_engine(count: int = 10000, seed: int = 0) -> dict:
+    """
+    Compare Operation.calculate_stir with the batch engine on random operations, and a
+    scalar depth x speed grid with sweep_depth_speed.
+
+    Packing reads every Operation attribute in Python, so it costs about as much as the
+    scalar path; the gain comes from evaluating packed inputs and sweeps.
+
+    Returns:
+        dict with timings and the number of STIR values that differ from the scalar path
+    """
+    def random_tillage_factor():
+        return float(rng.choice([1.0, 0.8, 0.7, 0.4, 0.15]))
+
+    rng = np.random.default_rng(seed)
+    operations = []
+    for _ in range(count):
+        operation = Operation(
+            depth=float(rng.uniform(0, 12)), depth_uom=str(rng.choice(['cm', 'inch'])),
+            speed=float(rng.uniform(2, 12)), speed_uom=str(rng.choice(['km/h', 'mph'])),
+            surface_area_disturbed=float(rng.uniform(10, 100)), number_of_passes=int(rng.integers(1, 4)),
+            tillage_type_factor=random_tillage_factor(), machine_rotates=bool(rng.random() < 0.3),
+            field_tilled=float(rng.uniform(20, 100)),
+        )
+        if rng.random() < 0.3:
+            operation.custom_machine_tools = [
+                CustomMachineTool(name=f"tool {j + 1}" if rng.random() < 0.9 else "", rotates=bool(rng.random() < 0.3),
+                                  depth=float(rng.uniform(-2, 25)), depth_uom=str(rng.choice(['cm', 'inch'])),
+                                  surface_area_disturbed=float(rng.uniform(10, 100)),
+                                  tillage_type_factor=random_tillage_factor())
+                for j in range(int(rng.integers(1, 5)))
+            ]
+        operations.append(operation)
+
+    start = time.perf_counter()
+    scalar_stir = np.array([operation.calculate_stir() for operation in operations], dtype=float)
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    inputs = pack_operations(operations)
+    pack_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_stir = calculate_operations_stir_batch(inputs)
+    batch_seconds = time.perf_counter() - start
+
+    # Depth x speed grid of a custom machine, point by point vs one sweep
+    machine = next(operation for operation in operations if operation.is_custom_machine())
+    depths, speeds = np.linspace(0, 30, 100), np.linspace(2, 15, 100)
+    start = time.perf_counter()
+    scalar_grid = []
+    for depth in depths:
+        for speed in speeds:
+            point = machine.clone()
+            point.custom_machine_tools = [tool.copy() for tool in machine.custom_machine_tools]
+            point.adjust_custom_machine_depth(float(depth), "cm")
+            point.speed, point.speed_uom = float(speed), "km/h"
+            scalar_grid.append(point.calculate_stir())
+    scalar_sweep_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    grid = sweep_depth_speed(machine, depths, speeds)
+    sweep_seconds = time.perf_counter() - start
+
+    return {
+        'operations': count,
+        'scalar_seconds': scalar_seconds,
+        'pack_seconds': pack_seconds,
+        'batch_seconds': batch_seconds,
+        'mismatches': int(np.count_nonzero(batch_stir != scalar_stir)),
+        'sweep_points': grid.size,
+        'scalar_sweep_seconds': scalar_sweep_seconds,
+        'sweep_seconds': sweep_seconds,
+        'sweep_mismatches': int(np.count_nonzero(grid.ravel() != np.array(scalar_grid, dtype=float))),
+    }
+
+
+if __name__ == "__main__":
+    for size in (10000, 100000):
+        stats = benchmark_batch_engine(size)
+        end_to_end_seconds = stats['pack_seconds'] + stats['batch_seconds']
+        print(f"{stats['operations']} operations: scalar {stats['scalar_seconds'] * 1000:.1f} ms, "
+              f"pack {stats['pack_seconds'] * 1000:.1f} ms + batch {stats['batch_seconds'] * 1000:.1f} ms, "
+              f"{stats['mismatches']} mismatches")
+        print(f"  scalar / (pack + batch): {stats['scalar_seconds'] / end_to_end_seconds:.2f}x end to end, "
+              f"scalar / batch: {stats['scalar_seconds'] / stats['batch_seconds']:.0f}x evaluation only (inputs already packed)")
+        print(f"  {stats['sweep_points']}-point sweep: scalar {stats['scalar_sweep_seconds'] * 1000:.1f} ms, "
+              f"batch {stats['sweep_seconds'] * 1000:.2f} ms, {stats['sweep_mismatches']} mismatches")
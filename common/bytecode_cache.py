@@ -0,0 +1,187 @@
+"""
+Bytecode Cache for the LORENZO POZZI EIQ App.
+
+Compiled bytecode is kept across runs in the per-user cache directory (via
+sys.pycache_prefix, and PYTHONPYCACHEPREFIX for worker processes), so only modules
+that changed are recompiled at startup. The whole app is precompiled in the
+background on the first run, which also covers modules that are only imported later
+(e.g. when a page is first opened); a marker file in the cache records that it ran.
+
+This module only imports the standard library, so it can be imported before the
+prefix is set without compiling any other app module into the app tree.
+
+Maintenance and diagnostics (opt-in, from the app directory):
+    python -m common.bytecode_cache --report       # cold vs warm import time
+    python -m common.bytecode_cache --precompile   # compile everything now
+    python -m common.bytecode_cache --clear        # delete all cached bytecode
+"""
+
+import compileall, hashlib, os, re, shutil, subprocess, sys, tempfile, threading
+from typing import Dict, List, Tuple
+
+# Application root (the directory containing main.py)
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Directories that are not part of the app and must not be compiled
+_EXCLUDED_DIRS = re.compile(r"[\\/](\.git|__pycache__|benchmarks|build|dist|update_products)([\\/]|$)")
+
+# Module imported to measure startup import time
+_STARTUP_MODULE = "main_page.window_main"
+
+
+def get_bytecode_dir() -> str:
+    """Get the per-user directory where compiled bytecode is kept."""
+    # Same location as common.utils.get_cache_dir("bytecode"), which cannot be imported yet
+    bytecode_dir = os.path.join(os.path.expanduser("~"), ".project", "cache", "bytecode")
+    os.makedirs(bytecode_dir, exist_ok=True)
+    return bytecode_dir
+
+
+def _precompiled_marker(root_dir: str = APP_ROOT) -> str:
+    """Get the marker file recording that an app tree was precompiled by this Python version."""
+    tree_id = hashlib.sha1(os.path.abspath(root_dir).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(get_bytecode_dir(), f"precompiled-{sys.implementation.cache_tag}-{tree_id}")
+
+
+def configure_bytecode_cache(precompile: bool = True) -> None:
+    """
+    Redirect bytecode writes to the user cache directory and warm it on the first run.
+
+    Must run before the application modules are imported, from the main process only.
+    Worker processes inherit the cache directory through PYTHONPYCACHEPREFIX. Does
+    nothing in the frozen (PyInstaller) build, which ships its own bytecode.
+
+    Args:
+        precompile: Compile all app modules in a background thread if not done yet
+    """
+    if getattr(sys, 'frozen', False):
+        return
+
+    try:
+        sys.pycache_prefix = get_bytecode_dir()
+    except OSError:
+        return  # No writable cache directory - keep Python's default behaviour
+    os.environ["PYTHONPYCACHEPREFIX"] = sys.pycache_prefix
+
+    if precompile and not os.path.exists(_precompiled_marker()):
+        threading.Thread(target=precompile_app, name="bytecode-precompile", daemon=True).start()
+
+
+def precompile_app(root_dir: str = APP_ROOT) -> bool:
+    """
+    Compile all app modules into the bytecode cache; up-to-date modules are skipped.
+
+    Writes the first-run marker afterwards, even if some module failed to compile (it
+    would fail again on every run).
+
+    Returns:
+        bool: True if every module compiled
+    """
+    try:
+        compiled = bool(compileall.compile_dir(root_dir, quiet=2, rx=_EXCLUDED_DIRS))
+        with open(_precompiled_marker(root_dir), 'w', encoding='utf-8'):
+            pass
+        return compiled
+    except Exception:
+        return False
+
+
+def clear_bytecode_cache(root_dir: str = APP_ROOT) -> int:
+    """
+    Delete the user bytecode cache and any __pycache__ directories left in the app tree.
+
+    Returns:
+        int: Number of directories removed
+    """
+    removed = 0
+    cache_dirs = [get_bytecode_dir()]
+    for dirpath, dirnames, _ in os.walk(root_dir):
+        if "__pycache__" in dirnames:
+            cache_dirs.append(os.path.join(dirpath, "__pycache__"))
+            dirnames.remove("__pycache__")
+
+    for cache_path in cache_dirs:
+        try:
+            shutil.rmtree(cache_path)
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def _time_startup_import(cache_dir: str, write_bytecode: bool) -> Tuple[float, Dict[str, float]]:
+    """
+    Import the startup modules in a fresh interpreter using the given bytecode directory.
+
+    Returns:
+        Tuple of (total seconds, own import seconds by top-level app package)
+    """
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=cache_dir, QT_QPA_PLATFORM="offscreen")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    command = [sys.executable, "-X", "importtime"] + ([] if write_bytecode else ["-B"])
+    result = subprocess.run(command + ["-c", f"import {_STARTUP_MODULE}"],
+                            cwd=APP_ROOT, env=env, capture_output=True, text=True)
+
+    app_packages = {name for name in os.listdir(APP_ROOT) if os.path.isdir(os.path.join(APP_ROOT, name))}
+    total, by_package = 0.0, {}
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)", line)
+        if not match:
+            continue
+        own, cumulative, module = int(match.group(1)) / 1e6, int(match.group(2)) / 1e6, match.group(4)
+        if not match.group(3):
+            total += cumulative  # Top-level imports include everything below them
+        package = module.split(".")[0]
+        if package in app_packages:
+            by_package[package] = by_package.get(package, 0.0) + own
+    return total, by_package
+
+
+def startup_import_report(runs: int = 3) -> List[str]:
+    """
+    Compare startup import time without bytecode (cold) and with a warm bytecode cache.
+
+    Args:
+        runs: Number of imports to average for each case
+
+    Returns:
+        List of report lines
+    """
+    with tempfile.TemporaryDirectory(prefix="eiq_bytecode_") as warm_dir, \
+         tempfile.TemporaryDirectory(prefix="eiq_bytecode_") as cold_dir:
+        cold = [_time_startup_import(cold_dir, write_bytecode=False) for _ in range(runs)]
+        _time_startup_import(warm_dir, write_bytecode=True)  # Populate the warm cache
+        warm = [_time_startup_import(warm_dir, write_bytecode=True) for _ in range(runs)]
+
+    cold_total = sum(total for total, _ in cold) / runs
+    warm_total = sum(total for total, _ in warm) / runs
+    lines = [
+        f"Startup import of {_STARTUP_MODULE} (average of {runs} runs)",
+        f"  cold (no bytecode): {cold_total * 1000:.0f} ms",
+        f"  warm (cached):      {warm_total * 1000:.0f} ms",
+        f"  gain:               {(cold_total - warm_total) * 1000:.0f} ms",
+    ]
+    for package in sorted(cold[0][1], key=lambda name: -cold[0][1][name]):
+        cold_ms = sum(packages.get(package, 0.0) for _, packages in cold) / runs * 1000
+        warm_ms = sum(packages.get(package, 0.0) for _, packages in warm) / runs * 1000
+        lines.append(f"    {package:<24} {cold_ms:7.0f} ms -> {warm_ms:7.0f} ms")
+    return lines
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the app's compiled bytecode cache.")
+    parser.add_argument("--report", action="store_true", help="compare cold and warm startup import time")
+    parser.add_argument("--precompile", action="store_true", help="compile all app modules into the cache")
+    parser.add_argument("--clear", action="store_true", help="delete all cached bytecode")
+    args = parser.parse_args()
+
+    if args.clear:
+        print(f"Removed {clear_bytecode_cache()} bytecode directories")
+    if args.precompile:
+        sys.pycache_prefix = get_bytecode_dir()
+        print("Precompiled" if precompile_app() else "Precompiled with errors", "into", get_bytecode_dir())
+    if args.report:
+        print("\n".join(startup_import_report()))
@@ -4,4 +4,5 @@ EIQ Calculations Package for the LORENZO POZZI EIQ App.
 This package provides a clean two-layer architecture for EIQ calculations:
 - Layer 1: UOM standardization and validation
 - Layer 2: Pure mathematical calculations
+- Layer 2 (batch): Vectorized NumPy calculations for large scenarios
 """
\ No newline at end of file
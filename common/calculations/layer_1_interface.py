@@ -38,25 +38,16 @@ class EIQCalculator:
             Total Field EIQ [eiq/ha]
         """
         try:
-            # Determine product name for header
-            product_name = "Product Calculation"
-            if active_ingredients and len(active_ingredients) > 0:
-                first_ai = active_ingredients[0].get('name', 'Unknown')
-                if len(active_ingredients) == 1:
-                    product_name = f"Product with {first_ai}"
-                else:
-                    product_name = f"Product with {first_ai} + {len(active_ingredients)-1} others"
-            
-            # Start structured logging
-            # calculation_tracer.log_header(f"EIQ CALCULATION FOR {product_name}")
+            tracing = calculation_tracer.enabled
             
             # Step 1: Product Information
-            calculation_tracer.log_step("Product Information")
-            calculation_tracer.log_ai_list(active_ingredients)
-            calculation_tracer.log_application_info(application_rate, application_rate_uom, applications)
-            
-            # Step 2: Unit Standardization
-            calculation_tracer.log_step("Unit Standardization")
+            if tracing:
+                calculation_tracer.log_step("Product Information")
+                calculation_tracer.log_ai_list(active_ingredients)
+                calculation_tracer.log_application_info(application_rate, application_rate_uom, applications)
+                
+                # Step 2: Unit Standardization
+                calculation_tracer.log_step("Unit Standardization")
             calculation_tracer.set_suppress_redundant(True)
             standardized = self.standardizer.standardize_product_inputs(
                 active_ingredients=active_ingredients,
@@ -68,7 +59,8 @@ class EIQCalculator:
             calculation_tracer.set_suppress_redundant(False)
             
             # Step 3: Field EIQ Calculation
-            calculation_tracer.log_step("Field EIQ Calculation")
+            if tracing:
+                calculation_tracer.log_step("Field EIQ Calculation")
             
             result = calculate_field_eiq_product(
                 standardized_ais=standardized.active_ingredients,
@@ -76,8 +68,9 @@ class EIQCalculator:
                 applications=standardized.applications
             )
 
-            calculation_tracer.log_result("TOTAL FIELD EIQ", f"{result.field_eiq_per_ha:.1f}", "eiq/ha")
-            calculation_tracer.calculation_complete()
+            if tracing:
+                calculation_tracer.log_result("TOTAL FIELD EIQ", f"{result.field_eiq_per_ha:.1f}", "eiq/ha")
+                calculation_tracer.calculation_complete()
             return result.field_eiq_per_ha
             
         except Exception as e:
@@ -103,7 +96,8 @@ class EIQCalculator:
             Area-weighted scenario Field EIQ [eiq/ha]
         """
         try:
-            calculation_tracer.log_header(f"AREA-WEIGHTED SCENARIO EIQ CALCULATION ({len(applications)} applications)")
+            if calculation_tracer.enabled:
+                calculation_tracer.log_header(f"AREA-WEIGHTED SCENARIO EIQ CALCULATION ({len(applications)} applications)")
             
             # Step 1: Standardize all areas to hectares
             standardized_apps, field_area_ha = self.standardizer.standardize_scenario_areas(
@@ -113,7 +107,8 @@ class EIQCalculator:
             application_data = []
             
             for i, app in enumerate(standardized_apps):
-                calculation_tracer.log_step(f"Application {i+1}")
+                if calculation_tracer.enabled:
+                    calculation_tracer.log_step(f"Application {i+1}")
                 
                 # Extract application data
                 product = app.get('product')
@@ -144,21 +139,73 @@ class EIQCalculator:
                     'area': app_area_ha
                 })
                 
-                calculation_tracer.log_result(f"Application {i+1} EIQ", f"{app_eiq:.1f}", "eiq/ha", level=1)
-                calculation_tracer.log_result(f"Application {i+1} Area (standardized)", f"{app_area_ha:.4f}", "ha", level=1)
-                calculation_tracer.add_blank_line()
+                if calculation_tracer.enabled:
+                    calculation_tracer.log_result(f"Application {i+1} EIQ", f"{app_eiq:.1f}", "eiq/ha", level=1)
+                    calculation_tracer.log_result(f"Application {i+1} Area (standardized)", f"{app_area_ha:.4f}", "ha", level=1)
+                    calculation_tracer.add_blank_line()
             
             # Calculate area-weighted scenario EIQ
             scenario_result = calculate_field_eiq_scenario(application_data, field_area_ha)
-            calculation_tracer.log_result("Field Area (standardized)", f"{field_area_ha:.4f}", "ha")
-            calculation_tracer.log_result("Area-Weighted Scenario EIQ", f"{scenario_result.field_eiq_per_ha:.1f}", "eiq/ha")
-            calculation_tracer.calculation_complete()
+            if calculation_tracer.enabled:
+                calculation_tracer.log_result("Field Area (standardized)", f"{field_area_ha:.4f}", "ha")
+                calculation_tracer.log_result("Area-Weighted Scenario EIQ", f"{scenario_result.field_eiq_per_ha:.1f}", "eiq/ha")
+                calculation_tracer.calculation_complete()
             return scenario_result.field_eiq_per_ha
             
         except Exception as e:
             calculation_tracer.log(f"Error calculating scenario Field EIQ: {e}")
             calculation_tracer.calculation_complete()
             return 0.0
+    
+    def calculate_scenario_field_eiq_batch(self,
+                                         applications: List[Dict],
+                                         field_area: float,
+                                         field_area_uom: str = "acre",
+                                         user_preferences: dict = None):
+        """
+        Vectorized equivalent of calculate_scenario_field_eiq for large scenarios.
+        
+        Inputs are standardized per application as usual, then all Field EIQs and the
+        area-weighted total are computed in a single NumPy pass. Only standardization
+        errors are traced.
+        
+        Returns:
+            BatchEIQResult with per-application Field EIQs [eiq/ha], the scenario EIQ [eiq/ha]
+            and the indexes of the applications that failed (counted as 0)
+        """
+        from .layer_3_eiq_batch import pack_standardized_products, calculate_scenario_batch
+        
+        standardized_apps, field_area_ha = self.standardizer.standardize_scenario_areas(
+            applications, field_area, field_area_uom, user_preferences
+        )
+        
+        products = []
+        failed_applications = []
+        for i, app in enumerate(standardized_apps):
+            product = app.get('product')
+            active_ingredients = product.get_ai_data() if hasattr(product, 'get_ai_data') else []
+            standardized = None
+            if active_ingredients:
+                try:
+                    standardized = self.standardizer.standardize_product_inputs(
+                        active_ingredients=active_ingredients,
+                        application_rate=app.get('rate', 0),
+                        application_rate_uom=app.get('rate_uom', ''),
+                        applications=1,
+                        user_preferences=user_preferences
+                    )
+                except Exception as e:
+                    # Counted as 0, like calculate_product_field_eiq
+                    failed_applications.append(i)
+                    if calculation_tracer.enabled:
+                        calculation_tracer.log(f"Error calculating Field EIQ of application {i+1}: {e}")
+            products.append(standardized)
+        
+        rates, concentrations, eiqs = pack_standardized_products(products)
+        areas = [app.get('area', 0) for app in standardized_apps]
+        result = calculate_scenario_batch(rates, concentrations, eiqs, areas, field_area_ha)
+        result.failed_applications = failed_applications
+        return result
 
 # Create singleton instance for global use
 eiq_calculator = EIQCalculator()
\ No newline at end of file
@@ -3,7 +3,7 @@ UOM Standardization (Layer 2) for EIQ Calculations
 Handles all unit conversions and dimensional analysis validation
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from common.widgets.tracer import calculation_tracer
 from data.repository_UOM import UOMRepository, CompositeUOM
@@ -31,10 +31,19 @@ class EIQUOMStandardizer:
     Ensures dimensional analysis is correct before passing to calculation layer.
     """
     
+    # Standardized AI vectors shared by all instances, keyed by the product's AI data and rate unit type.
+    # A product's AI concentrations never change between calls, so only the rate needs converting.
+    _standardized_ai_cache: Dict[Tuple, Tuple[Dict, ...]] = {}
+    
     def __init__(self):
         # Initialize UOM repository
         self.uom_repo = UOMRepository.get_instance()
     
+    @classmethod
+    def clear_standardized_ai_cache(cls):
+        """Drop all memoized standardized AI vectors (e.g. after the product catalog reloads)."""
+        cls._standardized_ai_cache.clear()
+    
     def standardize_single_ai_inputs(self, 
                                    ai_eiq: float,
                                    ai_concentration: float, 
@@ -65,7 +74,8 @@ class EIQUOMStandardizer:
                 
         # Step 1: Handle application rate - use pre-standardized if available
         if pre_standardized_rate is not None and pre_standardized_rate_type is not None:
-            calculation_tracer.log_substep(f"Using pre-standardized rate: {pre_standardized_rate} {'kg/ha' if pre_standardized_rate_type == 'weight' else 'l/ha'}", level=3)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Using pre-standardized rate: {pre_standardized_rate} {'kg/ha' if pre_standardized_rate_type == 'weight' else 'l/ha'}", level=3)
             rate_per_ha = pre_standardized_rate
             rate_unit_type = pre_standardized_rate_type
         else:
@@ -124,7 +134,18 @@ class EIQUOMStandardizer:
             application_rate, application_rate_uom, user_preferences
         )
         
-        # Step 2: Standardize all active ingredients using the pre-standardized rate
+        # Step 2: Standardize all active ingredients, reusing the memoized vectors for this product
+        cache_key = self._standardized_ai_cache_key(active_ingredients, rate_unit_type)
+        cached_ais = self._standardized_ai_cache.get(cache_key) if cache_key is not None else None
+        if cached_ais is not None:
+            calculation_tracer.log_substep("Using cached standardized AI concentrations and EIQs", level=3)
+            return ProductStandardizedInputs(
+                rate_per_ha=rate_per_ha,
+                rate_unit_type=rate_unit_type,
+                active_ingredients=list(cached_ais),
+                applications=applications
+            )
+        
         standardized_ais = []
         for i, ai in enumerate(active_ingredients):
             
@@ -153,9 +174,13 @@ class EIQUOMStandardizer:
                 standardized_ais.append(ai_data)
                 
             except Exception as e:
-                calculation_tracer.log_substep(f"Error standardizing {ai.get('name', 'unknown')}: {e}", level=4)
+                if calculation_tracer.enabled:
+                    calculation_tracer.log_substep(f"Error standardizing {ai.get('name', 'unknown')}: {e}", level=4)
                 continue
         
+        if cache_key is not None:
+            self._standardized_ai_cache[cache_key] = tuple(standardized_ais)
+        
         result = ProductStandardizedInputs(
             rate_per_ha=rate_per_ha,
             rate_unit_type=rate_unit_type,
@@ -164,6 +189,24 @@ class EIQUOMStandardizer:
         )
         return result
     
+    @staticmethod
+    def _standardized_ai_cache_key(active_ingredients: List[Dict], rate_unit_type: str) -> Optional[Tuple]:
+        """
+        Build the memoization key identifying a product's AI data for a rate unit type.
+        
+        Returns:
+            Hashable key, or None if the AI data cannot be used as a key
+        """
+        try:
+            key = (rate_unit_type,) + tuple(
+                (ai.get('name'), ai.get('eiq'), ai.get('concentration'), ai.get('uom')) if ai else None
+                for ai in active_ingredients
+            )
+            hash(key)
+            return key
+        except (AttributeError, TypeError):
+            return None
+    
     def _standardize_application_rate(self, 
                                     rate: float, 
                                     rate_uom: str, 
@@ -178,18 +221,18 @@ class EIQUOMStandardizer:
         if not rate or not rate_uom:
             raise ValueError("Application rate and UOM are required")
         
-        from_uom = CompositeUOM(rate_uom) # Parse the UOM into numerator / denominator
+        from_uom = CompositeUOM.intern(rate_uom) # Parsed UOM, shared across calculations
         
         # Determine target unit (kg or l) based on numerator type
-        numerator_unit = self.uom_repo.get_base_unit(from_uom.numerator)
-        if not numerator_unit:
+        numerator_category = from_uom.numerator_category
+        if not numerator_category:
             raise ValueError(f"Unknown unit in rate: {from_uom.numerator}")
                 
-        if numerator_unit.category == 'weight':
-            target_uom = CompositeUOM("kg/ha")
+        if numerator_category == 'weight':
+            target_uom = CompositeUOM.intern("kg/ha")
             unit_type = "weight"
-        elif numerator_unit.category == 'volume':
-            target_uom = CompositeUOM("l/ha") 
+        elif numerator_category == 'volume':
+            target_uom = CompositeUOM.intern("l/ha") 
             unit_type = "volume"
         else:
             raise ValueError(f"Application rate must be weight/area or volume/area, got: {rate_uom}")
@@ -198,10 +241,11 @@ class EIQUOMStandardizer:
         standardized_rate = self.uom_repo.convert_composite_uom(
             rate, from_uom, target_uom, user_preferences
         )
-        calculation_tracer.log_conversion_simple(
-            "Application rate", rate, rate_uom, 
-            f"{standardized_rate:.1f}", target_uom.original_string
-        )
+        if calculation_tracer.enabled:
+            calculation_tracer.log_conversion_simple(
+                "Application rate", rate, rate_uom, 
+                f"{standardized_rate:.1f}", target_uom.original_string
+            )
         
         return standardized_rate, unit_type
     
@@ -217,7 +261,8 @@ class EIQUOMStandardizer:
         Returns:
             Standardized concentration as [kg/kg] or [kg/l]
         """
-        calculation_tracer.log_substep(f"Standardizing AI concentration: {concentration} {concentration_uom} ({target_rate_type} based)", level=4)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Standardizing AI concentration: {concentration} {concentration_uom} ({target_rate_type} based)", level=4)
         
         if not concentration or not concentration_uom:
             raise ValueError("AI concentration and UOM are required")
@@ -225,16 +270,17 @@ class EIQUOMStandardizer:
         # Handle percentage - works with both weight and volume (THIS MAY CREATE CALCULATION ERRORS WHEN LABEL % IS VOLUME/VOLUME)
         if concentration_uom == '%':
             result = concentration / 100.0  # Convert to decimal [kg/kg]
-            calculation_tracer.log_substep(f"Converting percentage: {concentration}% = {result} (decimal)", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Converting percentage: {concentration}% = {result} (decimal)", level=5)
             return result
         
-        from_uom = CompositeUOM(concentration_uom) # Parse the UOM into numerator / denominator
+        from_uom = CompositeUOM.intern(concentration_uom) # Parsed UOM, shared across calculations
         
         # Determine target concentration UOM based on rate type
         if target_rate_type == "weight":
-            target_uom = CompositeUOM("kg/kg")  # [kg AI / kg product]
+            target_uom = CompositeUOM.intern("kg/kg")  # [kg AI / kg product]
         elif target_rate_type == "volume":
-            target_uom = CompositeUOM("kg/l")   # [kg AI / l product]
+            target_uom = CompositeUOM.intern("kg/l")   # [kg AI / l product]
         else:
             raise ValueError(f"Invalid rate type: {target_rate_type}")
         
@@ -254,7 +300,8 @@ class EIQUOMStandardizer:
             if from_is_weight_per_weight and target_rate_type == "volume":
                 # Could convert kg/kg to kg/l, but would need product density - not implemented yet
                 # For now, assume similar density to water (1 kg/l)
-                calculation_tracer.log_substep(f"Converting concentration from {concentration_uom} to kg/l assuming density ~1 kg/l", level=5)
+                if calculation_tracer.enabled:
+                    calculation_tracer.log_substep(f"Converting concentration from {concentration_uom} to kg/l assuming density ~1 kg/l", level=5)
                 pass
         
         # Convert concentration
@@ -262,13 +309,15 @@ class EIQUOMStandardizer:
             standardized_concentration = self.uom_repo.convert_composite_uom(
                 concentration, from_uom, target_uom
             )
-            calculation_tracer.log_conversion_simple(
-                "AI concentration", concentration, concentration_uom,
-                f"{standardized_concentration:.4f}", target_uom.original_string
-            )
+            if calculation_tracer.enabled:
+                calculation_tracer.log_conversion_simple(
+                    "AI concentration", concentration, concentration_uom,
+                    f"{standardized_concentration:.4f}", target_uom.original_string
+                )
             return standardized_concentration
         except Exception as e:
-            calculation_tracer.log_substep(f"Conversion failed with error: {e}", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Conversion failed with error: {e}", level=5)
             raise ValueError(
                 f"Cannot convert concentration from {concentration_uom} to {target_uom.original_string}: {e}"
             )
@@ -292,10 +341,11 @@ class EIQUOMStandardizer:
         # Cornell EIQ is per pound, convert to per kg
         conversion_factor = self.uom_repo.convert_base_unit(1,'lb','kg')
         result = ai_eiq / conversion_factor
-        calculation_tracer.log_conversion_simple(
-            "AI EIQ", f"{ai_eiq:.2f}", "eiq/lb",
-            f"{result:.2f}", "eiq/kg"
-        )
+        if calculation_tracer.enabled:
+            calculation_tracer.log_conversion_simple(
+                "AI EIQ", f"{ai_eiq:.2f}", "eiq/lb",
+                f"{result:.2f}", "eiq/kg"
+            )
         return result
     
     def _validate_dimensional_analysis(self, rate_unit_type: str, ai_concentration: float):
@@ -306,19 +356,22 @@ class EIQUOMStandardizer:
         - Weight rate: [kg/ha] x [kg/kg] x [eiq/kg] = [eiq/ha]
         - Volume rate: [l/ha]  x [kg/l]  x [eiq/kg] = [eiq/ha]
         """
-        calculation_tracer.log_substep(f"Validating dimensional analysis for rate type '{rate_unit_type}' with concentration {ai_concentration}", level=4)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Validating dimensional analysis for rate type '{rate_unit_type}' with concentration {ai_concentration}", level=4)
         
         if rate_unit_type not in ["weight", "volume"]:
             raise ValueError(f"Invalid rate unit type: {rate_unit_type}")
         
         if ai_concentration <= 0:
-            calculation_tracer.log_substep(f"AI concentration {ai_concentration} must be positive", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"AI concentration {ai_concentration} must be positive", level=5)
             raise ValueError("AI concentration must be positive")
         
         # Additional validations could go here
         # For example, checking reasonable ranges for concentrations
         if rate_unit_type == "weight" and ai_concentration > 1.0:
-            calculation_tracer.log_substep(f"Weight-based concentration {ai_concentration} cannot exceed 1.0 (100%)", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Weight-based concentration {ai_concentration} cannot exceed 1.0 (100%)", level=5)
             raise ValueError("Layer2._validate_dimensional_analysis: Weight-based concentration cannot exceed 1.0 (100%)")
         
         calculation_tracer.log_substep("Validating physical state compatibility... passed", level=5)
@@ -330,11 +383,9 @@ class EIQUOMStandardizer:
             calculation_tracer.log_substep("UOM is not a concentration, returning False", level=5)
             return False
         
-        num_unit = self.uom_repo.get_base_unit(uom.numerator)
-        den_unit = self.uom_repo.get_base_unit(uom.denominator)
-        
-        is_weight_per_volume = (num_unit and den_unit and num_unit.category == 'weight' and den_unit.category == 'volume')
-        calculation_tracer.log_substep(f"{uom.original_string} is weight/volume? {is_weight_per_volume}", level=5)
+        is_weight_per_volume = (uom.numerator_category == 'weight' and uom.denominator_category == 'volume')
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"{uom.original_string} is weight/volume? {is_weight_per_volume}", level=5)
         return is_weight_per_volume
     
     def _is_weight_per_weight(self, uom: CompositeUOM) -> bool:
@@ -347,11 +398,9 @@ class EIQUOMStandardizer:
         if not uom.is_concentration:
             return False
         
-        num_unit = self.uom_repo.get_base_unit(uom.numerator)
-        den_unit = self.uom_repo.get_base_unit(uom.denominator)
-        
-        is_weight_per_weight = (num_unit and den_unit and num_unit.category == 'weight' and den_unit.category == 'weight')
-        calculation_tracer.log_substep(f"{uom.original_string} is weight/weight? {is_weight_per_weight}", level=5)
+        is_weight_per_weight = (uom.numerator_category == 'weight' and uom.denominator_category == 'weight')
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"{uom.original_string} is weight/weight? {is_weight_per_weight}", level=5)
         return is_weight_per_weight
 
     def standardize_scenario_areas(self, applications: List[Dict], field_area: float, 
@@ -378,13 +427,16 @@ class EIQUOMStandardizer:
         # Convert field area to hectares
         if field_area_uom.lower() == "ha" or field_area_uom.lower() == "hectare":
             field_area_ha = field_area
-            calculation_tracer.log_substep(f"Field area already in hectares: {field_area:.4f} ha", level=1)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Field area already in hectares: {field_area:.4f} ha", level=1)
         else:
             try:
                 field_area_ha = self.uom_repo.convert_base_unit(field_area, field_area_uom, "ha")
-                calculation_tracer.log_substep(f"Field area: {field_area:.4f} {field_area_uom} → {field_area_ha:.4f} ha", level=1)
+                if calculation_tracer.enabled:
+                    calculation_tracer.log_substep(f"Field area: {field_area:.4f} {field_area_uom} → {field_area_ha:.4f} ha", level=1)
             except Exception as e:
-                calculation_tracer.log_substep(f"Error converting field area: {e}. Using original value.", level=1)
+                if calculation_tracer.enabled:
+                    calculation_tracer.log_substep(f"Error converting field area: {e}. Using original value.", level=1)
                 field_area_ha = field_area
         
         # Convert application areas to hectares
@@ -398,9 +450,11 @@ class EIQUOMStandardizer:
             else:
                 try:
                     standardized_area = self.uom_repo.convert_base_unit(original_area, field_area_uom, "ha")
-                    calculation_tracer.log_substep(f"Application {i+1} area: {original_area:.4f} {field_area_uom} → {standardized_area:.4f} ha", level=2)
+                    if calculation_tracer.enabled:
+                        calculation_tracer.log_substep(f"Application {i+1} area: {original_area:.4f} {field_area_uom} → {standardized_area:.4f} ha", level=2)
                 except Exception as e:
-                    calculation_tracer.log_substep(f"Error converting application {i+1} area: {e}. Using original value.", level=2)
+                    if calculation_tracer.enabled:
+                        calculation_tracer.log_substep(f"Error converting application {i+1} area: {e}. Using original value.", level=2)
                     standardized_area = original_area
             
             app_copy['area'] = round(standardized_area, 4)  # 4 decimal precision
@@ -0,0 +1,116 @@
+"""
+Vectorized EIQ Calculation Functions (Layer 3, batch variant).
+Same formulas as layer_3_eiq_math, applied to N applications at once with NumPy.
+Only accepts standardized inputs - see EIQCalculator.calculate_scenario_field_eiq_batch
+for the entry point that standardizes application dicts first. That method imports
+this module when first called, so NumPy loads only once a batch calculation runs.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+import numpy as np
+
+# AI slots per application; products with more AIs widen the matrices as needed
+MAX_BATCH_AIS = 4
+
+@dataclass
+class BatchEIQResult:
+    """Container for batch EIQ calculation results"""
+    field_eiq_per_ha: np.ndarray   # Per-application Field EIQ [eiq/ha]
+    scenario_eiq_per_ha: float     # Area-weighted scenario Field EIQ [eiq/ha]
+    failed_applications: List[int] = field(default_factory=list)  # Applications that could not be standardized (EIQ 0)
+
+def pack_standardized_products(products: List, width: int = MAX_BATCH_AIS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pack standardized product inputs into padded arrays.
+
+    Args:
+        products: List of ProductStandardizedInputs (None for applications without a product)
+        width: Minimum number of AI columns
+
+    Returns:
+        Tuple of (rates_per_ha [N], concentrations [N x width], eiqs [N x width]).
+        Unused AI slots are zero, which contributes nothing to the Field EIQ.
+    """
+    width = max([width] + [len(p.active_ingredients) for p in products if p is not None])
+    rates = np.zeros(len(products))
+    concentrations = np.zeros((len(products), width))
+    eiqs = np.zeros((len(products), width))
+
+    for i, product in enumerate(products):
+        if product is None:
+            continue
+        rates[i] = product.rate_per_ha
+        for j, ai in enumerate(product.active_ingredients):
+            concentrations[i, j] = ai['concentration_per_unit']
+            eiqs[i, j] = ai['eiq_per_kg']
+
+    return rates, concentrations, eiqs
+
+def calculate_field_eiq_batch(rates_per_ha: np.ndarray,
+                              concentrations: np.ndarray,
+                              eiqs: np.ndarray,
+                              applications=1) -> np.ndarray:
+    """
+    Calculate Field EIQ for N products with up to `width` active ingredients each.
+
+    Args:
+        rates_per_ha: [N] rates in [kg product/ha] or [l product/ha]
+        concentrations: [N x width] AI concentrations in [kg AI/kg product] or [kg AI/l product]
+        eiqs: [N x width] AI EIQs in [eiq/kg AI]
+        applications: Number of applications, scalar or [N]
+
+    Returns:
+        [N] Field EIQ per hectare [eiq/ha]
+    """
+    rates = np.asarray(rates_per_ha, dtype=float)
+    concentrations = np.asarray(concentrations, dtype=float)
+    eiqs = np.asarray(eiqs, dtype=float)
+    applications = np.broadcast_to(np.asarray(applications, dtype=float), rates.shape)
+
+    # Same guards as calculate_field_eiq_single_ai: any non-positive input zeroes that AI
+    valid = (concentrations > 0) & (eiqs > 0) & (rates > 0)[:, None] & (applications > 0)[:, None]
+
+    # Same operand order as the scalar path: rate x concentration x eiq x applications
+    per_ai = rates[:, None] * concentrations * eiqs * applications[:, None]
+    return np.where(valid, per_ai, 0.0).sum(axis=1)
+
+def calculate_field_eiq_scenario_batch(field_eiqs: np.ndarray, areas_ha: np.ndarray, field_area_ha: float) -> float:
+    """
+    Calculate area-weighted Field EIQ for a scenario from per-application results.
+
+    Args:
+        field_eiqs: [N] Field EIQ per application [eiq/ha]
+        areas_ha: [N] application areas [ha]
+        field_area_ha: Total field area [ha]
+
+    Returns:
+        Area-weighted scenario Field EIQ [eiq/ha]
+    """
+    field_eiqs = np.asarray(field_eiqs, dtype=float)
+    areas_ha = np.asarray(areas_ha, dtype=float)
+    if field_eiqs.size == 0 or field_area_ha <= 0:
+        return 0.0
+
+    # Skip applications with invalid data, as calculate_field_eiq_scenario does
+    valid = (field_eiqs >= 0) & (areas_ha >= 0)
+    total_eiq_units = np.where(valid, field_eiqs * areas_ha, 0.0).sum()
+    return float(total_eiq_units / field_area_ha)
+
+def calculate_scenario_batch(rates_per_ha: np.ndarray,
+                             concentrations: np.ndarray,
+                             eiqs: np.ndarray,
+                             areas_ha: np.ndarray,
+                             field_area_ha: float,
+                             applications=1) -> BatchEIQResult:
+    """
+    Calculate per-application and area-weighted scenario Field EIQ in one pass.
+
+    Returns:
+        BatchEIQResult with the per-application array and the scenario total
+    """
+    field_eiqs = calculate_field_eiq_batch(rates_per_ha, concentrations, eiqs, applications)
+    return BatchEIQResult(
+        field_eiq_per_ha=field_eiqs,
+        scenario_eiq_per_ha=calculate_field_eiq_scenario_batch(field_eiqs, areas_ha, field_area_ha)
+    )
@@ -75,10 +75,11 @@ def calculate_field_eiq_product(standardized_ais: List[Dict],
             applications=applications
         )
         
-        calculation_tracer.log_calculation_formula(
-            ai['name'], f"{rate_per_ha:.1f}", f"{ai['concentration_per_unit']:.4f}",
-            f"{ai['eiq_per_kg']:.1f}", applications, f"{ai_field_eiq:.1f}"
-        )
+        if calculation_tracer.enabled:
+            calculation_tracer.log_calculation_formula(
+                ai['name'], f"{rate_per_ha:.1f}", f"{ai['concentration_per_unit']:.4f}",
+                f"{ai['eiq_per_kg']:.1f}", applications, f"{ai_field_eiq:.1f}"
+            )
         
         total_field_eiq += ai_field_eiq
         breakdown[ai.get('name', 'Unknown')] = ai_field_eiq
@@ -132,7 +133,7 @@ def calculate_field_eiq_scenario(application_data: List[Dict], field_area: float
     weighted_scenario_eiq = total_eiq_units / field_area if field_area > 0 else 0.0
     
     # Log area-weighted calculation if multiple applications
-    if len(valid_applications) > 1:
+    if len(valid_applications) > 1 and calculation_tracer.enabled:
         calculation_tracer.log_step("Area-Weighted Scenario Total")
         for app in valid_applications:
             calculation_tracer.log_substep(
@@ -0,0 +1,153 @@
+"""
+Thumbnail Cache for the LORENZO POZZI EIQ App.
+
+Machine pictures are multi-megapixel files shown as small cards. This module decodes
+them on worker threads straight to thumbnail size (QImageReader.setScaledSize), keeps
+the thumbnails in QPixmapCache for the rest of the session and as PNG files in the
+per-user cache directory for the next launches. Thumbnails are keyed by the picture's
+path, modification time and size plus the thumbnail size, so a replaced picture is
+decoded again.
+
+Callers show a placeholder and get the pixmap through a callback on the GUI thread;
+pictures already in QPixmapCache are delivered immediately.
+"""
+
+import hashlib, os
+from typing import Callable, Dict, List, Optional, Tuple
+from PySide6.QtCore import QObject, QSize, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+from shiboken6 import isValid
+from common.utils import get_cache_dir
+
+# Worker threads decoding pictures in parallel
+THUMBNAIL_THREADS = 2
+
+
+def _thumbnail_key(path: str, width: int, height: int) -> Optional[str]:
+    """Get the cache key of a picture's thumbnail, or None if the picture does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    source = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{width}x{height}"
+    return "thumbnail:" + hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+def _read_thumbnail(path: str, width: int, height: int, cache_path: Optional[str]) -> QImage:
+    """
+    Read a thumbnail from the disk cache, or decode the picture at thumbnail size.
+
+    Runs on a worker thread, so it only uses QImage. Returns a null image if the picture
+    cannot be read.
+    """
+    if cache_path and os.path.exists(cache_path):
+        image = QImage(cache_path)
+        if not image.isNull():
+            return image
+
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid():
+        # Same fit as QPixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        reader.setScaledSize(size.scaled(QSize(width, height), Qt.KeepAspectRatio))
+        reader.setQuality(100)  # Smooth scaling in the JPEG decoder
+    image = reader.read()
+    if image.isNull() or not cache_path:
+        return image
+
+    # Write next to the final file and rename, so a concurrent reader never sees half a PNG
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        if image.save(temp_path, "PNG"):
+            os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+    finally:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    return image
+
+
+class ThumbnailLoader(QObject):
+    """
+    Singleton loading picture thumbnails on worker threads.
+
+    Requests for a thumbnail that is already loading share the same decode.
+    """
+
+    _thumbnail_ready = Signal(str, QImage)  # (cache key, thumbnail or null image)
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Get the singleton instance."""
+        if cls._instance is None:
+            cls._instance = ThumbnailLoader()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        """Initialize the loader."""
+        super().__init__(parent)
+        self._waiting: Dict[str, List[Tuple[QObject, Callable]]] = {}  # Key -> (owner, callback) of each request
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(THUMBNAIL_THREADS)
+        self._thumbnail_ready.connect(self._deliver_thumbnail)
+
+    def request(self, owner: QObject, path: str, width: int, height: int,
+                callback: Callable[[Optional[QPixmap]], None]) -> None:
+        """
+        Load a picture scaled to fit width x height, keeping its aspect ratio.
+
+        Args:
+            owner: Widget the thumbnail is for; the callback is skipped if it was deleted meanwhile
+            path: Picture file path
+            width, height: Box the thumbnail must fit in
+            callback: Called on the GUI thread with the pixmap, or None if the picture
+                      does not exist or cannot be read; called immediately when cached
+        """
+        key = _thumbnail_key(path, width, height)
+        if key is None:
+            callback(None)
+            return
+
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            callback(pixmap)
+            return
+
+        if key in self._waiting:
+            self._waiting[key].append((owner, callback))
+            return
+        self._waiting[key] = [(owner, callback)]
+
+        try:
+            cache_path = os.path.join(get_cache_dir("thumbnails"), key.split(":", 1)[1] + ".png")
+        except OSError:
+            cache_path = None  # No writable cache directory - decode every session
+
+        def load():
+            self._thumbnail_ready.emit(key, _read_thumbnail(path, width, height, cache_path))
+
+        self._pool.start(load)
+
+    def _deliver_thumbnail(self, key: str, image: QImage):
+        """Convert a loaded thumbnail to a pixmap and hand it to the widgets still waiting for it."""
+        pixmap = None
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(key, pixmap)
+
+        for owner, callback in self._waiting.pop(key, []):
+            if isValid(owner):
+                callback(pixmap)
+
+
+def load_thumbnail(owner: QObject, path: str, width: int, height: int,
+                   callback: Callable[[Optional[QPixmap]], None]) -> None:
+    """Load a picture thumbnail through the shared ThumbnailLoader (see ThumbnailLoader.request)."""
+    ThumbnailLoader.get_instance().request(owner, path, width, height, callback)
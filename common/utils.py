@@ -4,9 +4,8 @@ Utility functions for the Lorenzo Pozzi EIQ App.
 This module handles mostly application configuration, plus resources paths generation.
 """
 
-import json, os, sys
-from pathlib import Path
-from PySide6.QtCore import QObject, QEvent
+import atexit, copy, json, os, sys, threading, time
+from PySide6.QtCore import QCoreApplication, QObject, QEvent, QThread, Signal
 from PySide6.QtWidgets import QMessageBox
 from common.constants import (ADVANCED, EIQ_EXTREME_COLOR, EIQ_HIGH_COLOR, EIQ_HIGH_THRESHOLD, 
                               EIQ_LOW_COLOR, EIQ_MEDIUM_COLOR, ENGAGED, LEADING, ONBOARDING, 
@@ -25,14 +24,31 @@ DEFAULT_CONFIG = {
 }
 
 
+class PreferencesSignals(QObject):
+    """Change notifications of the preferences manager."""
+
+    preference_changed = Signal(str, str, object)  # (section, key, new value)
+    section_changed = Signal(str, object)          # (section, copy of the new section data)
+
+
 class PreferencesManager:
     """
     Centralized preferences manager that handles safe section-based updates.
     
     This prevents different parts of the application from overwriting each other's
     preferences when saving to the JSON file.
+    
+    The configuration is read from disk once and then served from memory. The file's
+    modification time is checked at most every MTIME_CHECK_INTERVAL seconds, so edits
+    made outside the app are still picked up (unless there are unsaved changes, which
+    win). Changes are announced through signals.preference_changed/section_changed,
+    and auto-saved changes are written by a background saver that coalesces bursts of
+    updates into a single write.
     """
     
+    MTIME_CHECK_INTERVAL = 1.0  # Seconds between checks of the config file's modification time
+    SAVE_DELAY = 0.5            # Seconds an auto-save waits for further changes before writing
+    
     _instance = None
     
     def __new__(cls):
@@ -46,41 +62,75 @@ class PreferencesManager:
         """Initialize the preferences manager."""
         if self._initialized:
             return
+        self.signals = PreferencesSignals()
         self._config_cache = None
         self._cache_dirty = False  # Track if cache has unsaved changes
+        self._revision = 0         # Incremented by every change, to tell if a save is still current
+        self._config_path = None   # Resolved once (the frozen app probes for a writable directory)
+        self._disk_mtime = None    # Modification time of the file the cache was loaded from or saved to
+        self._last_mtime_check = 0.0
+        self._load_error = None    # Error of the last load, reported once by load_config()
+        self._save_timer = None
+        self._lock = threading.RLock()  # Preferences are also read on the EIQ calculation worker thread
+        atexit.register(self.flush)
         self._initialized = True
     
+    def _get_config_path(self):
+        """Get the config file path, resolved on first use."""
+        if self._config_path is None:
+            self._config_path = get_config_file_path()
+        return self._config_path
+    
+    def _get_mtime(self):
+        """Get the config file's modification time, or None if it does not exist."""
+        try:
+            return os.stat(self._get_config_path()).st_mtime_ns
+        except OSError:
+            return None
+    
     def _get_current_config(self):
-        """Get the current configuration (from cache if dirty, otherwise fresh from disk)."""
-        if self._cache_dirty and self._config_cache is not None:
+        """Get the current configuration, loading it on first use or after the file changed on disk."""
+        with self._lock:
+            if self._config_cache is None:
+                self._config_cache = self._load_fresh_config()
+                self._last_mtime_check = time.monotonic()
+            elif not self._cache_dirty and time.monotonic() - self._last_mtime_check >= self.MTIME_CHECK_INTERVAL:
+                self._last_mtime_check = time.monotonic()
+                if self._get_mtime() != self._disk_mtime:
+                    self._reload_config()
             return self._config_cache
-        else:
-            config = self._load_fresh_config()
-            self._config_cache = config.copy()
-            self._cache_dirty = False
-            return config
     
     def _load_fresh_config(self):
         """Load the configuration from disk, bypassing any cache."""
+        self._disk_mtime = self._get_mtime()
         try:
-            config_path = get_config_file_path()
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as file:
-                    return json.load(file)
-            else:
-                return DEFAULT_CONFIG.copy()
-        except (IOError, OSError, json.JSONDecodeError):
-            return DEFAULT_CONFIG.copy()
-        """Load the configuration from disk, bypassing any cache."""
-        try:
-            config_path = get_config_file_path()
+            config_path = self._get_config_path()
             if os.path.exists(config_path):
                 with open(config_path, 'r') as file:
                     return json.load(file)
             else:
-                return DEFAULT_CONFIG.copy()
-        except (IOError, OSError, json.JSONDecodeError):
-            return DEFAULT_CONFIG.copy()
+                return copy.deepcopy(DEFAULT_CONFIG)
+        except (IOError, OSError, json.JSONDecodeError) as e:
+            self._load_error = e
+            return copy.deepcopy(DEFAULT_CONFIG)
+    
+    def _reload_config(self):
+        """Replace the cache with the file changed on disk and announce the sections that differ."""
+        old_config = self._config_cache
+        self._config_cache = self._load_fresh_config()
+        for section in set(old_config) | set(self._config_cache):
+            self._notify(section, old_config.get(section), self._config_cache.get(section))
+    
+    def _notify(self, section, old_data, new_data):
+        """Emit the change signals for a section, if its data changed."""
+        old_data = old_data if isinstance(old_data, dict) else {}
+        new_data = new_data if isinstance(new_data, dict) else {}
+        if old_data == new_data:
+            return
+        for key in set(old_data) | set(new_data):
+            if old_data.get(key) != new_data.get(key):
+                self.signals.preference_changed.emit(section, key, new_data.get(key))
+        self.signals.section_changed.emit(section, dict(new_data))
     
     def get_preference(self, section, key, default=None):
         """
@@ -107,10 +157,22 @@ class PreferencesManager:
             default: The default value if section doesn't exist
             
         Returns:
-            dict: The section data or default
+            dict: A copy of the section data, or default
         """
         config = self._get_current_config()
-        return config.get(section, default if default is not None else {})
+        if section not in config:
+            return default if default is not None else {}
+        return dict(config[section])
+    
+    def get_config(self):
+        """
+        Get a copy of the whole configuration.
+        
+        Returns:
+            dict: The configuration
+        """
+        with self._lock:
+            return copy.deepcopy(self._get_current_config())
     
     def set_preference(self, section, key, value, auto_save=False):
         """
@@ -120,22 +182,25 @@ class PreferencesManager:
             section (str): The preference section
             key (str): The preference key
             value: The value to set
-            auto_save (bool): Whether to automatically save to disk
+            auto_save (bool): Whether to save to disk (in the background, coalesced with other changes)
             
         Returns:
-            bool: True if successful (when auto_save=True)
+            bool: True if successful
         """
-        config = self._get_current_config()
-        
-        if section not in config:
-            config[section] = {}
-        
-        config[section][key] = value
-        self._config_cache = config
-        self._cache_dirty = True
+        with self._lock:
+            config = self._get_current_config()
+            old_data = dict(config.get(section, {}))
+            
+            if section not in config:
+                config[section] = {}
+            
+            config[section][key] = value
+            self._mark_dirty()
+            new_data = dict(config[section])
         
+        self._notify(section, old_data, new_data)
         if auto_save:
-            return self._save_config(config)
+            self._schedule_save()
         return True
     
     def set_section(self, section, data, auto_save=False):
@@ -145,22 +210,29 @@ class PreferencesManager:
         Args:
             section (str): The preference section name
             data (dict): The section data
-            auto_save (bool): Whether to automatically save to disk
+            auto_save (bool): Whether to save to disk (in the background, coalesced with other changes)
             
         Returns:
-            bool: True if successful (when auto_save=True)
+            bool: True if successful
         """
-        config = self._get_current_config()
-        config[section] = data.copy()
-        
-        # Store in cache and mark as dirty
-        self._config_cache = config
-        self._cache_dirty = True
+        with self._lock:
+            config = self._get_current_config()
+            old_data = dict(config.get(section, {}))
+            config[section] = data.copy()
+            
+            # Mark the cache as dirty
+            self._mark_dirty()
         
+        self._notify(section, old_data, data)
         if auto_save:
-            return self._save_config(config)
+            self._schedule_save()
         return True
     
+    def _mark_dirty(self):
+        """Record an unsaved change of the cache (the caller holds the lock)."""
+        self._cache_dirty = True
+        self._revision += 1
+    
     def save(self):
         """
         Manually save the current configuration to disk.
@@ -168,58 +240,108 @@ class PreferencesManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        config = self._get_current_config()
-        result = self._save_config(config)
-        if result:
-            self._cache_dirty = False  # Mark cache as clean after successful save
-        return result
+        self._cancel_scheduled_save()
+        with self._lock:
+            config = copy.deepcopy(self._get_current_config())
+            revision = self._revision
+        return self._save_config(config, revision)
+    
+    def flush(self):
+        """Write a pending background save now (called at exit)."""
+        with self._lock:
+            if self._save_timer is None:
+                return
+        self.save()
+    
+    def _schedule_save(self):
+        """Save in the background after SAVE_DELAY, together with any change made meanwhile."""
+        with self._lock:
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._run_scheduled_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
     
-    def _save_config(self, config):
+    def _cancel_scheduled_save(self):
+        """Cancel the pending background save, if any."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+    
+    def _run_scheduled_save(self):
+        """Background saver: write the configuration as it is now."""
+        with self._lock:
+            if self._save_timer is None:
+                return  # Cancelled by a manual save
+            self._save_timer = None
+            config = copy.deepcopy(self._config_cache)
+            revision = self._revision
+        self._save_config(config, revision)
+    
+    def _save_config(self, config, revision=None):
         """
         Internal method to save configuration to disk.
         
+        The file is written next to its final location and then renamed over it, so it is
+        never left half-written. Error message boxes are only shown on the GUI thread.
+        
         Args:
             config (dict): The configuration to save
+            revision (int): Change revision the configuration was copied at (default: current)
             
         Returns:
             bool: True if successful, False otherwise
         """
+        show_messages = is_gui_thread()
+        config_path = self._get_config_path()
         try:
-            config_path = get_config_file_path()
-            
-            # Ensure the directory exists
-            config_dir = os.path.dirname(config_path)
-            if config_dir:
-                os.makedirs(config_dir, exist_ok=True)
-            
-            with open(config_path, 'w') as file:
-                json.dump(config, file, indent=4)
-            
-            # Update cache after successful save
-            self._config_cache = config.copy()
-            self._cache_dirty = False
+            self._write_json_atomic(config_path, config)
+            self._mark_saved(config, revision, self._get_mtime())
             return True
         except (IOError, OSError) as e:
-            QMessageBox.warning(None, "Error", f"Error saving config to {config_path}: {e}")
+            if show_messages:
+                QMessageBox.warning(None, "Error", f"Error saving config to {config_path}: {e}")
             
             # Fallback: try saving to a temp directory
             try:
                 import tempfile
                 temp_dir = tempfile.gettempdir()
                 fallback_path = os.path.join(temp_dir, "mccain_pesticides_config.json")
-                QMessageBox.warning(None, "Warning", f"Trying fallback location: {fallback_path}")
+                if show_messages:
+                    QMessageBox.warning(None, "Warning", f"Trying fallback location: {fallback_path}")
                 
-                with open(fallback_path, 'w') as file:
-                    json.dump(config, file, indent=4)
-                QMessageBox.warning(None, "Warning", f"Config saved to fallback location: {fallback_path}")
+                self._write_json_atomic(fallback_path, config)
+                if show_messages:
+                    QMessageBox.warning(None, "Warning", f"Config saved to fallback location: {fallback_path}")
                 
                 # Update cache after successful fallback save
-                self._config_cache = config.copy()
-                self._cache_dirty = False
+                self._mark_saved(config, revision, self._disk_mtime)
                 return True
             except Exception as fallback_error:
-                QMessageBox.critical(None, "Critical Error", f"Failed to save config: {fallback_error}")
+                if show_messages:
+                    QMessageBox.critical(None, "Critical Error", f"Failed to save config: {fallback_error}")
                 return False
+    
+    @staticmethod
+    def _write_json_atomic(path, config):
+        """Write a JSON file through a temporary file renamed over the target."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as file:
+            json.dump(config, file, indent=4)
+        os.replace(temp_path, path)
+    
+    def _mark_saved(self, config, revision, disk_mtime):
+        """Update the cache after a successful save, unless it changed since the configuration was copied."""
+        with self._lock:
+            self._disk_mtime = disk_mtime
+            self._last_mtime_check = time.monotonic()
+            if revision is None or revision == self._revision:
+                self._config_cache = config
+                self._cache_dirty = False
 
 
 # Global instance
@@ -302,6 +424,22 @@ def get_config_file_path():
         # Running in development - use current directory
         return "user_preferences.json"
 
+def get_cache_dir(subdir=None):
+    """
+    Get a writable per-user directory for regenerable caches.
+
+    Args:
+        subdir (str): Optional subdirectory inside the cache directory
+
+    Returns:
+        str: Path to the (created) cache directory
+    """
+    cache_dir = os.path.join(os.path.expanduser("~"), ".project", "cache")
+    if subdir:
+        cache_dir = os.path.join(cache_dir, subdir)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
 def load_config():
     """
     Load configuration from file or create default if it doesn't exist.
@@ -309,23 +447,21 @@ def load_config():
     Returns:
         dict: The application configuration
     """
-    config_path = Path(get_config_file_path())
+    config = _preferences_manager.get_config()
+    load_error, _preferences_manager._load_error = _preferences_manager._load_error, None
     
-    if config_path.exists():
-        try:
-            with open(config_path, 'r') as file:
-                config = json.load(file)
-                
-                # Merge with default config to ensure all keys exist
-                # (in case the config file is from an older version)
-                return {**DEFAULT_CONFIG, **config}
-        except (json.JSONDecodeError, IOError) as e:
-            QMessageBox.warning(None, "Error", f"Error loading config: {e}")
-            return DEFAULT_CONFIG
-    else:
+    if load_error is not None:
+        QMessageBox.warning(None, "Error", f"Error loading config: {load_error}")
+        return copy.deepcopy(DEFAULT_CONFIG)
+    
+    if not os.path.exists(_preferences_manager._get_config_path()):
         # Create default config file
-        _preferences_manager._save_config(DEFAULT_CONFIG)
-        return DEFAULT_CONFIG
+        _preferences_manager.save()
+        return config
+    
+    # Merge with default config to ensure all keys exist
+    # (in case the config file is from an older version)
+    return {**copy.deepcopy(DEFAULT_CONFIG), **config}
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -463,6 +599,11 @@ def open_html_in_browser(html_file_path, temp_prefix, parent=None, error_title="
         show_generic_error_message(parent, f"Failed to open {os.path.basename(html_file_path)}: {str(e)}", error_title)
         return False
 
+def is_gui_thread() -> bool:
+    """Whether the caller runs on the GUI thread, the only one that can show message boxes."""
+    app = QCoreApplication.instance()
+    return app is not None and QThread.currentThread() == app.thread()
+
 def show_generic_error_message(parent, message, title="Error"):
     """Generic error message dialog."""
     msg_box = QMessageBox(parent)
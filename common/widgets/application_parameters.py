@@ -122,8 +122,8 @@ class ApplicationRateWidget(QWidget):
             uom_repo = UOMRepository.get_instance()
             
             # Create composite UOM objects
-            from_composite = CompositeUOM(from_uom)
-            to_composite = CompositeUOM(to_uom)
+            from_composite = CompositeUOM.intern(from_uom)
+            to_composite = CompositeUOM.intern(to_uom)
             
             # Get user preferences for complex conversions
             user_preferences = get_preferences_manager().get_section("user_preferences", {})
@@ -4,6 +4,8 @@ Product selection widgets for the LORENZO POZZI EIQ App.
 This module provides improved product search with ranking and better suggestion formatting.
 """
 
+from bisect import bisect_left
+from typing import Optional
 from PySide6.QtCore import Qt, Signal, QStringListModel, QEvent
 from PySide6.QtWidgets import (
     QComboBox, QCompleter, QFormLayout, QLineEdit, QVBoxLayout, 
@@ -14,9 +16,120 @@ from common.widgets.header_frame_buttons import ContentFrame
 from data.repository_product import ProductRepository
 
 
+# Longest n-gram kept in the contains index; longer search terms intersect their trigrams
+_NGRAM_SIZE = 3
+
+
+def get_product_display_name(product) -> str:
+    """Get the "Product - Method" string shown in the product suggestions."""
+    return f"{product.product_name} - {product.application_method or 'General'}"
+
+
+class ProductSearchIndex:
+    """
+    Prebuilt index ranking products by how their name matches a search term.
+
+    Built once per product list and shared through get_product_search_index. Distinct
+    lowercased names are kept sorted, so the names starting with a term form one
+    contiguous range (a flattened prefix trie found by bisection); names containing a
+    term elsewhere come from n-gram postings (every 1- to 3-character substring),
+    verified with a substring test. Results are ranked exact, then starts-with, then
+    contains, each in display string order.
+    """
+
+    def __init__(self, products=()):
+        """Build the index for a list of products."""
+        self.products = products
+        display_items = [get_product_display_name(product) for product in products]
+
+        # Rank of each product in display string order; results are sorted by rank
+        order = sorted(range(len(display_items)), key=display_items.__getitem__)
+        self.sorted_display_items = [display_items[product_index] for product_index in order]
+        rank_of = [0] * len(order)
+        for rank, product_index in enumerate(order):
+            rank_of[product_index] = rank
+
+        # Distinct lowercased names in sorted order, with the ranks of their products
+        ranks_by_name = {}
+        for product_index, product in enumerate(products):
+            ranks_by_name.setdefault(product.product_name.lower(), []).append(rank_of[product_index])
+        self._names = sorted(ranks_by_name)
+        self._name_ranks = [sorted(ranks_by_name[name]) for name in self._names]
+
+        # N-gram -> ids of the names containing it
+        postings = {}
+        for name_id, name in enumerate(self._names):
+            for size in range(1, _NGRAM_SIZE + 1):
+                for start in range(len(name) - size + 1):
+                    postings.setdefault(name[start:start + size], set()).add(name_id)
+        self._postings = postings
+
+    def search(self, search_term: str) -> list:
+        """
+        Rank the display strings of the products whose name contains a term.
+
+        Args:
+            search_term: The search string (already lowercase and stripped)
+
+        Returns:
+            List of display strings: exact, then starts-with, then contains matches
+        """
+        if not search_term:
+            return list(self.sorted_display_items)
+
+        names = self._names
+        first = bisect_left(names, search_term)
+        last = bisect_left(names, search_term + "\U0010ffff", first)
+
+        exact_ranks = []
+        if first < last and names[first] == search_term:
+            exact_ranks = self._name_ranks[first]
+            first += 1
+        starts_with_ranks = self._collect_ranks(range(first, last))
+        contains_ranks = self._collect_ranks(
+            name_id for name_id in self._contains_candidates(search_term)
+            if not names[name_id].startswith(search_term) and search_term in names[name_id]
+        )
+
+        display_items = self.sorted_display_items
+        return [display_items[rank] for rank in exact_ranks + starts_with_ranks + contains_ranks]
+
+    def _contains_candidates(self, search_term: str) -> set:
+        """Get the ids of the names containing every n-gram of the term (a superset of the matches)."""
+        if len(search_term) <= _NGRAM_SIZE:
+            return self._postings.get(search_term, set())
+
+        grams = {search_term[start:start + _NGRAM_SIZE] for start in range(len(search_term) - _NGRAM_SIZE + 1)}
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def _collect_ranks(self, name_ids) -> list:
+        """Get the sorted product ranks of the given names."""
+        ranks = []
+        for name_id in name_ids:
+            ranks.extend(self._name_ranks[name_id])
+        ranks.sort()
+        return ranks
+
+
+_cached_search_index: Optional[ProductSearchIndex] = None
+
+
+def get_product_search_index(products) -> ProductSearchIndex:
+    """Get the search index for a product list, reusing the last one built for the same list."""
+    global _cached_search_index
+    if _cached_search_index is None or _cached_search_index.products is not products:
+        _cached_search_index = ProductSearchIndex(products)
+    return _cached_search_index
+
+
 class RankedProductCompleter(QCompleter):
     """
     Custom completer that ranks search results by relevance.
+
+    Suggestions come from the shared ProductSearchIndex of the product list, fetched on
+    the first non-empty search, and are shown through a single string list model updated
+    in place.
     """
     
     def __init__(self, parent=None):
@@ -24,6 +137,11 @@ class RankedProductCompleter(QCompleter):
         self.all_products = []
         self.product_display_map = {}  # Maps "Product - Method" to Product object
         self.all_display_items = []  # Store all display items
+        self._search_index = None  # Fetched on the first non-empty search
+        self._search_term = None  # Term of the suggestions currently in the model
+
+        self._results_model = QStringListModel(self)
+        self.setModel(self._results_model)
         
     def set_products(self, products):
         """Set the list of products for searching."""
@@ -33,11 +151,13 @@ class RankedProductCompleter(QCompleter):
         # Create display strings and mapping
         self.all_display_items = []
         for product in products:
-            display_name = f"{product.product_name} - {product.application_method or 'General'}"
+            display_name = get_product_display_name(product)
             self.all_display_items.append(display_name)
             self.product_display_map[display_name] = product
+        self._search_index = None
         
         # Start with all items
+        self._search_term = None
         self._update_model_with_ranking("")
     
     def get_product_from_display(self, display_text):
@@ -57,16 +177,16 @@ class RankedProductCompleter(QCompleter):
     
     def _update_model_with_ranking(self, search_term):
         """Update the model with ranked results based on search term."""
+        # Qt calls splitPath more than once per keystroke
+        if search_term == self._search_term:
+            return
+        self._search_term = search_term
         if not search_term:
             # Show all items when no search term
             ranked_results = sorted(self.all_display_items)
         else:
-            # Rank and filter results
             ranked_results = self._rank_products(search_term)
-        
-        # Update model with ranked results
-        model = QStringListModel(ranked_results, self)
-        self.setModel(model)
+        self._results_model.setStringList(ranked_results)
     
     def _rank_products(self, search_term):
         """
@@ -78,29 +198,9 @@ class RankedProductCompleter(QCompleter):
         Returns:
             List of display strings ranked by relevance
         """
-        exact_matches = []
-        starts_with_matches = []
-        contains_matches = []
-        
-        for product in self.all_products:
-            product_name_lower = product.product_name.lower()
-            display_name = f"{product.product_name} - {product.application_method or 'General'}"
-            
-            # Check relevance level
-            if product_name_lower == search_term:
-                exact_matches.append(display_name)
-            elif product_name_lower.startswith(search_term):
-                starts_with_matches.append(display_name)
-            elif search_term in product_name_lower:
-                contains_matches.append(display_name)
-        
-        # Sort each category alphabetically for consistency
-        exact_matches.sort()
-        starts_with_matches.sort()
-        contains_matches.sort()
-        
-        # Combine in priority order
-        return exact_matches + starts_with_matches + contains_matches
+        if self._search_index is None:
+            self._search_index = get_product_search_index(self.all_products)
+        return self._search_index.search(search_term)
 
 
 class ProductSearchField(QWidget):
@@ -409,14 +509,9 @@ class ProductSelectionWidget(QWidget):
         # First, try to find the product in the repository to get its type
         try:
             products_repo = ProductRepository.get_instance()
-            filtered_products = products_repo.get_filtered_products()
             
             # Find the product to get its type
-            product = None
-            for filtered_product in filtered_products:
-                if filtered_product.product_name == product_name:
-                    product = filtered_product
-                    break
+            product = products_repo.find_product(product_name)
             
             if product and product.product_type:
                 # Set the type first (this will filter the product list)
@@ -429,4 +524,4 @@ class ProductSelectionWidget(QWidget):
             QMessageBox.warning(None, "Warning", f"Could not set product type for {product_name}: {e}")
 
         # Set the product name (the search field will handle formatting)
-        self.product_search.text = product_name
\ No newline at end of file
+        self.product_search.text = product_name
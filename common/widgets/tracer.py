@@ -13,13 +13,30 @@ Usage in layer_2_uom_std.py:
 
 Usage in layer_3_eiq_math.py:
 - Use log_calculation_formula() for clean formula display
+
+Hot paths should check `calculation_tracer.enabled` before formatting trace messages,
+so nothing is built while no trace dialog is open.
 """
 
+from collections import deque
 from PySide6.QtWidgets import QDialog, QTextEdit, QDialogButtonBox, QVBoxLayout
 from PySide6.QtGui import QTextCursor, Qt
 from common.styles import CALCULATION_TRACE_DIALOG_STYLE, CALCULATION_TRACE_TEXT_AREA_STYLE, CALCULATION_TRACE_BUTTON_STYLE
 
+# Number of completed calculations kept for the trace dialog
+MAX_TRACED_CALCULATIONS = 50
+# Safety cap on the lines of a single calculation (e.g. long runs without calculation_complete)
+MAX_LINES_PER_CALCULATION = 2000
+
 class CalculationTracer:
+    """
+    Collects a human-readable trace of unit conversions and EIQ calculations.
+    
+    Tracing is disabled by default: every log method returns immediately, and hot
+    callers check `enabled` before building their f-strings. When enabled (while a
+    CalculationTraceDialog is open), each calculation is kept as its own block in a
+    ring buffer holding only the last MAX_TRACED_CALCULATIONS calculations.
+    """
     _instance = None
     
     @classmethod
@@ -28,14 +45,27 @@ class CalculationTracer:
             cls._instance = CalculationTracer()
         return cls._instance
     
-    def __init__(self):
-        self.messages = []
+    def __init__(self, max_calculations=MAX_TRACED_CALCULATIONS):
+        self.enabled = False
+        self.messages = deque(maxlen=MAX_LINES_PER_CALCULATION)  # Lines of the calculation in progress
+        self._calculations = deque(maxlen=max_calculations)     # Completed calculations (tuples of lines)
         self.ui_dialog = None
         self._current_step = 0
         self._suppress_redundant = False  # Flag to prevent duplicate logging
+    
+    def set_enabled(self, enabled=True):
+        """Turn tracing on or off. Disabling drops the collected trace."""
+        self.enabled = enabled
+        if not enabled:
+            self.messages.clear()
+            self._calculations.clear()
+            self._current_step = 0
+            self._suppress_redundant = False
         
     def log_header(self, title):
         """Log a major calculation header."""
+        if not self.enabled:
+            return
         separator = "=" * 60
         self.messages.append(separator)
         self.messages.append(f"  {title.upper()}")
@@ -45,6 +75,8 @@ class CalculationTracer:
     
     def log_step(self, description):
         """Log a major calculation step with clear separation."""
+        if not self.enabled:
+            return
         self._current_step += 1
         if self._current_step > 1:
             self.messages.append("")  # Add spacing between steps
@@ -52,6 +84,8 @@ class CalculationTracer:
     
     def log_substep(self, description, level=1, is_last=False):
         """Log a substep with clean tree structure - avoid redundant calls."""
+        if not self.enabled:
+            return
         if self._suppress_redundant and level > 2:
             return  # Skip overly nested redundant logs
             
@@ -66,6 +100,8 @@ class CalculationTracer:
     
     def log_conversion_simple(self, description, from_val, from_unit, to_val, to_unit):
         """Log a simple conversion in one clean line."""
+        if not self.enabled:
+            return
         if from_val == to_val and from_unit == to_unit:
             self.messages.append(f"  • {description}: {from_val} {from_unit} (no conversion needed)")
         else:
@@ -73,6 +109,8 @@ class CalculationTracer:
     
     def log_ai_list(self, ai_data, level=1):
         """Log active ingredients in compact format."""
+        if not self.enabled:
+            return
         if not ai_data:
             self.log_substep("No active ingredients found", level)
             return
@@ -85,11 +123,15 @@ class CalculationTracer:
     
     def log_application_info(self, rate, unit, applications, level=1):
         """Log application info in one clean line."""
+        if not self.enabled:
+            return
         app_text = f"{applications} application" + ("s" if applications != 1 else "")
         self.messages.append(f"  • Application Rate: {rate} {unit} × {app_text}")
     
     def log_result(self, description, value, unit=None, level=0):
         """Log final result with emphasis."""
+        if not self.enabled:
+            return
         unit_str = f" {unit}" if unit else ""
         if level == 0:
             self.messages.append("")
@@ -100,11 +142,15 @@ class CalculationTracer:
     
     def log_calculation_formula(self, ai_name, rate, concentration, eiq, applications, result):
         """Log calculation formula in clean, readable format."""
+        if not self.enabled:
+            return
         self.messages.append(f"  • {ai_name}:")
         self.messages.append(f"    └─ {rate} × {concentration} × {eiq} × {applications} = {result} eiq/ha")
     
     def log_total_calculation(self, breakdown, total):
         """Log total calculation when multiple AIs."""
+        if not self.enabled:
+            return
         if len(breakdown) > 1:
             parts = " + ".join([f"{eiq:.1f}" for eiq in breakdown.values()])
             self.messages.append(f"  • Total: {parts} = {total:.1f} eiq/ha")
@@ -115,22 +161,35 @@ class CalculationTracer:
     
     def add_blank_line(self):
         """Add spacing."""
+        if not self.enabled:
+            return
         self.messages.append("")
     
     def log(self, message, end=""):
         """Legacy compatibility."""
+        if not self.enabled:
+            return
         self.messages.append(f"{message}{end}")
     
     def clear(self):
         self.messages.clear()
+        self._calculations.clear()
         self._current_step = 0
         self._suppress_redundant = False
         self._update_ui()
     
     def get_trace(self):
-        return "\n".join(self.messages)
+        lines = [line for calculation in self._calculations for line in calculation]
+        lines.extend(self.messages)
+        return "\n".join(lines)
     
     def calculation_complete(self):
+        """Close the current calculation's trace block and refresh the dialog."""
+        if not self.enabled:
+            return
+        if self.messages:
+            self._calculations.append(tuple(self.messages))
+            self.messages.clear()
         self._update_ui()
     
     def _update_ui(self):
@@ -160,8 +219,9 @@ class CalculationTraceDialog(QDialog):
         self.setup_ui()
         self.update_content()
         
-        # Register this dialog with the tracer for auto-updates
+        # Register this dialog with the tracer for auto-updates, and start tracing
         self.tracer.ui_dialog = self
+        self.tracer.set_enabled(True)
     
     def setup_ui(self):
         """Set up the dialog UI."""
@@ -211,6 +271,7 @@ class CalculationTraceDialog(QDialog):
         """Clean up when dialog is closed."""
         if hasattr(self, 'tracer') and self.tracer:
             self.tracer.ui_dialog = None
+            self.tracer.set_enabled(False)  # Back to the zero-cost disabled mode
         
         # Clean up the parent's reference to this dialog
         if self.parent():
@@ -0,0 +1,129 @@
+"""
+Catalog Cache for the LORENZO POZZI EIQ App.
+
+This module stores the parsed product and active ingredient catalogs as versioned
+pickle snapshots, so startup can skip CSV parsing when the source CSVs are unchanged.
+Snapshots are keyed by the CSV modification time, size and content hash and are
+regenerated automatically whenever the CSV changes.
+"""
+
+import hashlib, os, pickle, time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from common.utils import get_cache_dir
+
+# Bump when the pickled models change shape so stale snapshots are rebuilt
+CATALOG_CACHE_VERSION = 2
+
+@dataclass
+class CatalogLoadStats:
+    """Timing information for the last load of a catalog."""
+    name: str          # catalog name, e.g. "products"
+    source: str        # "cache" or "csv"
+    seconds: float     # wall time spent loading
+    cache_path: str    # snapshot location (None when caching is unavailable)
+
+# Last load statistics by catalog name, to compare cold and warm startup
+_load_stats: Dict[str, CatalogLoadStats] = {}
+
+
+def get_load_stats() -> Dict[str, CatalogLoadStats]:
+    """Get the statistics of the most recent load of each catalog."""
+    return dict(_load_stats)
+
+
+def load_catalog(name: str, csv_path: str, parse_csv: Callable[[str], Any]) -> Any:
+    """
+    Load a catalog from its snapshot, or parse the CSV and write a fresh snapshot.
+
+    Args:
+        name: Catalog name, used for the snapshot file name
+        csv_path: Path to the source CSV file
+        parse_csv: Callable that parses the CSV file and returns the catalog
+
+    Returns:
+        The catalog object, as returned by parse_csv
+    """
+    start = time.perf_counter()
+    try:
+        cache_path = os.path.join(get_cache_dir("catalog"), f"{name}.pickle")
+        stat = os.stat(csv_path)
+        catalog = _read_snapshot(cache_path, csv_path, stat)
+    except OSError:
+        # No writable cache directory - parse the CSV every time
+        cache_path, catalog = None, None
+
+    source = "cache"
+    if catalog is None:
+        catalog, source = parse_csv(csv_path), "csv"
+        if cache_path:
+            _write_snapshot(cache_path, csv_path, stat, catalog)
+
+    _load_stats[name] = CatalogLoadStats(name, source, time.perf_counter() - start, cache_path)
+    return catalog
+
+
+def clear_catalog_cache() -> None:
+    """Delete all catalog snapshots, forcing the next load to parse the CSVs."""
+    cache_dir = get_cache_dir("catalog")
+    for file_name in os.listdir(cache_dir):
+        if file_name.endswith(".pickle"):
+            try:
+                os.remove(os.path.join(cache_dir, file_name))
+            except OSError:
+                pass
+
+
+def _file_hash(path: str) -> str:
+    """Get the SHA-1 digest of a file's content."""
+    with open(path, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def _read_snapshot(cache_path: str, csv_path: str, stat: os.stat_result) -> Any:
+    """Read a snapshot if it is valid for the current CSV, otherwise return None."""
+    touched_sha1 = None
+    try:
+        with open(cache_path, 'rb') as file:
+            header = pickle.load(file)
+            if header.get("version") != CATALOG_CACHE_VERSION:
+                return None
+
+            # Fast path: unchanged modification time and size
+            if header.get("mtime_ns") != stat.st_mtime_ns or header.get("size") != stat.st_size:
+                # The file was touched (e.g. checkout or copy) - fall back to the content hash
+                touched_sha1 = _file_hash(csv_path)
+                if header.get("sha1") != touched_sha1:
+                    return None
+
+            catalog = pickle.load(file)
+    except Exception:
+        # Missing, truncated or incompatible snapshot - rebuild from the CSV
+        return None
+
+    if touched_sha1 is not None:
+        # Same content - record the new modification time and size so the next load takes the fast path
+        _write_snapshot(cache_path, csv_path, stat, catalog, touched_sha1)
+    return catalog
+
+
+def _write_snapshot(cache_path: str, csv_path: str, stat: os.stat_result, catalog: Any,
+                    sha1: Optional[str] = None) -> None:
+    """Write a snapshot atomically; failures only cost a CSV parse on next startup."""
+    header = {
+        "version": CATALOG_CACHE_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha1": sha1 or _file_hash(csv_path),
+    }
+    temp_path = f"{cache_path}.tmp"
+    try:
+        with open(temp_path, 'wb') as file:
+            pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(catalog, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
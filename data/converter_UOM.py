@@ -34,7 +34,8 @@ class UOMConverter:
                             user_preferences: dict = None) -> float:
         """Convert between composite UOMs, handling special cases with validation."""
         
-        calculation_tracer.log_substep(f"Converting {value} {from_uom.original_string} → {to_uom.original_string}", level=3)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Converting {value} {from_uom.original_string} → {to_uom.original_string}", level=3)
         
         try:
             # Validate physical state compatibility
@@ -97,9 +98,9 @@ class UOMConverter:
         # Try using the base composite UOM conversion
         try:
             from data.repository_UOM import CompositeUOM
-            from_composite = CompositeUOM(from_uom)
-            to_composite = CompositeUOM(to_uom)
-            return self.convert_composite_uom(value, from_composite, to_composite)
+            from_composite = CompositeUOM.intern(from_uom)
+            to_composite = CompositeUOM.intern(to_uom)
+            return self.repository.convert_composite_uom(value, from_composite, to_composite)
         except Exception as e:
             raise ValueError(f"repo. Cannot convert concentration from {from_uom} to {to_uom}: {e}")
     
@@ -118,7 +119,7 @@ class UOMConverter:
             return True  # Percentage works with both weight and volume
         
         from data.repository_UOM import CompositeUOM
-        concentration_composite = CompositeUOM(concentration_uom)
+        concentration_composite = CompositeUOM.intern(concentration_uom)
         
         # For weight-based rates, concentration should be weight/weight
         if rate_unit_type == "weight":
@@ -153,7 +154,7 @@ class UOMConverter:
             Dict with compatibility information
         """
         from data.repository_UOM import CompositeUOM
-        rate_composite = CompositeUOM(rate_uom)
+        rate_composite = CompositeUOM.intern(rate_uom)
         numerator_unit = self.repository.get_base_unit(rate_composite.numerator)
         
         if not numerator_unit:
@@ -278,7 +279,8 @@ class UOMConverter:
     
     def _convert_concentration_composite(self, value: float, from_uom, to_uom) -> float:
         """Convert concentration units to standard units."""
-        calculation_tracer.log_substep(f"Converting concentration: {value} {from_uom.original_string} → {to_uom.original_string}", level=4)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Converting concentration: {value} {from_uom.original_string} → {to_uom.original_string}", level=4)
         
         # Handle percentage conversion
         if from_uom.numerator == '%':
@@ -298,11 +300,13 @@ class UOMConverter:
             
             # For concentrations: multiply by numerator factor, divide by denominator factor
             result = value * num_factor / den_factor
-            calculation_tracer.log_substep(f"Concentration conversion result: {result:.4f}", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Concentration conversion result: {result:.4f}", level=5)
             return result
             
         except Exception as e:
-            calculation_tracer.log_substep(f"Concentration conversion error: {e}", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Concentration conversion error: {e}", level=5)
             raise ValueError(f"Cannot convert concentration from {from_uom.original_string} to {to_uom.original_string}: {e}")
     
     def _convert_rate(self, value: float, from_uom, to_uom, 
@@ -330,21 +334,21 @@ class UOMConverter:
     def _needs_user_preferences(self, from_uom, to_uom) -> bool:
         """Check if conversion needs user preferences (row spacing, seeding rate)."""
         
-        # Get denominator units
-        from_denom_unit = self.repository.get_base_unit(from_uom.denominator) if from_uom.denominator else None
-        to_denom_unit = self.repository.get_base_unit(to_uom.denominator) if to_uom.denominator else None
+        # Get denominator categories (resolved once per parsed UOM)
+        from_denom = from_uom.denominator_category if from_uom.denominator else None
+        to_denom = to_uom.denominator_category if to_uom.denominator else None
         
-        if not from_denom_unit or not to_denom_unit:
+        if not from_denom or not to_denom:
             return False
         
         # Linear ↔ Area conversions need row spacing (bidirectional)
-        if ((from_denom_unit.category == 'length' and to_denom_unit.category == 'area') or
-            (from_denom_unit.category == 'area' and to_denom_unit.category == 'length')):
+        if ((from_denom == 'length' and to_denom == 'area') or
+            (from_denom == 'area' and to_denom == 'length')):
             return True
         
         # Seed weight ↔ Area conversions need seeding rate (bidirectional)
-        if ((from_denom_unit.category == 'weight' and to_denom_unit.category == 'area') or
-            (from_denom_unit.category == 'area' and to_denom_unit.category == 'weight')):
+        if ((from_denom == 'weight' and to_denom == 'area') or
+            (from_denom == 'area' and to_denom == 'weight')):
             return True
         
         return False
@@ -405,33 +409,39 @@ class UOMConverter:
             meter_factor = self.convert_base_unit(1.0, from_uom.denominator, 'm')
             amount_per_m = value * meter_factor  # Inverse because it's in denominator
         
-        calculation_tracer.log_substep(f"Step 1: {value} {from_uom.original_string} = {amount_per_m:.3f} {from_uom.numerator}/m", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 1: {value} {from_uom.original_string} = {amount_per_m:.3f} {from_uom.numerator}/m", level=5)
         
         # Step 2: Get row spacing and convert to meters
         row_spacing = user_preferences.get('default_row_spacing', 34.0)
         row_spacing_unit = user_preferences.get('default_row_spacing_unit', 'inch')
         row_spacing_m = self.convert_base_unit(row_spacing, row_spacing_unit, 'm')
-        calculation_tracer.log_substep(f"Step 2: Row spacing {row_spacing} {row_spacing_unit} = {row_spacing_m:.3f} m", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 2: Row spacing {row_spacing} {row_spacing_unit} = {row_spacing_m:.3f} m", level=5)
 
         # Step 3: Calculate rows per meter and meters of rows per hectare
         m_of_rows_per_ha = 10000.0 / row_spacing_m
-        calculation_tracer.log_substep(f"Step 3: Meters of rows per hectare: {m_of_rows_per_ha:.1f} m/ha", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 3: Meters of rows per hectare: {m_of_rows_per_ha:.1f} m/ha", level=5)
         
         # Step 4: Convert amount/m to amount/ha
         amount_per_ha = amount_per_m * m_of_rows_per_ha
-        calculation_tracer.log_substep(f"Step 4: {amount_per_ha:.3f} {from_uom.numerator}/ha", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 4: {amount_per_ha:.3f} {from_uom.numerator}/ha", level=5)
         
         # Step 5: Convert numerator to match target unit if needed
         if from_uom.numerator != to_uom.numerator:
             num_factor = self.convert_base_unit(1.0, from_uom.numerator, to_uom.numerator)
             amount_per_ha *= num_factor
-            calculation_tracer.log_substep(f"Step 5: Unit conversion {from_uom.numerator} → {to_uom.numerator} (×{num_factor:.3f})", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Step 5: Unit conversion {from_uom.numerator} → {to_uom.numerator} (×{num_factor:.3f})", level=5)
         
         # Step 6: Convert to target area unit if needed
         if to_uom.denominator != 'ha':
             area_factor = self.convert_base_unit(1.0, 'ha', to_uom.denominator)
             amount_per_ha *= area_factor
-            calculation_tracer.log_substep(f"Step 6: Area conversion ha → {to_uom.denominator} (×{area_factor:.3f})", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Step 6: Area conversion ha → {to_uom.denominator} (×{area_factor:.3f})", level=5)
         
         return amount_per_ha
     
@@ -447,29 +457,34 @@ class UOMConverter:
         row_spacing = user_preferences.get('default_row_spacing', 34.0)
         row_spacing_unit = user_preferences.get('default_row_spacing_unit', 'inch')
         row_spacing_m = self.convert_base_unit(row_spacing, row_spacing_unit, 'm')
-        calculation_tracer.log_substep(f"Step 1: Row spacing {row_spacing} {row_spacing_unit} = {row_spacing_m:.3f} m", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 1: Row spacing {row_spacing} {row_spacing_unit} = {row_spacing_m:.3f} m", level=5)
         
         # Step 2: Calculate meters of rows per hectare
         m_of_rows_per_ha = 10000.0 / row_spacing_m
-        calculation_tracer.log_substep(f"Step 2: Meters of rows per hectare: {m_of_rows_per_ha:.1f} m/ha", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 2: Meters of rows per hectare: {m_of_rows_per_ha:.1f} m/ha", level=5)
         
         # Step 3: Convert from area unit to ha if needed
         amount_per_ha = value
         if from_uom.denominator != 'ha':
             ha_factor = self.convert_base_unit(1.0, from_uom.denominator, 'ha')
             amount_per_ha *= ha_factor
-            calculation_tracer.log_substep(f"Step 3: Area conversion {from_uom.denominator} → ha (×{ha_factor:.3f})", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Step 3: Area conversion {from_uom.denominator} → ha (×{ha_factor:.3f})", level=5)
         
         # Step 4: Convert amount/ha to amount/m
         amount_per_m = amount_per_ha / m_of_rows_per_ha
-        calculation_tracer.log_substep(f"Step 4: {amount_per_ha:.3f} {from_uom.numerator}/ha = {amount_per_m:.3f} {from_uom.numerator}/m", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 4: {amount_per_ha:.3f} {from_uom.numerator}/ha = {amount_per_m:.3f} {from_uom.numerator}/m", level=5)
         
         # Step 5: Convert numerator unit if needed
         final_amount_per_m = amount_per_m
         if from_uom.numerator != to_uom.numerator:
             num_factor = self.convert_base_unit(1.0, from_uom.numerator, to_uom.numerator)
             final_amount_per_m *= num_factor
-            calculation_tracer.log_substep(f"Step 5: Unit conversion {from_uom.numerator} → {to_uom.numerator} (×{num_factor:.3f})", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Step 5: Unit conversion {from_uom.numerator} → {to_uom.numerator} (×{num_factor:.3f})", level=5)
         
         # Step 6: Convert from standard linear rate (amount/m) to target linear unit
         if to_uom.denominator in ['100m', '1000ft']:
@@ -511,7 +526,7 @@ class UOMConverter:
         
         from data.repository_UOM import CompositeUOM        
         # Parse seeding rate UOM
-        seeding_uom = CompositeUOM(seeding_rate_unit)
+        seeding_uom = CompositeUOM.intern(seeding_rate_unit)
         
         # Convert seeding rate to kg/ha
         seeding_rate_kg_per_ha = seeding_rate
@@ -526,7 +541,8 @@ class UOMConverter:
             ha_factor = self.convert_base_unit(1.0, seeding_uom.denominator, 'ha')
             seeding_rate_kg_per_ha /= ha_factor
         
-        calculation_tracer.log_substep(f"Step 1: Seeding rate {seeding_rate} {seeding_rate_unit} = {seeding_rate_kg_per_ha:.1f} kg/ha", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 1: Seeding rate {seeding_rate} {seeding_rate_unit} = {seeding_rate_kg_per_ha:.1f} kg/ha", level=5)
         
         # Step 2: Standardize application rate to standard units per kg of seed
         # Determine if application rate numerator is liquid or dry
@@ -549,7 +565,8 @@ class UOMConverter:
             seed_kg_factor = self.convert_base_unit(1.0, from_uom.denominator, 'kg')
             standard_app_rate /= seed_kg_factor
         
-        calculation_tracer.log_substep(f"Step 2: App rate {value} {from_uom.original_string} = {standard_app_rate:.3f} {target_app_numerator}/kg", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 2: App rate {value} {from_uom.original_string} = {standard_app_rate:.3f} {target_app_numerator}/kg", level=5)
         
         # Step 3: Apply conversion formula
         # [amount/kg_seed] x [kg_seed/ha] = [amount/ha]
@@ -562,13 +579,15 @@ class UOMConverter:
         if to_uom.numerator != target_app_numerator:
             num_factor = self.convert_base_unit(1.0, target_app_numerator, to_uom.numerator)
             final_result *= num_factor
-            calculation_tracer.log_substep(f"Step 4a: Unit conversion {target_app_numerator} → {to_uom.numerator} (×{num_factor:.3f})", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Step 4a: Unit conversion {target_app_numerator} → {to_uom.numerator} (×{num_factor:.3f})", level=5)
         
         # Convert denominator if needed (e.g., ha to acre)
         if to_uom.denominator != 'ha':
             den_factor = self.convert_base_unit(1.0, 'ha', to_uom.denominator)
             final_result *= den_factor
-            calculation_tracer.log_substep(f"Step 4b: Area conversion ha → {to_uom.denominator} (×{den_factor:.3f})", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Step 4b: Area conversion ha → {to_uom.denominator} (×{den_factor:.3f})", level=5)
         
         return final_result
     
@@ -599,7 +618,7 @@ class UOMConverter:
         
         from data.repository_UOM import CompositeUOM        
         # Parse seeding rate UOM
-        seeding_uom = CompositeUOM(seeding_rate_unit)
+        seeding_uom = CompositeUOM.intern(seeding_rate_unit)
         
         # Convert seeding rate to kg/ha
         seeding_rate_kg_per_ha = seeding_rate
@@ -614,19 +633,22 @@ class UOMConverter:
             ha_factor = self.convert_base_unit(1.0, seeding_uom.denominator, 'ha')
             seeding_rate_kg_per_ha /= ha_factor
         
-        calculation_tracer.log_substep(f"Step 1: Seeding rate {seeding_rate} {seeding_rate_unit} = {seeding_rate_kg_per_ha:.1f} kg/ha", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 1: Seeding rate {seeding_rate} {seeding_rate_unit} = {seeding_rate_kg_per_ha:.1f} kg/ha", level=5)
         
         # Step 2: Convert from area unit to ha if needed
         amount_per_ha = value
         if from_uom.denominator != 'ha':
             ha_factor = self.convert_base_unit(1.0, from_uom.denominator, 'ha')
             amount_per_ha *= ha_factor
-            calculation_tracer.log_substep(f"Step 2: Area conversion {from_uom.denominator} → ha (×{ha_factor:.3f})", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Step 2: Area conversion {from_uom.denominator} → ha (×{ha_factor:.3f})", level=5)
         
         # Step 3: Apply reverse conversion formula
         # [amount/ha] ÷ [kg_seed/ha] = [amount/kg_seed]
         amount_per_kg_seed = amount_per_ha / seeding_rate_kg_per_ha
-        calculation_tracer.log_substep(f"Step 3: {amount_per_ha:.3f} {from_uom.numerator}/ha ÷ {seeding_rate_kg_per_ha:.1f} kg/ha = {amount_per_kg_seed:.3f} {from_uom.numerator}/kg", level=5)
+        if calculation_tracer.enabled:
+            calculation_tracer.log_substep(f"Step 3: {amount_per_ha:.3f} {from_uom.numerator}/ha ÷ {seeding_rate_kg_per_ha:.1f} kg/ha = {amount_per_kg_seed:.3f} {from_uom.numerator}/kg", level=5)
         
         # Step 4: Determine target application rate units
         # Check if target numerator is liquid or dry to maintain consistency
@@ -639,12 +661,14 @@ class UOMConverter:
         if from_uom.numerator != to_uom.numerator:
             num_factor = self.convert_base_unit(1.0, from_uom.numerator, to_uom.numerator)
             final_amount_per_seed_unit *= num_factor
-            calculation_tracer.log_substep(f"Step 4a: Unit conversion {from_uom.numerator} → {to_uom.numerator} (×{num_factor:.3f})", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Step 4a: Unit conversion {from_uom.numerator} → {to_uom.numerator} (×{num_factor:.3f})", level=5)
         
         # Step 5: Convert from kg seed weight to target seed weight unit
         if to_uom.denominator != 'kg':
             seed_weight_factor = self.convert_base_unit(1.0, 'kg', to_uom.denominator)
             final_amount_per_seed_unit *= seed_weight_factor
-            calculation_tracer.log_substep(f"Step 4b: Seed weight conversion kg → {to_uom.denominator} (×{seed_weight_factor:.3f})", level=5)
+            if calculation_tracer.enabled:
+                calculation_tracer.log_substep(f"Step 4b: Seed weight conversion kg → {to_uom.denominator} (×{seed_weight_factor:.3f})", level=5)
         
         return final_amount_per_seed_unit
\ No newline at end of file
@@ -13,8 +13,53 @@ class Product:
     
     Stores information about a pesticide product including country, region, name, active ingredients,
     application rates, and safety intervals.
+    
+    Products are loaded once from the catalog and treated as read-only afterwards, so the
+    class uses __slots__ and precomputes the active ingredient tuples and display name.
     """
     
+    __slots__ = (
+        "country", "region", "product_type", "product_name", "registrant_name",
+        "regulator_number", "application_method", "formulation",
+        "label_minimum_rate", "label_maximum_rate", "rate_uom",
+        "min_days_between_applications", "rei_hours", "phi_days",
+        "ai1", "ai1_concentration", "ai1_concentration_uom",
+        "ai2", "ai2_concentration", "ai2_concentration_uom",
+        "ai3", "ai3_concentration", "ai3_concentration_uom",
+        "ai4", "ai4_concentration", "ai4_concentration_uom",
+        "_ai_info", "_active_ingredients", "_display_name",
+    )
+    
+    # Mapping of to_dict() keys to attribute names, for direct per-field access
+    FIELD_ATTRIBUTES = {
+        "country": "country",
+        "region": "region",
+        "type": "product_type",
+        "reg. #": "regulator_number",
+        "name": "product_name",
+        "registrant": "registrant_name",
+        "use": "application_method",
+        "formulation": "formulation",
+        "min rate": "label_minimum_rate",
+        "max rate": "label_maximum_rate",
+        "rate UOM": "rate_uom",
+        "min days between applications": "min_days_between_applications",
+        "REI (h)": "rei_hours",
+        "PHI (d)": "phi_days",
+        "AI1": "ai1",
+        "[AI1]": "ai1_concentration",
+        "[AI1]UOM": "ai1_concentration_uom",
+        "AI2": "ai2",
+        "[AI2]": "ai2_concentration",
+        "[AI2]UOM": "ai2_concentration_uom",
+        "AI3": "ai3",
+        "[AI3]": "ai3_concentration",
+        "[AI3]UOM": "ai3_concentration_uom",
+        "AI4": "ai4",
+        "[AI4]": "ai4_concentration",
+        "[AI4]UOM": "ai4_concentration_uom",
+    }
+    
     def __init__(self, 
                  country=None,
                  region=None,
@@ -93,14 +138,39 @@ class Product:
         self.phi_days = self._convert_to_int(phi_days)
         
         # Active ingredients
-        for idx in range(1, 5):  # Process AI1 through AI4
-            name_attr = f"ai{idx}"
-            conc_attr = f"ai{idx}_concentration"
-            uom_attr = f"ai{idx}_concentration_uom"
-            
-            setattr(self, name_attr, locals()[name_attr])
-            setattr(self, conc_attr, self._convert_to_float(locals()[conc_attr]))
-            setattr(self, uom_attr, locals()[uom_attr])
+        self.ai1 = ai1
+        self.ai1_concentration = self._convert_to_float(ai1_concentration)
+        self.ai1_concentration_uom = ai1_concentration_uom
+        self.ai2 = ai2
+        self.ai2_concentration = self._convert_to_float(ai2_concentration)
+        self.ai2_concentration_uom = ai2_concentration_uom
+        self.ai3 = ai3
+        self.ai3_concentration = self._convert_to_float(ai3_concentration)
+        self.ai3_concentration_uom = ai3_concentration_uom
+        self.ai4 = ai4
+        self.ai4_concentration = self._convert_to_float(ai4_concentration)
+        self.ai4_concentration_uom = ai4_concentration_uom
+        
+        self._precompute_ai_info()
+    
+    def _precompute_ai_info(self):
+        """Precompute the active ingredient tuples and display name once at load."""
+        self._ai_info = tuple(
+            (name, concentration, uom)
+            for name, concentration, uom in (
+                (self.ai1, self.ai1_concentration, self.ai1_concentration_uom),
+                (self.ai2, self.ai2_concentration, self.ai2_concentration_uom),
+                (self.ai3, self.ai3_concentration, self.ai3_concentration_uom),
+                (self.ai4, self.ai4_concentration, self.ai4_concentration_uom),
+            )
+            if name
+        )
+        self._active_ingredients = tuple(name for name, _, _ in self._ai_info)
+        
+        if self._active_ingredients:
+            self._display_name = f"{self.product_name} ({', '.join(self._active_ingredients)})"
+        else:
+            self._display_name = self.product_name
     
     def _convert_to_float(self, value):
         """Convert a value to float, handling None and empty strings."""
@@ -141,26 +211,35 @@ class Product:
     @property
     def display_name(self):
         """Get display name with all active ingredients."""
-        ingredients = self.active_ingredients
-        if ingredients:
-            ai_text = ", ".join(ingredients)
-            return f"{self.product_name} ({ai_text})"
-        return self.product_name
+        return self._display_name
     
     @property
     def active_ingredients(self):
-        """Get a list of all active ingredients in the product."""
-        ingredients = []
-        for idx in range(1, 5):  # Process AI1 through AI4
-            name, _, _ = self._get_ai_info(idx)
-            if name:
-                ingredients.append(name)
-        return ingredients
+        """Get a tuple of all active ingredient names in the product."""
+        return self._active_ingredients
+    
+    @property
+    def ai_info(self):
+        """Get a tuple of (name, concentration, uom) for each active ingredient in the product."""
+        return self._ai_info
     
     @property
     def number_of_ai(self):
         """Calculate the number of active ingredients."""
-        return sum(1 for idx in range(1, 5) if getattr(self, f"ai{idx}", None))
+        return len(self._active_ingredients)
+    
+    def get_field(self, key):
+        """
+        Get a single field by its to_dict() key without building the whole dictionary.
+        
+        Args:
+            key (str): Dictionary key, e.g. "REI (h)"
+            
+        Returns:
+            The field value, or None for unknown keys
+        """
+        attribute = self.FIELD_ATTRIBUTES.get(key)
+        return getattr(self, attribute) if attribute else None
     
     def to_dict(self):
         """
@@ -277,11 +356,7 @@ class Product:
         ai_data = []
         
         # Process all active ingredients in a loop
-        for idx in range(1, 5):  # Process AI1 through AI4
-            name, concentration, uom = self._get_ai_info(idx)
-            if not name:
-                continue
-                
+        for name, concentration, uom in self._ai_info:
             eiq = ai_repo.get_ai_eiq(name)
             
             if concentration is not None:
@@ -292,4 +367,4 @@ class Product:
                     'uom': uom
                 })
         
-        return ai_data
\ No newline at end of file
+        return ai_data
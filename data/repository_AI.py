@@ -9,6 +9,7 @@ import csv, os
 from PySide6.QtWidgets import QMessageBox
 from typing import Dict, Optional, Tuple
 from data.model_AI import ActiveIngredient
+from data.catalog_cache import load_catalog
 from common.utils import resource_path
 
 ai_csv = resource_path("data/csv_AI.csv")
@@ -105,24 +106,30 @@ class AIRepository:
         return None
     
     def _load_ingredients(self) -> None:
-        """Load all active ingredients from the CSV file."""
+        """Load all active ingredients from the catalog snapshot, or from the CSV file if it changed."""
         try:
-            with open(self.csv_file, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    # Clean row data
-                    cleaned_row = {k.strip(): v.strip() if isinstance(v, str) else v 
-                                  for k, v in row.items() if k is not None}
-                    
-                    ai = ActiveIngredient.from_dict(cleaned_row)
-                    self._all_ingredients[ai.name] = ai
-            
+            self._all_ingredients = load_catalog("active_ingredients", self.csv_file, self._parse_ingredients_csv)
             self._build_name_mapping()
             
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error loading active ingredient data: {e}")
             self._all_ingredients = {}
     
+    @staticmethod
+    def _parse_ingredients_csv(csv_file: str) -> Dict[str, ActiveIngredient]:
+        """Parse the active ingredients CSV file into ActiveIngredient objects by name."""
+        ingredients = {}
+        with open(csv_file, 'r', newline='', encoding='utf-8') as csvfile:
+            reader = csv.DictReader(csvfile)
+            for row in reader:
+                # Clean row data
+                cleaned_row = {k.strip(): v.strip() if isinstance(v, str) else v 
+                              for k, v in row.items() if k is not None}
+                
+                ai = ActiveIngredient.from_dict(cleaned_row)
+                ingredients[ai.name] = ai
+        return ingredients
+    
     def _build_name_mapping(self) -> None:
         """Build a mapping of name variations to standardized names."""
         self._name_to_ai_map = {name.lower(): name for name in self._all_ingredients.keys()}
\ No newline at end of file
@@ -5,14 +5,23 @@ This module provides the public interface for unit of measure operations,
 delegating complex conversion logic to the UOM converter.
 """
 
-import csv
-from typing import Optional, Dict
+import csv, threading
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
 from dataclasses import dataclass
-from common.utils import resource_path
+from common.utils import get_preferences_manager, resource_path
+from common.widgets.tracer import calculation_tracer
 from data.converter_UOM import UOMConverter
 
 UOM_CSV = resource_path("data/csv_UOM.csv")
 
+# Maximum number of compiled conversion plans kept in the LRU cache
+CONVERSION_PLAN_CACHE_SIZE = 512
+
+# User preferences that affect row spacing and seeding rate conversions
+_PREFERENCE_KEYS = ('default_row_spacing', 'default_row_spacing_unit',
+                    'default_seeding_rate', 'default_seeding_rate_unit')
+
 @dataclass
 class BaseUnit:
     """Represents a fundamental unit of measure."""
@@ -23,7 +32,24 @@ class BaseUnit:
     standard: str  # standard unit for this category
 
 class CompositeUOM:
-    """Represents a composite unit X/Y (like kg/ha, ml/100m, etc.)."""
+    """
+    Represents a composite unit X/Y (like kg/ha, ml/100m, etc.).
+    
+    Use CompositeUOM.intern() to get a shared, already-parsed instance for a UOM string.
+    Interned instances are treated as immutable; their is_rate/is_concentration flags and
+    base unit categories are resolved once on first use.
+    """
+    
+    _interned: Dict[str, "CompositeUOM"] = {}  # Flyweight instances by UOM string
+    
+    @classmethod
+    def intern(cls, uom_string: str) -> "CompositeUOM":
+        """Get the shared parsed instance for a UOM string, parsing it on first use."""
+        uom = cls._interned.get(uom_string)
+        if uom is None:
+            uom = cls(uom_string)
+            cls._interned[uom_string] = uom
+        return uom
     
     def __init__(self, uom_string: str):
         """Parse a UOM string like 'kg/ha' or 'ml/100 m'."""
@@ -31,6 +57,12 @@ class CompositeUOM:
         self.numerator = None
         self.denominator = None
         self._parse_uom_string(uom_string)
+        
+        # Resolved lazily from the UOM repository (see _resolve_units)
+        self._resolved = False
+        self._numerator_category = None
+        self._denominator_category = None
+        self._is_concentration = False
     
     def _parse_uom_string(self, uom_string: str):
         """Parse compound UOM string into numerator and denominator."""
@@ -46,20 +78,42 @@ class CompositeUOM:
     @property
     def is_rate(self) -> bool:
         """Check if this is a rate (has a denominator and is not a concentration)."""
-        # Basic check if it has a denominator
-        has_denom = self.denominator is not None
-        
         # For proper rate identification, ensure it's not a concentration
-        if has_denom:
-            is_conc = self._check_if_concentration()
-            return not is_conc
+        if self.denominator is not None:
+            return not self.is_concentration
         
         return False
     
     @property
     def is_concentration(self) -> bool:
         """Check if this is a concentration (mass/volume or similar)."""
-        return self._check_if_concentration()
+        self._resolve_units()
+        return self._is_concentration
+    
+    @property
+    def numerator_category(self) -> Optional[str]:
+        """Category of the numerator base unit (weight, volume, ...), or None if unknown."""
+        self._resolve_units()
+        return self._numerator_category
+    
+    @property
+    def denominator_category(self) -> Optional[str]:
+        """Category of the denominator base unit (area, length, ...), or None if unknown or absent."""
+        self._resolve_units()
+        return self._denominator_category
+    
+    def _resolve_units(self):
+        """Look up base unit categories and the concentration flag once."""
+        if self._resolved:
+            return
+        
+        repo = UOMRepository.get_instance()
+        num_unit = repo.get_base_unit(self.numerator)
+        den_unit = repo.get_base_unit(self.denominator) if self.denominator is not None else None
+        self._numerator_category = num_unit.category if num_unit else None
+        self._denominator_category = den_unit.category if den_unit else None
+        self._is_concentration = self._check_if_concentration()
+        self._resolved = True
     
     def _check_if_concentration(self) -> bool:
         """Internal method to check if this represents a concentration."""
@@ -67,16 +121,9 @@ class CompositeUOM:
         if self.denominator is None:
             return self.numerator in ['%', 'g/l', 'lb/gal']
         
-        # For compound units, check categories - need repository instance
-        from data.repository_UOM import UOMRepository
-        repo = UOMRepository.get_instance()
-        num_unit = repo.get_base_unit(self.numerator)
-        den_unit = repo.get_base_unit(self.denominator)
-        
-        if num_unit and den_unit:
-            return ((num_unit.category == 'weight' and den_unit.category == 'volume') or 
-                    (num_unit.category == 'weight' and den_unit.category == 'weight'))
-        return False
+        # For compound units, check categories
+        return ((self._numerator_category == 'weight' and self._denominator_category == 'volume') or 
+                (self._numerator_category == 'weight' and self._denominator_category == 'weight'))
 
 class UOMRepository:
     """Repository for base units and composite UOM operations with EIQ capabilities."""
@@ -93,8 +140,14 @@ class UOMRepository:
         self.csv_file = UOM_CSV
         self._base_units: Dict[str, BaseUnit] = {}
         self._converter = None  # Will be initialized after loading units
+        # Compiled conversion plans: (from, to, preferences fingerprint) -> multiplier or error message
+        self._conversion_plans: "OrderedDict[Tuple, Tuple[Optional[float], Optional[str]]]" = OrderedDict()
+        self._conversion_plans_lock = threading.RLock()  # Conversions also run on the EIQ calculation worker thread
         self._load_base_units()
         self._initialize_converter()
+        
+        # Plans compiled for replaced row spacing/seeding rate preferences would never be hit again
+        get_preferences_manager().signals.preference_changed.connect(self._on_preference_changed)
     
     def _load_base_units(self):
         """Load base units from CSV."""
@@ -111,7 +164,6 @@ class UOMRepository:
                     )
                     self._base_units[unit.uom.lower()] = unit
         except Exception as e:
-            from common.widgets.tracer import calculation_tracer
             calculation_tracer.log_substep(f"Error loading base units: {e}", level=1)
             self._base_units = {}
     
@@ -129,8 +181,64 @@ class UOMRepository:
     
     def convert_composite_uom(self, value: float, from_uom: CompositeUOM, to_uom: CompositeUOM, 
                             user_preferences: dict = None) -> float:
-        """Convert between composite UOMs, handling special cases with validation."""
-        return self._converter.convert_composite_uom(value, from_uom, to_uom, user_preferences)
+        """
+        Convert between composite UOMs, handling special cases with validation.
+        
+        Every supported conversion (including row spacing and seeding rate ones) is linear
+        in the value, so the converter runs once per (from, to, preferences) to compile a
+        multiplier. Later conversions of the same pair are a single multiplication.
+        While calculations are traced, the converter runs every time so each conversion
+        logs its steps.
+        """
+        if calculation_tracer.enabled:
+            return self._converter.convert_composite_uom(value, from_uom, to_uom, user_preferences)
+        
+        key = (from_uom.original_string, to_uom.original_string, self._preferences_fingerprint(user_preferences))
+        with self._conversion_plans_lock:
+            plan = self._conversion_plans.get(key)
+            
+            if plan is None:
+                plan = self._compile_conversion_plan(from_uom, to_uom, user_preferences)
+                self._conversion_plans[key] = plan
+                if len(self._conversion_plans) > CONVERSION_PLAN_CACHE_SIZE:
+                    self._conversion_plans.popitem(last=False)
+            else:
+                self._conversion_plans.move_to_end(key)
+        
+        factor, error = plan
+        if error is not None:
+            raise ValueError(error)
+        return value * factor
+    
+    def clear_conversion_cache(self):
+        """Drop all compiled conversion plans."""
+        with self._conversion_plans_lock:
+            self._conversion_plans.clear()
+    
+    def _on_preference_changed(self, section: str, key: str, value):
+        """Drop the compiled plans when a preference used by conversions changes."""
+        if section == "user_preferences" and key in _PREFERENCE_KEYS:
+            self.clear_conversion_cache()
+    
+    def _compile_conversion_plan(self, from_uom: CompositeUOM, to_uom: CompositeUOM,
+                                 user_preferences: dict = None) -> Tuple[Optional[float], Optional[str]]:
+        """
+        Run the full conversion for a unit value to get the pair's multiplier.
+        
+        Returns:
+            Tuple of (multiplier, None), or (None, error message) if the conversion is not supported
+        """
+        try:
+            return self._converter.convert_composite_uom(1.0, from_uom, to_uom, user_preferences), None
+        except ValueError as e:
+            return None, str(e)
+    
+    @staticmethod
+    def _preferences_fingerprint(user_preferences: dict = None) -> Optional[Tuple]:
+        """Get a hashable fingerprint of the preferences used by conversions."""
+        if not user_preferences:
+            return None
+        return tuple(user_preferences.get(key) for key in _PREFERENCE_KEYS)
     
     def convert_concentration(self, 
                             value: float, 
@@ -195,4 +303,4 @@ class UOMRepository:
         """
         return self._converter.validate_eiq_calculation_inputs(
             rate, rate_uom, ai_concentration, ai_concentration_uom, ai_eiq
-        )
\ No newline at end of file
+        )
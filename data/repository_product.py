@@ -7,8 +7,9 @@ product data, with CSV loading and caching for performance optimization.
 
 import csv
 from PySide6.QtWidgets import QMessageBox
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from data.model_product import Product
+from data.catalog_cache import load_catalog
 from common.utils import resource_path
 
 products_csv = resource_path("data/csv_products.csv")
@@ -40,6 +41,12 @@ class ProductRepository:
         self._current_country = None  # Current country filter
         self._current_region = None  # Current region filter
         
+        # Hash indexes over the filtered products (rebuilt with the filtered cache)
+        self._index_by_name: Dict[str, List[Product]] = {}
+        self._index_by_name_method: Dict[Tuple[str, str], List[Product]] = {}
+        self._index_by_regulator_number: Dict[str, List[Product]] = {}
+        self._index_by_type: Dict[str, List[Product]] = {}
+        
     def get_all_products(self) -> List[Product]:
         """Get all products, loading from CSV if needed."""
         if self._all_products is None:
@@ -57,7 +64,11 @@ class ProductRepository:
         if country != self._current_country or region != self._current_region:
             self._current_country = country
             self._current_region = region
-            self._filtered_products = None  # Invalidate cache
+            self._invalidate_filtered_cache()
+    
+    def get_filters(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get the current (country, region) filters."""
+        return self._current_country, self._current_region
     
     def apply_filters(self, country: Optional[str], region: Optional[str]) -> List[Product]:
         """Apply filters and return filtered products."""
@@ -66,6 +77,7 @@ class ProductRepository:
         # If no country filter, return all products
         if not country or country == "None of these":
             self._filtered_products = products
+            self._build_indexes(products)
             return products
         
         # Start with country filter
@@ -88,31 +100,114 @@ class ProductRepository:
                 filtered = [p for p in filtered if p.region == region or not p.region]
         
         self._filtered_products = filtered
+        self._build_indexes(filtered)
         return filtered
     
+    def find_product(self, product_name: str, application_method: Optional[str] = None) -> Optional[Product]:
+        """
+        Find a product by name in the filtered products.
+        
+        Args:
+            product_name: Product name to look up
+            application_method: Optional application method to disambiguate
+                products sharing the same name
+            
+        Returns:
+            The first matching Product (in catalog order), or None if not found
+        """
+        if not product_name:
+            return None
+        
+        if application_method is not None:
+            matches = self.get_products_by_name_and_method(product_name, application_method)
+        else:
+            matches = self.get_products_by_name(product_name)
+        return matches[0] if matches else None
+    
+    def get_products_by_name(self, product_name: str) -> List[Product]:
+        """Get all filtered products with the given name."""
+        self.get_filtered_products()  # Ensure indexes are built
+        return self._index_by_name.get(product_name, [])
+    
+    def get_products_by_name_and_method(self, product_name: str, application_method: str) -> List[Product]:
+        """Get all filtered products with the given name and application method."""
+        self.get_filtered_products()
+        return self._index_by_name_method.get((product_name, application_method), [])
+    
+    def get_products_by_regulator_number(self, regulator_number: str) -> List[Product]:
+        """Get all filtered products with the given registration number."""
+        self.get_filtered_products()
+        return self._index_by_regulator_number.get(regulator_number, [])
+    
+    def get_products_by_type(self, product_type: str) -> List[Product]:
+        """Get all filtered products of the given type (e.g., Herbicide)."""
+        self.get_filtered_products()
+        return self._index_by_type.get(product_type, [])
+    
+    def get_product_types(self) -> List[str]:
+        """Get the sorted list of product types present in the filtered products."""
+        self.get_filtered_products()
+        return sorted(product_type for product_type in self._index_by_type if product_type)
+    
+    def _build_indexes(self, products: List[Product]) -> None:
+        """Build the lookup indexes for the given (filtered) products, preserving catalog order."""
+        by_name = {}
+        by_name_method = {}
+        by_regulator_number = {}
+        by_type = {}
+        
+        for product in products:
+            by_name.setdefault(product.product_name, []).append(product)
+            by_name_method.setdefault((product.product_name, product.application_method), []).append(product)
+            if product.regulator_number:
+                by_regulator_number.setdefault(product.regulator_number, []).append(product)
+            by_type.setdefault(product.product_type, []).append(product)
+        
+        self._index_by_name = by_name
+        self._index_by_name_method = by_name_method
+        self._index_by_regulator_number = by_regulator_number
+        self._index_by_type = by_type
+    
+    def _invalidate_filtered_cache(self) -> None:
+        """Drop the filtered products and their indexes so they are rebuilt on next access."""
+        self._filtered_products = None
+        self._index_by_name = {}
+        self._index_by_name_method = {}
+        self._index_by_regulator_number = {}
+        self._index_by_type = {}
+    
     def _load_products(self) -> None:
-        """Load all products from the CSV file."""
+        """Load all products from the catalog snapshot, or from the CSV file if it changed."""
         try:
-            with open(self.csv_file, 'r', newline='', encoding='cp1252') as csvfile:
-                reader = csv.DictReader(csvfile)
-                cleaned_rows = [
-                    {k.strip(): v.strip() if isinstance(v, str) else v 
-                     for k, v in row.items() if k is not None}
-                    for row in reader
-                ]
-                
-            self._all_products = [Product.from_dict(row) for row in cleaned_rows]
+            self._all_products = load_catalog("products", self.csv_file, self._parse_products_csv)
             
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error loading product data: {e}")
             self._all_products = []
     
+    @staticmethod
+    def _parse_products_csv(csv_file: str) -> List[Product]:
+        """Parse the products CSV file into Product objects."""
+        with open(csv_file, 'r', newline='', encoding='cp1252') as csvfile:
+            reader = csv.DictReader(csvfile)
+            cleaned_rows = [
+                {k.strip(): v.strip() if isinstance(v, str) else v 
+                 for k, v in row.items() if k is not None}
+                for row in reader
+            ]
+            
+        return [Product.from_dict(row) for row in cleaned_rows]
+    
     def refresh_from_csv(self) -> bool:
         """Refresh data from CSV and invalidate caches."""
         try:
             self._all_products = None
-            self._filtered_products = None
+            self._invalidate_filtered_cache()
             self.get_all_products()  # Reload data
+            
+            # Drop EIQ standardization results memoized for the previous catalog
+            from common.calculations.layer_2_uom_std import EIQUOMStandardizer
+            EIQUOMStandardizer.clear_standardized_ai_cache()
             return True
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error refreshing product data: {e}")
@@ -153,14 +153,7 @@ class SingleProductCalculatorTab(QWidget):
         
         try:
             # Get product from FILTERED products instead of all products
-            filtered_products = self.products_repo.get_filtered_products()
-            self.current_product = None
-            
-            # Find the product in the filtered list
-            for product in filtered_products:
-                if product.product_name == product_name:
-                    self.current_product = product
-                    break
+            self.current_product = self.products_repo.find_product(product_name)
             
             if not self.current_product:
                 raise ValueError(f"Product '{product_name}' not found in filtered products")
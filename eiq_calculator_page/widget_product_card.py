@@ -128,14 +128,7 @@ class ProductCard(QFrame):
         try:
             # Get product from FILTERED products instead of all products
             products_repo = ProductRepository.get_instance()
-            filtered_products = products_repo.get_filtered_products()
-            self.product = None
-            
-            # Find the product in the filtered list
-            for product in filtered_products:
-                if product.product_name == product_name:
-                    self.product = product
-                    break
+            self.product = products_repo.find_product(product_name)
             
             # If product doesn't exist, clear and return
             if not self.product:
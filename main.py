@@ -6,7 +6,17 @@ This module serves as the entry point for the App.
 It initializes the application, sets up the main window, and starts the event loop.
 """
 
-import os, sys
+import multiprocessing, os, sys
+
+if __name__ == "__main__":
+    # Keep compiled bytecode in the user cache directory across runs (before importing the app modules).
+    # Nothing is written into the app tree until the cache is configured. Worker processes load this
+    # file as __mp_main__ and get the cache directory from their environment instead.
+    dont_write_bytecode, sys.dont_write_bytecode = sys.dont_write_bytecode, True
+    from common.bytecode_cache import configure_bytecode_cache
+    sys.dont_write_bytecode = dont_write_bytecode
+    configure_bytecode_cache()
+
 from PySide6.QtCore import QDir, QTimer
 from PySide6.QtWidgets import QApplication, QComboBox, QDoubleSpinBox
 from common.utils import load_config
@@ -50,4 +60,6 @@ def main() -> int:
     return sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Worker processes (e.g. multi-file import) re-launch the frozen executable
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
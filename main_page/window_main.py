@@ -2,9 +2,8 @@
 Main application window for the EIQ & STIR App
 """
 
-import os
-import shutil
-from PySide6.QtWidgets import QMainWindow, QStackedWidget, QVBoxLayout, QHBoxLayout, QFrame, QWidget, QLabel, QMessageBox
+import importlib
+from PySide6.QtWidgets import QMainWindow, QStackedWidget, QVBoxLayout, QHBoxLayout, QFrame, QWidget, QLabel
 from PySide6.QtCore import Signal, Qt
 
 from common.styles import YELLOW_BAR_STYLE
@@ -12,11 +11,16 @@ from common.utils import load_config, open_user_manual
 from common.widgets.header_frame_buttons import create_button
 from data.repository_product import ProductRepository
 from main_page.page_home import HomePage
-from products_page.page_products import ProductsPage
-from eiq_calculator_page.page_eiq_calculator import EiqCalculatorPage
-from season_planner_page.page_scenarios_manager import ScenariosManagerPage
-from season_planner_page.page_sceanrios_comparison import ScenariosComparisonPage
-from STIR.page_STIR_calculator import STIRCalculatorPage
+
+# Pages built on first navigation: stacked widget index -> (module, class name).
+# Their modules are only imported when the page is first opened.
+LAZY_PAGES = {
+    1: ("products_page.page_products", "ProductsPage"),
+    2: ("season_planner_page.page_scenarios_manager", "ScenariosManagerPage"),
+    3: ("eiq_calculator_page.page_eiq_calculator", "EiqCalculatorPage"),
+    4: ("season_planner_page.page_sceanrios_comparison", "ScenariosComparisonPage"),
+    5: ("STIR.page_STIR_calculator", "STIRCalculatorPage"),
+}
 
 
 class MainWindow(QMainWindow):
@@ -36,6 +40,7 @@ class MainWindow(QMainWindow):
         self.updating_products = False
         self.selected_country = None
         self.selected_region = None
+        self._pages = {}  # Constructed pages by stacked widget index
         
         self.setup_window()
         self.init_ui()
@@ -72,30 +77,56 @@ class MainWindow(QMainWindow):
         self.stacked_widget.setCurrentIndex(0)
 
     def _create_pages(self):
-        """Create and add all pages to the stacked widget."""
+        """Create the home page and placeholders for the pages built on first use."""
         # Create and add the home page (index 0)
         self.home_page = HomePage(self)
         self.stacked_widget.addWidget(self.home_page)
+        self._pages[0] = self.home_page
 
-        # Create and add the products page (index 1)
-        self.products_page = ProductsPage(self)
-        self.stacked_widget.addWidget(self.products_page)
-        
-        # Create and add the scenarios manager page (index 2) 
-        self.scenarios_manager_page = ScenariosManagerPage(self)
-        self.stacked_widget.addWidget(self.scenarios_manager_page)
-        
-        # Create and add the EIQ calculator page (index 3)
-        self.eiq_calculator_page = EiqCalculatorPage(self)
-        self.stacked_widget.addWidget(self.eiq_calculator_page)
+        # Empty placeholders keep the page indexes stable until each page is built
+        for _ in LAZY_PAGES:
+            self.stacked_widget.addWidget(QWidget())
 
-        # Create and add the scenarios comparison page (index 4)
-        self.scenarios_comparison_page = ScenariosComparisonPage(self)
-        self.stacked_widget.addWidget(self.scenarios_comparison_page)
-        
-        # Create and add the STIR calculator page (index 5)
-        self.stir_calculator_page = STIRCalculatorPage(self)
-        self.stacked_widget.addWidget(self.stir_calculator_page)
+    def get_page(self, page_index):
+        """Get the page at the given index, constructing it on first access."""
+        if page_index not in self._pages and page_index in LAZY_PAGES:
+            module_name, class_name = LAZY_PAGES[page_index]
+            page_class = getattr(importlib.import_module(module_name), class_name)
+            page = page_class(self)
+            
+            # Swap the placeholder for the real page
+            placeholder = self.stacked_widget.widget(page_index)
+            self.stacked_widget.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.stacked_widget.insertWidget(page_index, page)
+            self._pages[page_index] = page
+            
+        return self._pages.get(page_index)
+
+    @property
+    def products_page(self):
+        """Products page (index 1)."""
+        return self.get_page(1)
+
+    @property
+    def scenarios_manager_page(self):
+        """Season planner scenarios manager page (index 2)."""
+        return self.get_page(2)
+
+    @property
+    def eiq_calculator_page(self):
+        """EIQ calculator page (index 3)."""
+        return self.get_page(3)
+
+    @property
+    def scenarios_comparison_page(self):
+        """Scenarios comparison page (index 4)."""
+        return self.get_page(4)
+
+    @property
+    def stir_calculator_page(self):
+        """STIR calculator page (index 5)."""
+        return self.get_page(5)
 
     def _create_yellow_bar(self):
         """Create the yellow bar at the bottom with user manual and links."""
@@ -163,14 +194,14 @@ class MainWindow(QMainWindow):
         # 2: Season Planner
         # 3: EIQ Calculator
         # 4: Scenarios Comparison
-        # 5: Reserved
-        # 6: STIR Calculator
+        # 5: STIR Calculator
         
         # If we're currently on the unified home page (index 0), check for unsaved preferences
         if self.stacked_widget.currentIndex() == 0 and self.home_page.preferences_row.has_unsaved_changes:
             if not self.home_page.check_unsaved_preferences():
                 return  # Don't navigate if the user cancelled
         
+        self.get_page(page_index)  # Build the page on first visit
         self.stacked_widget.setCurrentIndex(page_index)
 
     def apply_filters(self, country, region):
@@ -199,11 +230,11 @@ class MainWindow(QMainWindow):
         self.apply_filters(self.selected_country, region)
 
     def refresh_pages(self):
-        """Refresh all pages to get product data up to date with filters."""
-        self.eiq_calculator_page.refresh_product_data()
-        self.products_page.refresh_product_data()
-        self.scenarios_manager_page.refresh_product_data()
-        # in the future add any new page that needs to be refreshed
+        """Refresh the constructed pages to get product data up to date with filters."""
+        # Pages not built yet will load the current filtered data when constructed
+        for page in list(self._pages.values()):
+            if hasattr(page, 'refresh_product_data'):
+                page.refresh_product_data()
 
     def apply_config_preferences(self):
         """Apply user preferences from config."""
@@ -225,27 +256,17 @@ class MainWindow(QMainWindow):
         self.apply_filters(default_country, default_region)
 
     def closeEvent(self, event):
-        """Handle the close event, clean up __pycache__ directories."""
+        """
+        Handle the close event.
+        
+        Compiled bytecode is kept for the next launch; clearing it is a maintenance
+        action (python -m common.bytecode_cache --clear).
+        """
         # If we're on the home page, check for unsaved preferences
         if self.stacked_widget.currentIndex() == 0 and self.home_page.preferences_row.has_unsaved_changes:
             if not self.home_page.check_unsaved_preferences():
                 event.ignore()  # Cancel closing if the user cancelled
                 return
-        
-        try:
-            # Find and remove all __pycache__ directories 
-            app_dir = os.path.dirname(os.path.abspath(__file__))
-            root_dir = os.path.dirname(app_dir)
-            for dirpath, dirnames, _ in os.walk(root_dir):
-                for dirname in dirnames:
-                    if dirname == "__pycache__":
-                        cache_path = os.path.join(dirpath, dirname)
-                        try:
-                            shutil.rmtree(cache_path)
-                        except Exception:
-                            pass
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Error during cache cleanup: {e}")
 
         # Accept the close event
-        event.accept()
\ No newline at end of file
+        event.accept()
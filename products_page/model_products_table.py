@@ -0,0 +1,357 @@
+"""
+Products Table Model for the LORENZO POZZI EIQ App.
+
+Qt model over the repository's product list for the products page, plus the proxy
+model that filters and sorts it. Display, search and sort values are computed once
+per product when the products are set, so filtering and sorting never touch widgets.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt, QThreadPool, Signal
+
+# Plain int roles: data() runs for every cell and sort comparison, and comparing
+# against the Qt enum members is much slower than comparing ints
+_DISPLAY_ROLE = Qt.DisplayRole.value
+_CHECK_STATE_ROLE = Qt.CheckStateRole.value
+_SORT_ROLE = Qt.UserRole.value
+_ALIGNMENT_ROLE = Qt.TextAlignmentRole.value
+
+# Products scanned between checks for a newer filter request
+_CANCEL_CHECK_INTERVAL = 256
+
+
+def format_groups(ai_groups) -> str:
+    """Format mode of action groups for display, consolidated by organization."""
+    if not ai_groups:
+        return "--"
+    
+    # Consolidate groups by organization
+    org_groups = {}
+    for group_text in ai_groups:
+        if not group_text:
+            continue
+        for part in group_text.split(', '):
+            if ':' in part:
+                org, code = part.split(':', 1)
+                org = org.strip()
+                code = code.strip()
+                if org not in org_groups:
+                    org_groups[org] = []
+                if code not in org_groups[org]:
+                    org_groups[org].append(code)
+    
+    # If no valid groups were found after processing, return "--"
+    if not org_groups:
+        return "--"
+    
+    return "; ".join(f"{org}: {', '.join(codes)}" for org, codes in org_groups.items())
+
+
+def matching_products(search_values: Sequence[Tuple[str, ...]], filters: List[Tuple[int, str]],
+                      is_cancelled: Callable[[], bool] = None) -> Optional[Set[int]]:
+    """
+    Find the products matching all filters in a single pass.
+    
+    Args:
+        search_values: Lowercased cell texts per product
+        filters: List of (column_index, lowercase filter_text) tuples
+        is_cancelled: Optional callable polled during the scan; the scan stops when it returns True
+    
+    Returns:
+        set: Indexes of the products containing every filter text in its column,
+             or None if the scan was cancelled
+    """
+    filters = [(column, text) for column, text in filters if text]
+    matches = set()
+    for product_index, cells in enumerate(search_values):
+        if is_cancelled and product_index % _CANCEL_CHECK_INTERVAL == 0 and is_cancelled():
+            return None
+        if all(text in cells[column] for column, text in filters):
+            matches.add(product_index)
+    return matches
+
+
+class ProductTableModel(QAbstractTableModel):
+    """
+    Table model for the products list.
+    
+    Column 0 is a checkbox selecting products for comparison; the other columns are
+    read-only product fields. Cell values are stored per product (in the order the
+    products were set) and rows map to products through a permutation, so sorting
+    only reorders that permutation.
+    """
+    
+    selection_changed = Signal(list)  # Selected products, in the order they were checked
+    
+    # Define the exact columns we want in the exact order
+    COLUMNS = [
+        {"key": "checkbox", "header": "", "width": 25, "resize": "fixed"},
+        {"key": "type", "header": "Type", "width": 150, "resize": "fixed"},
+        {"key": "name", "header": "Name", "width": None, "resize": "stretch"},
+        {"key": "use", "header": "Use", "width": 200, "resize": "fixed"},
+        {"key": "registrant", "header": "Registrant", "width": None, "resize": "stretch"},
+        {"key": "formulation", "header": "Formulation", "width": 120, "resize": "fixed"},
+        {"key": "REI (h)", "header": "REI (h)", "width": 80, "resize": "fixed"},
+        {"key": "PHI (d)", "header": "PHI (d)", "width": 80, "resize": "fixed"},
+        {"key": "AIs", "header": "AIs", "width": 200, "resize": "fixed"},
+        {"key": "Groups", "header": "Groups", "width": 200, "resize": "fixed"},
+    ]
+    
+    NUMERIC_COLUMNS = {"REI (h)", "PHI (d)"}
+    
+    def __init__(self, parent=None):
+        """Initialize the products table model."""
+        super().__init__(parent)
+        self._products = []
+        self._display_values: List[Tuple[str, ...]] = []  # Cell texts per product
+        self._search_values: List[Tuple[str, ...]] = []   # Lowercased cell texts per product
+        self._sort_values: List[Tuple[Any, ...]] = []     # Sort keys per product
+        self._row_products: List[int] = []                # Product index shown at each row
+        self._checked: Dict[int, Any] = {}                # Checked product index -> product, in check order
+    
+    # --- QAbstractTableModel Interface ---
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Return the number of products."""
+        if parent.isValid():
+            return 0
+        return len(self._row_products)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Return the number of columns."""
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """Return header data for the table."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.COLUMNS):
+            return self.COLUMNS[section]["header"]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Return data for the given index and role."""
+        if not index.isValid():
+            return None
+        
+        product_index, col = self._row_products[index.row()], index.column()
+        if role == _DISPLAY_ROLE:
+            return self._display_values[product_index][col]
+        if role == _SORT_ROLE:
+            return self._sort_values[product_index][col]
+        if col == 0:
+            if role == _CHECK_STATE_ROLE:
+                return Qt.Checked if product_index in self._checked else Qt.Unchecked
+            if role == _ALIGNMENT_ROLE:
+                return Qt.AlignCenter
+        return None
+    
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        """Toggle the selection checkbox of a product."""
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        
+        product_index = self._row_products[index.row()]
+        if Qt.CheckState(value) == Qt.Checked:
+            self._checked[product_index] = self._products[product_index]
+        else:
+            self._checked.pop(product_index, None)
+        
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.selection_changed.emit(self.get_selected_products())
+        return True
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """Return flags for the given index."""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        """Sort the rows by the precomputed keys of a column (the checkbox column is not sortable)."""
+        if column <= 0 or column >= len(self.COLUMNS):
+            return
+        
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self._row_products
+        
+        sort_values = self._sort_values
+        self._row_products = sorted(range(len(self._products)), key=lambda product_index: sort_values[product_index][column],
+                                    reverse=order == Qt.DescendingOrder)
+        
+        # Keep persistent indexes (e.g. the current row) on the same products
+        new_row_of = {product_index: row for row, product_index in enumerate(self._row_products)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_row_of[old_rows[index.row()]], index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        
+        self.layoutChanged.emit()
+    
+    # --- Public Interface ---
+    
+    def set_products(self, products):
+        """Replace the products, precomputing display, search and sort values."""
+        self.beginResetModel()
+        
+        self._products = list(products)
+        self._checked = {}
+        self._display_values = [self._get_display_values(product) for product in self._products]
+        self._search_values = [tuple(text.lower() for text in cells) for cells in self._display_values]
+        self._sort_values = [self._get_sort_values(cells) for cells in self._display_values]
+        self._row_products = list(range(len(self._products)))
+        
+        self.endResetModel()
+    
+    @property
+    def search_values(self) -> List[Tuple[str, ...]]:
+        """Lowercased cell texts per product index, for filtering (replaced, never mutated)."""
+        return self._search_values
+    
+    def product_index(self, row: int) -> int:
+        """Get the index of the product shown at a row."""
+        return self._row_products[row]
+    
+    def get_selected_products(self) -> list:
+        """Get the checked products, in the order they were checked."""
+        return list(self._checked.values())
+    
+    def clear_selection(self):
+        """Uncheck all products."""
+        self._checked = {}
+        if self._products:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._products) - 1, 0), [Qt.CheckStateRole])
+        self.selection_changed.emit([])
+    
+    # --- Private Methods ---
+    
+    def _get_display_values(self, product) -> Tuple[str, ...]:
+        """Get the cell texts of a product."""
+        values = []
+        for col_config in self.COLUMNS:
+            col_key = col_config["key"]
+            
+            if col_key == "checkbox":
+                values.append("")
+            elif col_key == "AIs":
+                # Show all active ingredients
+                values.append(", ".join(product.active_ingredients) if product.active_ingredients else "")
+            elif col_key == "Groups":
+                # Show mode of action groups
+                values.append(format_groups(product.get_ai_groups()))
+            elif col_key in self.NUMERIC_COLUMNS:
+                value = product.get_field(col_key)
+                values.append(str(value) if value is not None and value != "" else "--")
+            else:
+                # Standard product field - read the mapped attribute directly
+                value = product.get_field(col_key)
+                values.append(str(value) if value is not None else "")
+        return tuple(values)
+    
+    def _get_sort_values(self, cells: Tuple[str, ...]) -> Tuple[Any, ...]:
+        """Get the sort keys of a product: numbers for numeric columns, text otherwise."""
+        keys = []
+        for col_config, text in zip(self.COLUMNS, cells):
+            if col_config["key"] in self.NUMERIC_COLUMNS:
+                try:
+                    keys.append(float(text) if text and text != "--" else 0.0)
+                except ValueError:
+                    keys.append(0.0)
+            else:
+                keys.append(text)
+        return tuple(keys)
+
+
+class ProductFilterProxyModel(QSortFilterProxyModel):
+    """
+    Proxy model filtering products by column text filters.
+    
+    All filters combine in one pass over the precomputed lowercased texts; the accepted
+    products are then looked up in a set while Qt rebuilds the proxy mapping. Sorting is
+    forwarded to the source model, which sorts its precomputed keys in Python instead of
+    calling back into data() for every comparison.
+    
+    set_filters_async runs the scan on a worker thread and applies the result in one batch
+    on the GUI thread; every new request supersedes (and cancels) the previous ones.
+    """
+    
+    _filter_ready = Signal(int, object)  # (request generation, matching product indexes)
+    
+    def __init__(self, parent=None):
+        """Initialize the proxy model."""
+        super().__init__(parent)
+        self._products_model: Optional[ProductTableModel] = None
+        self._visible_products: Optional[Set[int]] = None  # None shows every product
+        self._filter_generation = 0  # Incremented by every filter request
+        
+        # One worker: superseded requests queued behind the running one exit immediately
+        self._filter_pool = QThreadPool(self)
+        self._filter_pool.setMaxThreadCount(1)
+        self._filter_ready.connect(self._apply_filter_result)
+    
+    def setSourceModel(self, source_model: ProductTableModel):
+        """Set the products model to filter."""
+        super().setSourceModel(source_model)
+        self._products_model = source_model
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder):
+        """Sort through the source model."""
+        self._products_model.sort(column, order)
+    
+    def set_filters(self, filters: List[Tuple[int, str]]):
+        """
+        Show only the products matching all filters.
+        
+        Args:
+            filters: List of (column_index, lowercase filter_text) tuples
+        """
+        self._filter_generation += 1  # Discard any pending asynchronous result
+        active_filters = [(column, text) for column, text in filters if text]
+        if not active_filters:
+            self.set_visible_products(None)
+            return
+        self.set_visible_products(matching_products(self._products_model.search_values, active_filters))
+    
+    def set_filters_async(self, filters: List[Tuple[int, str]]):
+        """
+        Filter on a worker thread, applying the result when it is ready unless superseded.
+        
+        Args:
+            filters: List of (column_index, lowercase filter_text) tuples
+        """
+        self._filter_generation += 1
+        generation = self._filter_generation
+        active_filters = [(column, text) for column, text in filters if text]
+        if not active_filters:
+            self.set_visible_products(None)
+            return
+        
+        # The search values list is replaced, never mutated, so the worker can scan this snapshot
+        search_values = self._products_model.search_values
+        is_cancelled = lambda: generation != self._filter_generation
+        
+        def evaluate():
+            if is_cancelled():
+                return
+            product_indexes = matching_products(search_values, active_filters, is_cancelled)
+            if product_indexes is not None:
+                self._filter_ready.emit(generation, product_indexes)
+        
+        self._filter_pool.start(evaluate)
+    
+    def _apply_filter_result(self, generation: int, product_indexes: Set[int]):
+        """Apply a worker's result on the GUI thread if it is still the latest request."""
+        if generation == self._filter_generation:
+            self.set_visible_products(product_indexes)
+    
+    def set_visible_products(self, product_indexes: Optional[Set[int]]):
+        """Show only the given product indexes (None shows all)."""
+        self._visible_products = product_indexes
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Accept the rows whose product matches the current filters."""
+        return self._visible_products is None or self._products_model.product_index(source_row) in self._visible_products
@@ -82,12 +82,8 @@ class ProductsListTab(QWidget):
                 
         self.all_products = products
         
-        # Get columns from first product
-        first_product = products[0].to_dict()
-        column_keys = list(first_product.keys())
-        
         # Set products in the table with default configuration
-        self.products_table.set_products(products, column_keys)
+        self.products_table.set_products(products)
         
         # Retrieve visible columns and mapping for filters
         visible_columns, field_to_column_map = self.products_table.get_visible_columns()
@@ -109,8 +105,7 @@ class ProductsListTab(QWidget):
         self.filter_container.reset_filters()
         
         # Show all rows in the table
-        for row in range(self.products_table.rowCount()):
-            self.products_table.showRow(row)
+        self.products_table.show_all_rows()
     
     def on_selection_changed(self, selected_products):
         """Handle selection changes from the table."""
@@ -7,7 +7,7 @@ and compact filtering interface.
 
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QComboBox, 
                                QLabel, QLineEdit, QPushButton, QFrame)
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QTimer
 
 from common.styles import FILTER_CHIP_STYLE, get_medium_font, get_subtitle_font
 from common.widgets.header_frame_buttons import create_button
@@ -116,8 +116,9 @@ class FiltersRow(QWidget):
     a maximum of 4 filters.
     """
     
-    filters_changed = Signal()  # Signal emitted when any filter changes
+    filters_changed = Signal()  # Signal emitted when any filter changes (debounced)
     MAX_FILTERS = 4  # Maximum number of filter chips allowed
+    DEBOUNCE_MS = 150  # Quiet time after the last change before filters_changed is emitted
     
     def __init__(self, parent=None):
         """Initialize the filter container."""
@@ -125,6 +126,13 @@ class FiltersRow(QWidget):
         self.filter_chips = []
         self.visible_columns = []
         self.field_to_column_map = {}
+        
+        # Typing emits one change per keystroke - only apply once the user pauses
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self._debounce_timer.timeout.connect(self.filters_changed.emit)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -226,8 +234,8 @@ class FiltersRow(QWidget):
             self.add_filter_button.setText(f"Add Filter")
     
     def on_filter_changed(self):
-        """Handle changes to any filter criteria."""
-        self.filters_changed.emit()
+        """Handle changes to any filter criteria, restarting the debounce window."""
+        self._debounce_timer.start()
     
     def get_filter_criteria(self):
         """
@@ -245,6 +253,8 @@ class FiltersRow(QWidget):
     
     def reset_filters(self):
         """Reset all filter chips."""
+        self._debounce_timer.stop()
+        
         # Clear existing filter chips
         while self.filter_chips:
             chip = self.filter_chips.pop()
@@ -27,15 +27,7 @@ class ProductTypeDelegate(QStyledItemDelegate):
         """Load unique product types from repository."""
         try:
             products_repo = ProductRepository.get_instance()
-            filtered_products = products_repo.get_filtered_products()
-            
-            # Extract unique product types
-            types = set()
-            for product in filtered_products:
-                if product.product_type:
-                    types.add(product.product_type)
-            
-            self._product_types = sorted(list(types))
+            self._product_types = products_repo.get_product_types()
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Error loading product types: {e}")
             self._product_types = []
@@ -172,8 +172,8 @@ class UOMDelegate(QStyledItemDelegate):
             user_preferences = get_preferences_manager().get_section("user_preferences", {})
             
             # Create composite UOM objects
-            from_composite = CompositeUOM(from_uom)
-            to_composite = CompositeUOM(to_uom)
+            from_composite = CompositeUOM.intern(from_uom)
+            to_composite = CompositeUOM.intern(to_uom)
             
             # Perform conversion
             converted_value = uom_repo.convert_composite_uom(
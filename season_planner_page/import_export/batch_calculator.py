@@ -0,0 +1,197 @@
+"""
+Headless batch EIQ calculator for grower Excel files.
+
+Parses every workbook in a directory with ExcelScenarioParser, computes the season
+Field EIQ the same way the Season Planner does (including estimated EIQ for products
+without AI data) and writes one summary row per file. No display is needed.
+
+Usage:
+    python -m season_planner_page.import_export.batch_calculator test_data -o summary.csv
+    python -m season_planner_page.import_export.batch_calculator growers/ -o summary.json --workers 8
+"""
+
+import argparse, csv, json, os, sys, time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from typing import List, Optional
+
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm")
+
+@dataclass
+class SeasonSummary:
+    """Season EIQ result for one workbook."""
+    file: str
+    status: str = "ok"                  # "ok" or "error"
+    scenario_name: str = ""
+    grower_name: str = ""
+    field_name: str = ""
+    crop_year: Optional[int] = None
+    field_area: float = 0.0
+    field_area_uom: str = ""
+    applications: int = 0
+    estimated_applications: int = 0     # Applications whose EIQ is the estimate average
+    unmatched_products: List[str] = field(default_factory=list)
+    season_eiq: float = 0.0             # Area-weighted season Field EIQ [eiq/ha]
+    seconds: float = 0.0
+    messages: List[str] = field(default_factory=list)  # Warnings the GUI would have shown in message boxes
+
+# Warnings raised while processing the current file (one file at a time per process)
+_messages: List[str] = []
+
+
+def _record_message(parent, title, text, *args, **kwargs):
+    """Stand-in for the QMessageBox static methods: collect the message instead of showing a dialog."""
+    _messages.append(f"{title}: {text}")
+    return 0
+
+
+def pop_messages() -> List[str]:
+    """Get and forget the warnings recorded in this process since the last call."""
+    messages = list(_messages)
+    _messages.clear()
+    return messages
+
+
+def init_worker(country: Optional[str] = None, region: Optional[str] = None) -> None:
+    """
+    Prepare a process for headless work: no dialogs, repositories loaded once.
+
+    Args:
+        country, region: Product filters to apply, as selected in the GUI (default: all products)
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    # Repositories and the parser report problems through QMessageBox, which needs a GUI
+    from PySide6.QtWidgets import QMessageBox
+    for name in ("warning", "critical", "information", "question"):
+        setattr(QMessageBox, name, staticmethod(_record_message))
+
+    from data.repository_product import ProductRepository
+    products_repo = ProductRepository.get_instance()
+    products_repo.set_filters(country, region)
+    products_repo.get_filtered_products()
+
+
+def calculate_file(file_path: str) -> SeasonSummary:
+    """
+    Compute the season Field EIQ for one workbook.
+
+    Args:
+        file_path: Path to an external-format or exported Excel file
+
+    Returns:
+        SeasonSummary for the file (status "error" if it could not be parsed)
+    """
+    from season_planner_page.import_export.excel_parser import ExcelScenarioParser
+    from season_planner_page.models.applications_eiq_calculator import ApplicationEIQCalculator
+    from season_planner_page.models.application_validator import ApplicationValidator, ValidationState
+    from common.utils import get_preferences_manager
+
+    start = time.perf_counter()
+    pop_messages()
+    summary = SeasonSummary(file=file_path)
+
+    try:
+        scenario, preview_info = ExcelScenarioParser().parse_file(file_path)
+        if scenario is None:
+            summary.status = "error"
+        else:
+            calculator = ApplicationEIQCalculator(get_preferences_manager().get_section("user_preferences", {}))
+            calculator.calculate_all_eiq_values(scenario.applications)
+
+            validator = ApplicationValidator()
+            summary.scenario_name = scenario.name
+            summary.grower_name = scenario.grower_name
+            summary.field_name = scenario.field_name
+            summary.crop_year = scenario.crop_year
+            summary.field_area = scenario.field_area
+            summary.field_area_uom = scenario.field_area_uom
+            summary.applications = len(scenario.applications)
+            summary.estimated_applications = sum(
+                1 for app in scenario.applications
+                if validator.validate_application(app).state == ValidationState.VALID_ESTIMATED
+            )
+            summary.unmatched_products = sorted(preview_info['product_validation']['unmatched_list'])
+            summary.season_eiq = calculator.get_total_eiq(scenario.applications, scenario.field_area, scenario.field_area_uom)
+    except Exception as e:
+        summary.status = "error"
+        _messages.append(f"Error: {e}")
+
+    summary.messages = pop_messages()
+    summary.seconds = time.perf_counter() - start
+    return summary
+
+
+def find_workbooks(directory: str) -> List[str]:
+    """List the Excel files in a directory (recursively), skipping Excel lock files."""
+    workbooks = []
+    for root, _, file_names in os.walk(directory):
+        for file_name in file_names:
+            if file_name.lower().endswith(EXCEL_EXTENSIONS) and not file_name.startswith("~$"):
+                workbooks.append(os.path.join(root, file_name))
+    return sorted(workbooks)
+
+
+def calculate_directory(directory: str, workers: int = None) -> List[SeasonSummary]:
+    """
+    Compute season EIQ for every workbook in a directory across a process pool.
+
+    Args:
+        directory: Directory containing the grower Excel files
+        workers: Number of processes (default: CPU count); 1 runs in this process
+
+    Returns:
+        List of SeasonSummary in file name order
+    """
+    workbooks = find_workbooks(directory)
+    if workers == 1 or len(workbooks) <= 1:
+        init_worker()
+        return [calculate_file(path) for path in workbooks]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        return list(executor.map(calculate_file, workbooks))
+
+
+def write_summary(summaries: List[SeasonSummary], output_path: str) -> None:
+    """Write the summaries as JSON (.json) or CSV (any other extension)."""
+    if output_path.lower().endswith(".json"):
+        with open(output_path, 'w', encoding='utf-8') as file:
+            json.dump([asdict(summary) for summary in summaries], file, indent=4)
+        return
+
+    with open(output_path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow([f.name for f in fields(SeasonSummary)])
+        for summary in summaries:
+            row = []
+            for value in asdict(summary).values():
+                if isinstance(value, list):
+                    value = "; ".join(value)
+                elif isinstance(value, float):
+                    value = round(value, 4)
+                row.append(value)
+            writer.writerow(row)
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Compute season Field EIQ for a directory of grower Excel files.")
+    parser.add_argument("directory", help="directory containing the Excel files")
+    parser.add_argument("-o", "--output", default="eiq_summary.csv", help="summary file (.csv or .json)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        parser.error(f"not a directory: {args.directory}")
+
+    start = time.perf_counter()
+    summaries = calculate_directory(args.directory, args.workers)
+    write_summary(summaries, args.output)
+
+    failed = sum(1 for summary in summaries if summary.status != "ok")
+    print(f"{len(summaries)} files ({failed} failed) in {time.perf_counter() - start:.1f} s -> {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
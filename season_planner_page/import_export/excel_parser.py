@@ -14,6 +14,10 @@ from PySide6.QtWidgets import QMessageBox
 from data.model_application import Application
 from data.model_scenario import Scenario
 from data.repository_product import ProductRepository
+from .product_matcher import get_product_matcher
+
+# Rows buffered at the top of the sheet to detect the file format
+FORMAT_DETECTION_ROWS = 10
 
 
 class ExcelScenarioParser:
@@ -65,18 +69,15 @@ class ExcelScenarioParser:
             tuple: (Scenario object, preview_info dict) or (None, None) if error
         """
         try:
-            # Load workbook with openpyxl
-            workbook = load_workbook(file_path, data_only=True)
-            worksheet = workbook.active
-            
-            # Convert worksheet to list of lists for processing
-            data_rows = self._worksheet_to_rows(worksheet)
-            
-            # Detect format type
-            format_type = self._detect_format_type(data_rows)
+            # Stream the active sheet: read-only mode yields plain values without building cell objects
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                format_type, data_rows, header_row_index = self._read_worksheet(workbook.active)
+            finally:
+                workbook.close()  # Read-only workbooks keep the file open until closed
             
             if format_type == "exported":
-                return self._parse_exported_format(data_rows, file_path)
+                return self._parse_exported_format(data_rows, file_path, header_row_index)
             else:
                 return self._parse_external_format(data_rows, file_path)
                 
@@ -84,19 +85,95 @@ class ExcelScenarioParser:
             QMessageBox.warning(None, "Error", f"Error parsing Excel file: {e}")
             return None, None
     
-    def _worksheet_to_rows(self, worksheet):
-        """Convert worksheet to list of lists, similar to pandas DataFrame structure."""
+    def _read_worksheet(self, worksheet):
+        """
+        Read the rows needed for import in a single streaming pass.
+        
+        The first FORMAT_DETECTION_ROWS rows are buffered to detect the format. External
+        files are then read up to their first blank row only; exported files are read to
+        the end, locating the header row on the way and dropping blank application rows.
+        Application rows are padded to the header width (read-only rows can be shorter).
+        
+        Args:
+            worksheet: Read-only worksheet
+            
+        Returns:
+            tuple: (format_type, data_rows, header_row_index); header_row_index is None
+                   for external files or when no exported header row was found
+        """
+        state = "detect"
+        format_type = None
         data_rows = []
+        header_row_index = None
+        width = 0
+        
         for row in worksheet.iter_rows(values_only=True):
             # Convert None values to empty strings for consistency
-            processed_row = [cell if cell is not None else '' for cell in row]
-            data_rows.append(processed_row)
-        
-        # Remove completely empty rows from the end
-        while data_rows and all(cell == '' or cell is None for cell in data_rows[-1]):
-            data_rows.pop()
+            row = [cell if cell is not None else '' for cell in row]
+            
+            if state == "exported_applications":
+                if any(cell != '' for cell in row):
+                    data_rows.append(row + [''] * (width - len(row)))
+                continue
+            
+            if state == "external_applications":
+                if all(cell == '' for cell in row):
+                    break  # Application data ends at the first blank row
+                data_rows.append(row)
+                continue
+            
+            data_rows.append(row)
             
-        return data_rows
+            if state == "detect":
+                if len(data_rows) < FORMAT_DETECTION_ROWS:
+                    continue
+                format_type, state, width, header_row_index = self._end_format_detection(data_rows)
+                if state == "done":
+                    break
+            elif self._is_exported_header_row(row):  # state == "exported_header"
+                header_row_index = len(data_rows) - 1
+                width = len(row)
+                state = "exported_applications"
+        
+        if state == "detect":  # Fewer rows than FORMAT_DETECTION_ROWS
+            format_type, state, width, header_row_index = self._end_format_detection(data_rows)
+        
+        if format_type == "external":
+            del data_rows[self._find_data_end(data_rows):]
+        else:
+            # Remove completely empty rows from the end
+            while data_rows and all(cell == '' for cell in data_rows[-1]):
+                data_rows.pop()
+        
+        return format_type, data_rows, header_row_index
+    
+    def _end_format_detection(self, data_rows):
+        """
+        Detect the format from the buffered rows and pick the next state of _read_worksheet.
+        
+        Returns:
+            tuple: (format_type, next state, header width, header_row_index)
+        """
+        # Remove completely empty rows from the end, as the detection expects
+        detection_rows = list(data_rows)
+        while detection_rows and all(cell == '' for cell in detection_rows[-1]):
+            detection_rows.pop()
+        format_type = self._detect_format_type(detection_rows)
+        
+        if format_type == "external":
+            # Stop reading if the data already ended within the buffered rows
+            if self._find_data_end(data_rows) < len(data_rows):
+                return format_type, "done", 0, None
+            return format_type, "external_applications", 0, None
+        
+        for i, row in enumerate(data_rows):
+            if self._is_exported_header_row(row):
+                # Pad and drop blank rows among the buffered application rows too
+                width = len(row)
+                data_rows[i + 1:] = [app_row + [''] * (width - len(app_row))
+                                     for app_row in data_rows[i + 1:] if any(cell != '' for cell in app_row)]
+                return format_type, "exported_applications", width, i
+        return format_type, "exported_header", 0, None
     
     def _detect_format_type(self, data_rows):
         """
@@ -144,7 +221,7 @@ class ExcelScenarioParser:
             QMessageBox.warning(None, "Error", f"Error detecting format: {e}")
             return "external"
     
-    def _parse_exported_format(self, data_rows, file_path):
+    def _parse_exported_format(self, data_rows, file_path, header_row_index=None):
         """Parse files exported by the application itself."""
         try:
             # Extract scenario name from row 1
@@ -153,8 +230,9 @@ class ExcelScenarioParser:
             # Extract metadata from row 2
             metadata = self._extract_exported_metadata(data_rows)
             
-            # Find the header row
-            header_row_index = self._find_exported_header_row(data_rows)
+            # Find the header row (unless already located while reading)
+            if header_row_index is None:
+                header_row_index = self._find_exported_header_row(data_rows)
             
             if header_row_index is None:
                 raise ValueError("Could not find header row in exported format")
@@ -368,9 +446,7 @@ class ExcelScenarioParser:
         try:
             # Look for row containing "App #" and "Product Name"
             for i in range(len(data_rows)):
-                row_values = [str(val).strip() for val in data_rows[i] if val != '']
-                
-                if "App #" in row_values and "Product Name" in row_values:
+                if self._is_exported_header_row(data_rows[i]):
                     return i
             
             return None
@@ -378,6 +454,11 @@ class ExcelScenarioParser:
         except Exception:
             return None
     
+    def _is_exported_header_row(self, row):
+        """Check whether a row is the exported format header (contains "App #" and "Product Name")."""
+        row_values = [str(val).strip() for val in row if val != '']
+        return "App #" in row_values and "Product Name" in row_values
+    
     def _clean_exported_applications(self, applications_data, header_row):
         """Clean applications data from exported format."""
         try:
@@ -530,9 +611,8 @@ class ExcelScenarioParser:
             'product_mapping': {}
         }
         
-        # Get all available products from repository
-        available_products = self.products_repo.get_filtered_products()
-        available_product_names = {product.product_name.lower(): product for product in available_products}
+        # Shared matcher over the available products (rebuilt only when the products change)
+        matcher = get_product_matcher(self.products_repo.get_filtered_products())
         
         # Extract unique product names from data
         excel_products = set()
@@ -545,10 +625,9 @@ class ExcelScenarioParser:
         validation_results['total_products'] = len(excel_products)
         
         for excel_product in excel_products:
-            excel_product_lower = excel_product.lower()
+            matched_product = matcher.find_exact(excel_product)
             
-            if excel_product_lower in available_product_names:
-                matched_product = available_product_names[excel_product_lower]
+            if matched_product is not None:
                 validation_results['matched_products'] += 1
                 validation_results['matched_list'].append(excel_product)
                 validation_results['product_mapping'][excel_product] = matched_product
@@ -737,4 +816,4 @@ class ExcelScenarioParser:
                 return 2000 + year_suffix if year_suffix > 0 else 2024
             return 2024
         except:
-            return 2024
\ No newline at end of file
+            return 2024
@@ -2,13 +2,19 @@
 Excel exporter for scenario export.
 
 Exports scenarios to Excel format with each scenario as a separate worksheet.
+
+Worksheets are write-only: each scenario's rows are built as plain values, the column
+widths are measured on those values, and the rows are streamed to disk with their
+styles. Memory stays bounded by the largest scenario, so hundreds of scenarios can be
+exported into one file.
 """
 
 from dataclasses import dataclass
 from typing import List, Tuple, Any, Optional
 from openpyxl import Workbook
-from openpyxl.comments import Comment
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
 from PySide6.QtWidgets import QMessageBox, QFileDialog
 
 
@@ -21,6 +27,9 @@ class ExportConfig:
     MAX_COLUMN_WIDTH = 50
     COLUMN_PADDING = 2
     
+    # Rows summed by the total Field EIQ formula (at least down to this row)
+    TOTAL_EIQ_LAST_ROW = 100
+    
     COLUMNS = [
         "App #", "Date", "Product Type", "Product Name", "Rate",
         "Rate UOM", "Area", "Method", "AI Groups", "Field EIQ"
@@ -73,124 +82,98 @@ class DataConverter:
 
 
 class ExcelFormatter:
-    """Handles Excel worksheet formatting."""
+    """Handles Excel worksheet formatting for write-only worksheets."""
+    
+    # Metadata label columns (1-based), in bold
+    LABEL_COLUMNS = (1, 3, 5, 7, 9)
     
     def __init__(self, config: ExportConfig):
         self.config = config
     
-    def format_worksheet(self, worksheet, header_row_num: int) -> None:
-        """Apply formatting to the Excel worksheet."""
-        try:
-            self._format_headers(worksheet, header_row_num)
-            self._auto_adjust_columns(worksheet)
-            self._format_metadata(worksheet)
-        except Exception as e:
-            QMessageBox.warning(None, "Warning", f"Could not apply Excel formatting: {e}")
+    def set_column_widths(self, worksheet, rows: List[List[Any]]) -> None:
+        """
+        Size the columns to the longest value written in them.
+        
+        Write-only worksheets need the widths before the first row is appended.
+        """
+        widths = [0] * len(self.config.COLUMNS)
+        for row in rows:
+            for col, value in enumerate(row[:len(widths)]):
+                if value is not None:
+                    widths[col] = max(widths[col], len(str(value)))
+        
+        for col, max_length in enumerate(widths, 1):
+            # Set column width with padding, capped at max width
+            adjusted_width = min(max_length + self.config.COLUMN_PADDING, self.config.MAX_COLUMN_WIDTH)
+            worksheet.column_dimensions[get_column_letter(col)].width = adjusted_width
+    
+    def metadata_cells(self, worksheet, values: List[Any]) -> List[WriteOnlyCell]:
+        """Metadata row with bold labels."""
+        cells = []
+        for col, value in enumerate(values, 1):
+            cell = WriteOnlyCell(worksheet, value=value)
+            if col in self.LABEL_COLUMNS:
+                cell.font = self.config.METADATA_FONT
+            cells.append(cell)
+        return cells
     
-    def _format_headers(self, worksheet, header_row_num: int) -> None:
-        """Format header row with bold font and grey background."""
-        for col in range(1, len(self.config.COLUMNS) + 1):
-            cell = worksheet.cell(row=header_row_num, column=col)
+    def header_cells(self, worksheet, headers: List[str]) -> List[WriteOnlyCell]:
+        """Header row with bold font and grey background."""
+        cells = []
+        for header in headers:
+            cell = WriteOnlyCell(worksheet, value=header)
             cell.font = self.config.HEADER_FONT
             cell.fill = self.config.HEADER_FILL
             cell.alignment = self.config.CENTER_ALIGNMENT
-    
-    def _auto_adjust_columns(self, worksheet) -> None:
-        """Auto-adjust column widths based on content."""
-        for column_cells in worksheet.columns:
-            max_length = 0
-            column_letter = column_cells[0].column_letter
-            
-            for cell in column_cells:
-                try:
-                    cell_value = str(cell.value) if cell.value is not None else ""
-                    max_length = max(max_length, len(cell_value))
-                except:
-                    pass
-            
-            # Set column width with padding, capped at max width
-            adjusted_width = min(max_length + self.config.COLUMN_PADDING, self.config.MAX_COLUMN_WIDTH)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
-    
-    def _format_metadata(self, worksheet) -> None:
-        """Format metadata rows with bold labels."""
-        for row in range(1, 3):  # First two metadata rows
-            for col in range(1, len(self.config.COLUMNS) + 1):
-                cell = worksheet.cell(row=row, column=col)
-                if col in [1, 3, 5, 7, 9]:  # Label columns
-                    cell.font = self.config.METADATA_FONT
+            cells.append(cell)
+        return cells
 
 
 class ScenarioDataWriter:
     """Handles writing scenario data to worksheet."""
     
-    def __init__(self, config: ExportConfig, converter: DataConverter):
+    def __init__(self, config: ExportConfig, converter: DataConverter, formatter: ExcelFormatter):
         self.config = config
         self.converter = converter
+        self.formatter = formatter
         self.header_row_num = None
     
     def write_scenario_to_worksheet(self, worksheet, scenario) -> None:
-        """Write complete scenario data to worksheet."""
-        current_row = 1
-        current_row = self._write_metadata(worksheet, scenario, current_row)
-        current_row = self._write_headers(worksheet, current_row, scenario)
-        self._write_applications(worksheet, scenario.applications or [], current_row)
-    
-    def _write_metadata(self, worksheet, scenario, start_row: int) -> int:
-        """Write scenario metadata to worksheet."""
-        current_row = start_row
+        """Write complete scenario data to a write-only worksheet."""
+        applications = scenario.applications or []
+        metadata_rows = self._get_metadata_rows(scenario, len(applications))
+        headers = self._get_headers(scenario)
+        application_rows = [self._get_application_row(i + 1, app) for i, app in enumerate(applications)]
         
-        # Calculate total Field EIQ for the scenario
-        total_eiq = self._calculate_total_field_eiq(scenario)
+        self.formatter.set_column_widths(worksheet, metadata_rows + [headers] + application_rows)
+        
+        for row in metadata_rows:
+            worksheet.append(self.formatter.metadata_cells(worksheet, row))
+        worksheet.append([])  # Separator row
+        worksheet.append(self.formatter.header_cells(worksheet, headers))
+        self.header_row_num = len(metadata_rows) + 2
+        
+        for row in application_rows:
+            worksheet.append(row)
+    
+    def _get_metadata_rows(self, scenario, application_count: int) -> List[List[Any]]:
+        """Get the scenario name/total row and the metadata row."""
+        # Applications start below the two metadata rows, the separator and the headers
+        first_row = 5
+        last_row = max(self.config.TOTAL_EIQ_LAST_ROW, first_row + application_count - 1)
         
         # Scenario name + total field EIQ row
-        worksheet.cell(row=current_row, column=1, value="Scenario Name:")
-        worksheet.cell(row=current_row, column=2, value=scenario.name or "Unnamed Scenario")
-        worksheet.cell(row=current_row, column=3, value="Total Field Use EIQ Score:")
-        worksheet.cell(row=current_row, column=4, value="=SUM(J5:J100)")
-
-        current_row += 1
+        name_row = [
+            "Scenario Name:", scenario.name or "Unnamed Scenario",
+            "Total Field Use EIQ Score:", f"=SUM(J{first_row}:J{last_row})"
+        ]
         
         # Metadata row with multiple fields
-        metadata_items = self._get_metadata_items(scenario)
-        for col_offset, (label, value) in enumerate(metadata_items):
-            col_start = (col_offset * 2) + 1
-            worksheet.cell(row=current_row, column=col_start, value=label)
-            worksheet.cell(row=current_row, column=col_start + 1, value=value)
+        metadata_row = []
+        for label, value in self._get_metadata_items(scenario):
+            metadata_row.extend([label, value])
         
-        current_row += 1
-        return current_row + 1  # +1 for separator row
-    
-    def _calculate_total_field_eiq(self, scenario) -> float:
-        """Calculate area-weighted Field EIQ for all applications in the scenario."""
-        try:
-            if hasattr(scenario, 'get_total_eiq'):
-                # Use scenario's area-weighted calculation method
-                return round(scenario.get_total_eiq(), 2)
-            else:
-                # Fallback to simple sum for scenarios without the method
-                total_eiq = 0.0
-                if hasattr(scenario, 'applications') and scenario.applications:
-                    for app in scenario.applications:
-                        field_eiq = getattr(app, 'field_eiq', None)
-                        if field_eiq is not None:
-                            try:
-                                total_eiq += float(field_eiq)
-                            except (ValueError, TypeError):
-                                pass  # Skip invalid values
-                return round(total_eiq, 2)
-        except Exception:
-            # Fallback to simple sum if area-weighted calculation fails
-            total_eiq = 0.0
-            if hasattr(scenario, 'applications') and scenario.applications:
-                for app in scenario.applications:
-                    field_eiq = getattr(app, 'field_eiq', None)
-                    if field_eiq is not None:
-                        try:
-                            total_eiq += float(field_eiq)
-                        except (ValueError, TypeError):
-                            pass  # Skip invalid values
-            return round(total_eiq, 2)
+        return [name_row, metadata_row]
     
     def _get_metadata_items(self, scenario) -> List[Tuple[str, Any]]:
         """Get metadata items for scenario."""
@@ -210,35 +193,21 @@ class ScenarioDataWriter:
         area_value = self.converter.to_float(field_area, field_area)
         return f"{area_value} {field_area_uom}"
     
-    def _write_headers(self, worksheet, start_row: int, scenario) -> int:
-        """Write column headers with dynamic area UOM."""
-        # Get field area UOM for dynamic header
+    def _get_headers(self, scenario) -> List[str]:
+        """Get column headers with dynamic area UOM."""
         field_area_uom = getattr(scenario, 'field_area_uom', 'acre') or 'acre'
         
-        # Create dynamic column headers
         headers = []
         for header in self.config.COLUMNS:
             if header == "Area":
                 headers.append(f"Area ({field_area_uom})")
             else:
                 headers.append(header)
-        
-        # Write headers to worksheet
-        for col_idx, header in enumerate(headers, 1):
-            worksheet.cell(row=start_row, column=col_idx, value=header)
-        
-        self.header_row_num = start_row
-        return start_row + 1
-    
-    def _write_applications(self, worksheet, applications: List, start_row: int) -> None:
-        """Write application data rows."""
-        for i, app in enumerate(applications):
-            row = start_row + i
-            self._write_application_row(worksheet, row, i + 1, app)
+        return headers
     
-    def _write_application_row(self, worksheet, row: int, app_num: int, app) -> None:
-        """Write a single application row."""
-        data = [
+    def _get_application_row(self, app_num: int, app) -> List[Any]:
+        """Get a single application row."""
+        return [
             app_num,  # App # - numeric
             getattr(app, 'application_date', ''),  # Date
             getattr(app, 'product_type', ''),  # Product Type
@@ -250,9 +219,6 @@ class ScenarioDataWriter:
             ', '.join(getattr(app, 'ai_groups', []) or []),  # AI Groups
             self.converter.to_rounded_float(getattr(app, 'field_eiq', ''))  # Field EIQ
         ]
-        
-        for col_idx, value in enumerate(data, 1):
-            worksheet.cell(row=row, column=col_idx, value=value)
 
 
 class FileHandler:
@@ -302,7 +268,7 @@ class ExcelScenarioExporter:
         self.config = ExportConfig()
         self.converter = DataConverter()
         self.formatter = ExcelFormatter(self.config)
-        self.data_writer = ScenarioDataWriter(self.config, self.converter)
+        self.data_writer = ScenarioDataWriter(self.config, self.converter, self.formatter)
         self.file_handler = FileHandler()
     
     def export_scenarios(self, scenarios: List, parent_widget=None) -> Optional[str]:
@@ -321,7 +287,7 @@ class ExcelScenarioExporter:
             if not file_path:
                 return None
             
-            self._create_excel_file(scenarios, file_path)
+            self.write_workbook(scenarios, file_path)
             self.file_handler.show_success_message(parent_widget, file_path)
             return file_path
             
@@ -334,20 +300,20 @@ class ExcelScenarioExporter:
         
         return None
     
-    def _create_excel_file(self, scenarios: List, file_path: str) -> None:
-        """Create Excel file with scenario data."""
-        workbook = Workbook()
+    def write_workbook(self, scenarios: List, file_path: str) -> None:
+        """
+        Write scenarios to an Excel file, one worksheet each, without any dialog.
         
-        # Remove default sheet
-        if workbook.worksheets:
-            workbook.remove(workbook.active)
+        Args:
+            scenarios: List of scenario objects to export
+            file_path: Path of the .xlsx file to create
+        """
+        workbook = Workbook(write_only=True)
         
         for scenario in scenarios:
             sheet_name = self._sanitize_sheet_name(scenario.name)
             worksheet = workbook.create_sheet(title=sheet_name)
-            
             self.data_writer.write_scenario_to_worksheet(worksheet, scenario)
-            self.formatter.format_worksheet(worksheet, self.data_writer.header_row_num)
         
         workbook.save(file_path)
     
@@ -377,4 +343,4 @@ class ExcelScenarioExporter:
     def _handle_error(self, message: str, parent_widget) -> None:
         """Handle and display error messages."""
         
-        self.file_handler.show_error_message(parent_widget, message)
\ No newline at end of file
+        self.file_handler.show_error_message(parent_widget, message)
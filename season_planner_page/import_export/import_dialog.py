@@ -9,15 +9,64 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, 
     QFileDialog, QMessageBox, QTextEdit, QDialogButtonBox,
     QTableWidget, QTableWidgetItem, QComboBox, QHeaderView,
-    QTabWidget, QWidget, QFrame
+    QTabWidget, QWidget, QFrame, QProgressBar
 )
 from PySide6.QtCore import Qt, Signal
 from common.styles import get_medium_font, get_subtitle_font
 from common.widgets.product_selection import ProductSearchField
 from .excel_parser import ExcelScenarioParser
+from .product_matcher import get_product_matcher
 from data.repository_product import ProductRepository
 
 
+def apply_product_mappings(raw_scenario, mapping_summary):
+    """
+    Create the final scenario from a parsed one by applying the product mapping choices.
+    
+    Args:
+        raw_scenario: Scenario as parsed from the Excel file
+        mapping_summary: Summary from ProductMappingWidget.get_mapping_summary
+        
+    Returns:
+        Scenario: Clone of raw_scenario with mapped products replaced and skipped ones removed
+    """
+    final_scenario = raw_scenario.clone()
+    final_scenario.name = raw_scenario.name  # clone() adds a "Copy of" prefix
+    final_applications = []
+    
+    for app in raw_scenario.applications:
+        excel_product_name = app.product_name
+        
+        mapping_action = None
+        mapped_product = None
+        
+        for excel_name, db_product_name in mapping_summary["map"]:
+            if excel_name == excel_product_name:
+                mapping_action = "map"
+                products_repo = ProductRepository.get_instance()
+                mapped_product = products_repo.find_product(db_product_name)
+                break
+        
+        if excel_product_name in mapping_summary["skip"]:
+            mapping_action = "skip"
+        elif excel_product_name in mapping_summary["import_unmatched"]:
+            mapping_action = "import_unmatched"
+        
+        if mapping_action == "skip":
+            continue
+        elif mapping_action == "map" and mapped_product:
+            app.product_name = mapped_product.product_name
+            app.product_type = mapped_product.product_type
+            final_applications.append(app)
+        elif mapping_action == "import_unmatched":
+            final_applications.append(app)
+        else:
+            final_applications.append(app)
+    
+    final_scenario.applications = final_applications
+    return final_scenario
+
+
 class ProductMappingWidget(QWidget):
     """Widget for mapping unmatched products to database products."""
     
@@ -138,29 +187,8 @@ class ProductMappingWidget(QWidget):
                 self.products_mapped.emit()
     
     def find_similar_product(self, excel_name):
-        """Find a similar product in the database using fuzzy matching."""
-        excel_lower = excel_name.lower()
-        
-        # First try: exact substring match
-        for product in self.available_products:
-            db_lower = product.product_name.lower()
-            if excel_lower in db_lower or db_lower in excel_lower:
-                return product
-        
-        # Second try: word overlap
-        excel_words = set(excel_lower.split())
-        best_match = None
-        best_score = 0
-        
-        for product in self.available_products:
-            db_words = set(product.product_name.lower().split())
-            overlap = len(excel_words.intersection(db_words))
-            
-            if overlap > best_score and overlap >= 2:
-                best_score = overlap
-                best_match = product
-        
-        return best_match
+        """Find the most similar product in the database using fuzzy matching."""
+        return get_product_matcher(self.available_products).find_best(excel_name)
     
     def get_mapping_summary(self):
         """Get a summary of the current mappings."""
@@ -412,45 +440,8 @@ class ImportScenarioDialog(QDialog):
         """Apply the product mappings to create the final scenario."""
         if not self.raw_scenario or not self.mapping_widget:
             return
-            
-        final_scenario = self.raw_scenario.clone()
-        final_applications = []
-        
-        mapping_summary = self.mapping_widget.get_mapping_summary()
         
-        for app in self.raw_scenario.applications:
-            excel_product_name = app.product_name
-            
-            mapping_action = None
-            mapped_product = None
-            
-            for excel_name, db_product_name in mapping_summary["map"]:
-                if excel_name == excel_product_name:
-                    mapping_action = "map"
-                    products_repo = ProductRepository.get_instance()
-                    available_products = products_repo.get_filtered_products()
-                    mapped_product = next((p for p in available_products 
-                                         if p.product_name == db_product_name), None)
-                    break
-            
-            if excel_product_name in mapping_summary["skip"]:
-                mapping_action = "skip"
-            elif excel_product_name in mapping_summary["import_unmatched"]:
-                mapping_action = "import_unmatched"
-            
-            if mapping_action == "skip":
-                continue
-            elif mapping_action == "map" and mapped_product:
-                app.product_name = mapped_product.product_name
-                app.product_type = mapped_product.product_type
-                final_applications.append(app)
-            elif mapping_action == "import_unmatched":
-                final_applications.append(app)
-            else:
-                final_applications.append(app)
-        
-        final_scenario.applications = final_applications
-        self.imported_scenario = final_scenario
+        self.imported_scenario = apply_product_mappings(self.raw_scenario, self.mapping_widget.get_mapping_summary())
     
     def show_preview(self, preview_info):
         """Show preview of parsed data with correct format detection."""
@@ -491,4 +482,187 @@ Sample applications:
     
     def get_imported_scenario(self):
         """Get the final imported scenario with mappings applied."""
-        return self.imported_scenario
\ No newline at end of file
+        return self.imported_scenario
+
+
+class MultiImportDialog(QDialog):
+    """
+    Import dialog for several Excel files at once.
+    
+    The files are parsed in parallel by a ScenarioImportJob while the dialog shows the
+    progress; the unmatched products of all files are then resolved in a single
+    product mapping step, and the choices apply to every file.
+    """
+    
+    def __init__(self, file_paths, parent=None):
+        super().__init__(parent)
+        self.parent = parent
+        self.file_paths = list(file_paths)
+        self.results = []  # FileImportResult list, in file order, once all files are parsed
+        self.unmatched_products = []  # Unmatched product names across all files
+        self.mapping_widget = None
+        
+        self.setWindowTitle("Import Scenarios from Excel")
+        self.setModal(True)
+        self.setMinimumSize(800, 600)
+        self.setup_ui()
+        
+        # Imported here so the package does not load the process pool and batch calculator
+        from .multi_import import ScenarioImportJob
+        self.import_job = ScenarioImportJob(self.file_paths, parent=self)
+        self.import_job.file_finished.connect(self.on_file_finished)
+        self.import_job.progress.connect(self.on_progress)
+        self.import_job.finished.connect(self.on_all_files_finished)
+        self.import_job.start()
+    
+    def setup_ui(self):
+        """Set up the dialog UI with tabs for reading files and product mapping."""
+        layout = QVBoxLayout(self)
+        
+        # Title
+        title_label = QLabel("Import Scenarios from Excel")
+        title_label.setFont(get_subtitle_font())
+        title_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title_label)
+        
+        # Tab widget for different stages
+        self.tab_widget = QTabWidget()
+        layout.addWidget(self.tab_widget)
+        
+        # Tab 1: Progress of the files being read
+        self.files_tab = QWidget()
+        self.setup_files_tab()
+        self.tab_widget.addTab(self.files_tab, "1. Read Files")
+        
+        # Tab 2: Product Mapping (enabled once all files are read, if needed)
+        self.mapping_tab = QWidget()
+        self.tab_widget.addTab(self.mapping_tab, "2. Correct Issues")
+        self.tab_widget.setTabEnabled(1, False)
+        
+        # Buttons
+        button_box = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel,
+            Qt.Horizontal, self
+        )
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        
+        self.ok_button = button_box.button(QDialogButtonBox.Ok)
+        self.ok_button.setEnabled(False)
+        
+        layout.addWidget(button_box)
+    
+    def setup_files_tab(self):
+        """Set up the file progress tab."""
+        layout = QVBoxLayout(self.files_tab)
+        
+        self.progress_label = QLabel(f"Reading {len(self.file_paths)} files...")
+        self.progress_label.setFont(get_medium_font())
+        layout.addWidget(self.progress_label)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, len(self.file_paths))
+        self.progress_bar.setValue(0)
+        layout.addWidget(self.progress_bar)
+        
+        self.files_text = QTextEdit()
+        self.files_text.setReadOnly(True)
+        layout.addWidget(self.files_text)
+    
+    def on_file_finished(self, result):
+        """Log a file as soon as it has been read."""
+        file_name = os.path.basename(result.file)
+        if result.ok:
+            line = f"✓ {file_name}: {len(result.scenario.applications)} applications"
+            if result.unmatched_products:
+                line += f", {len(result.unmatched_products)} unmatched products"
+        else:
+            line = f"✗ {file_name}: could not be parsed"
+        
+        for message in result.messages:
+            line += f"\n    {message}"
+        self.files_text.append(line)
+    
+    def on_progress(self, done, total):
+        """Update the progress bar."""
+        self.progress_bar.setValue(done)
+        self.progress_label.setText(f"Read {done} of {total} files...")
+    
+    def on_all_files_finished(self, results):
+        """Consolidate the unmatched products of all files once every file is read."""
+        self.results = results
+        parsed = [result for result in results if result.ok]
+        failed = len(results) - len(parsed)
+        
+        unmatched = set()
+        for result in parsed:
+            unmatched.update(result.unmatched_products)
+        self.unmatched_products = sorted(unmatched)
+        
+        summary = f"Read {len(parsed)} of {len(results)} files"
+        if failed:
+            summary += f" ({failed} could not be parsed)"
+        self.progress_label.setText(summary + ".")
+        
+        if not parsed:
+            return
+        
+        if self.unmatched_products:
+            self.setup_mapping_tab()
+            self.tab_widget.setTabEnabled(1, True)
+            self.tab_widget.setCurrentIndex(1)
+        else:
+            self.ok_button.setEnabled(True)
+    
+    def setup_mapping_tab(self):
+        """Set up the product mapping tab for the unmatched products of all files."""
+        layout = QVBoxLayout(self.mapping_tab)
+        
+        products_repo = ProductRepository.get_instance()
+        available_products = products_repo.get_filtered_products()
+        
+        self.mapping_widget = ProductMappingWidget(
+            self.unmatched_products, available_products, self
+        )
+        self.mapping_widget.products_mapped.connect(self.on_products_mapped)
+        layout.addWidget(self.mapping_widget)
+        
+        separator = QFrame()
+        separator.setFrameShape(QFrame.HLine)
+        layout.addWidget(separator)
+        
+        self.mapping_summary_label = QLabel()
+        self.mapping_summary_label.setFont(get_medium_font())
+        layout.addWidget(self.mapping_summary_label)
+        
+        self.on_products_mapped()
+    
+    def on_products_mapped(self):
+        """Update the mapping summary and whether the import can proceed."""
+        summary = self.mapping_widget.get_mapping_summary()
+        
+        text_parts = []
+        if summary["map"]:
+            text_parts.append(f"✓ {len(summary['map'])} products will be mapped")
+        if summary["import_unmatched"]:
+            text_parts.append(f"⚠ {len(summary['import_unmatched'])} products will be imported without EIQ data")
+        if summary["skip"]:
+            text_parts.append(f"✗ {len(summary['skip'])} products will be skipped")
+        self.mapping_summary_label.setText("\n".join(text_parts))
+        
+        total_actions = len(summary["map"]) + len(summary["import_unmatched"]) + len(summary["skip"])
+        self.ok_button.setEnabled(total_actions == len(self.unmatched_products))
+    
+    def reject(self):
+        """Cancel any files still being read and close the dialog."""
+        self.import_job.cancel()
+        super().reject()
+    
+    def get_imported_scenarios(self):
+        """Get the parsed scenarios, in file order, with the product mappings applied."""
+        scenarios = [result.scenario for result in self.results if result.ok]
+        if not self.mapping_widget:
+            return scenarios
+        
+        mapping_summary = self.mapping_widget.get_mapping_summary()
+        return [apply_product_mappings(scenario, mapping_summary) for scenario in scenarios]
@@ -0,0 +1,147 @@
+"""
+Parallel import of several Excel workbooks.
+
+Workbooks are parsed with ExcelScenarioParser in a process pool: each process loads
+the product catalog once (with the product filters selected in the GUI) and parses
+whole files, so a directory of grower files is read in one step across all cores.
+ScenarioImportJob runs the pool from the GUI and reports each finished file through
+Qt signals; it can be cancelled at any time.
+"""
+
+import multiprocessing, os, time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from PySide6.QtCore import QObject, Signal
+
+from data.model_scenario import Scenario
+from data.repository_product import ProductRepository
+from .batch_calculator import init_worker, pop_messages
+
+
+@dataclass
+class FileImportResult:
+    """Result of parsing one workbook in a worker process."""
+    file: str
+    scenario: Optional[Scenario] = None                           # None if the file could not be parsed
+    unmatched_products: List[str] = field(default_factory=list)   # Excel product names not in the catalog
+    messages: List[str] = field(default_factory=list)             # Warnings the parser would have shown
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was parsed into a scenario."""
+        return self.scenario is not None
+
+
+def parse_workbook(file_path: str) -> FileImportResult:
+    """
+    Parse one workbook (runs in a worker process prepared by init_worker).
+
+    Args:
+        file_path: Path to an external-format or exported Excel file
+
+    Returns:
+        FileImportResult with the parsed scenario and its unmatched product names
+    """
+    from .excel_parser import ExcelScenarioParser
+
+    start = time.perf_counter()
+    pop_messages()
+    result = FileImportResult(file=file_path)
+    errors = []
+
+    try:
+        scenario, preview_info = ExcelScenarioParser().parse_file(file_path)
+        if scenario is not None:
+            result.scenario = scenario
+            result.unmatched_products = list(preview_info['product_validation']['unmatched_list'])
+    except Exception as e:
+        errors.append(f"Error: {e}")
+
+    result.messages = pop_messages() + errors
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+class ScenarioImportJob(QObject):
+    """
+    Parses a list of workbooks in a process pool, reporting results on the GUI thread.
+
+    Results arrive in completion order through file_finished; finished is emitted once
+    with all results in the order the files were given, unless the job was cancelled.
+    """
+
+    file_finished = Signal(object)   # FileImportResult of one file
+    progress = Signal(int, int)      # (files done, total files)
+    finished = Signal(list)          # FileImportResult list, in file order
+
+    _future_done = Signal(object)    # Future completed, emitted from the pool's thread
+
+    def __init__(self, file_paths: List[str], workers: int = None, parent=None):
+        """
+        Initialize the job.
+
+        Args:
+            file_paths: Workbooks to parse
+            workers: Number of processes (default: CPU count, at most one per file)
+        """
+        super().__init__(parent)
+        self.file_paths = list(file_paths)
+        self.workers = max(1, min(workers or os.cpu_count() or 1, len(self.file_paths)))
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._futures: Dict[Future, str] = {}             # Future -> file path
+        self._results: Dict[str, FileImportResult] = {}   # File path -> result
+        self._cancelled = False
+        self._future_done.connect(self._collect_result)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether files are still being parsed."""
+        return self._executor is not None
+
+    def start(self):
+        """Start parsing all files."""
+        if not self.file_paths:
+            self.finished.emit([])
+            return
+
+        # Spawned (not forked) processes: the GUI process has threads and Qt state that must not be copied
+        country, region = ProductRepository.get_instance().get_filters()
+        self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=multiprocessing.get_context("spawn"),
+                                             initializer=init_worker, initargs=(country, region))
+        for file_path in self.file_paths:
+            future = self._executor.submit(parse_workbook, file_path)
+            self._futures[future] = file_path
+
+        # Done callbacks run in the pool's thread; the signal queues each future to the GUI thread
+        for future in self._futures:
+            future.add_done_callback(self._future_done.emit)
+
+    def cancel(self):
+        """Stop the job: queued files are dropped and results still arriving are ignored."""
+        if self._executor is None:
+            return
+        self._cancelled = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def _collect_result(self, future: Future):
+        """Record a finished file (GUI thread)."""
+        if self._cancelled or future.cancelled():
+            return
+
+        try:
+            result = future.result()
+        except Exception as e:  # The worker process died or the result could not be transferred
+            result = FileImportResult(file=self._futures[future], messages=[f"Error: {e}"])
+
+        self._results[result.file] = result
+        self.file_finished.emit(result)
+        self.progress.emit(len(self._results), len(self.file_paths))
+
+        if len(self._results) == len(self.file_paths):
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self.finished.emit([self._results[file_path] for file_path in self.file_paths])
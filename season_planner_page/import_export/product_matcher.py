@@ -0,0 +1,188 @@
+"""
+Product name matcher for Excel import.
+
+Indexes the product catalog once so Excel product names can be matched exactly
+(case-insensitive) and, when they do not match, ranked against similar catalog names.
+Candidates come from a token index (whole words) and a trigram index (misspelled
+words); they are scored by normalized edit distance blended with word overlap.
+
+Shared by ExcelScenarioParser (exact matching) and ProductMappingWidget (suggestions)
+through get_product_matcher, which rebuilds the index only when the product list changes.
+"""
+
+import heapq, re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# Share of the score given to the edit distance similarity (the rest is word overlap)
+EDIT_WEIGHT = 0.6
+
+# Lowest score accepted as a suggestion
+MIN_SIMILARITY = 0.5
+
+# Candidates (by shared tokens and trigrams) scored with the edit distance
+MAX_CANDIDATES = 40
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def normalize_product_name(name: str) -> str:
+    """Lowercase a product name and reduce it to space-separated words."""
+    return " ".join(_TOKEN_PATTERN.findall(str(name).lower()))
+
+
+def edit_distance(a: str, b: str, limit: int = None) -> int:
+    """
+    Levenshtein distance between two strings.
+
+    Args:
+        a, b: Strings to compare
+        limit: Optional bound; only the diagonal band within it is computed and
+               limit + 1 is returned as soon as the distance must exceed it
+
+    Returns:
+        int: Number of single-character insertions, deletions and substitutions
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is None:
+        limit = len(a)
+    if len(a) - len(b) > limit:
+        return limit + 1
+
+    beyond = limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        first, last = max(1, i - limit), min(len(b), i + limit)
+        current = [beyond] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        row_min = current[first - 1]
+        for j in range(first, last + 1):
+            value = previous[j - 1] + (char_a != b[j - 1])
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return beyond
+        previous = current
+    return min(previous[-1], beyond)
+
+
+def _trigrams(text: str) -> set:
+    """Character trigrams of each word, padded so short words still produce some."""
+    grams = set()
+    for token in text.split():
+        padded = f" {token} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class ProductNameMatcher:
+    """Precomputed exact and fuzzy lookup of product names."""
+
+    def __init__(self, products: List):
+        """Index a list of products by name."""
+        self.products = products
+
+        # Case-insensitive exact lookup (the last product of a name wins, as in the original dict)
+        self._exact: Dict[str, object] = {product.product_name.lower(): product for product in products}
+
+        # Distinct normalized names, the first product of each, and their token/trigram postings
+        first_product: Dict[str, object] = {}
+        for product in products:
+            first_product.setdefault(normalize_product_name(product.product_name), product)
+        self._names = list(first_product)
+        self._name_products = list(first_product.values())
+        self._name_tokens = [set(name.split()) for name in self._names]
+
+        self._token_postings: Dict[str, List[int]] = {}
+        self._trigram_postings: Dict[str, List[int]] = {}
+        for name_id, name in enumerate(self._names):
+            for token in self._name_tokens[name_id]:
+                self._token_postings.setdefault(token, []).append(name_id)
+            for gram in _trigrams(name):
+                self._trigram_postings.setdefault(gram, []).append(name_id)
+
+    def find_exact(self, name: str):
+        """Get the product whose name equals the given name (case-insensitive), or None."""
+        return self._exact.get(str(name).lower())
+
+    def find_similar(self, name: str, top_k: int = 5, min_similarity: float = MIN_SIMILARITY) -> List[Tuple[object, float]]:
+        """
+        Rank the catalog names most similar to a name.
+
+        Args:
+            name: Product name as written in the Excel file
+            top_k: Maximum number of suggestions
+            min_similarity: Lowest score returned (0-1)
+
+        Returns:
+            List of (product, score) tuples, best first
+        """
+        query = normalize_product_name(name)
+        if not query:
+            return []
+
+        # Shared whole words count more than shared trigrams when picking candidates
+        query_tokens = set(query.split())
+        overlap = Counter()
+        for token in query_tokens:
+            for name_id in self._token_postings.get(token, ()):
+                overlap[name_id] += 3
+        for gram in _trigrams(query):
+            for name_id in self._trigram_postings.get(gram, ()):
+                overlap[name_id] += 1
+
+        # Candidates come best-first, so once top_k are scored the bar rises to the k-th best
+        scored = []
+        threshold = min_similarity
+        for name_id, _ in overlap.most_common(MAX_CANDIDATES):
+            score = self._score(query, query_tokens, name_id, threshold)
+            if score >= threshold:
+                heapq.heappush(scored, (score, -name_id))
+                if len(scored) > top_k:
+                    heapq.heappop(scored)
+                if len(scored) == top_k:
+                    threshold = max(threshold, scored[0][0])
+
+        return [(self._name_products[-negative_id], score) for score, negative_id in sorted(scored, reverse=True)]
+
+    def find_best(self, name: str, min_similarity: float = MIN_SIMILARITY):
+        """Get the product most similar to a name, or None if nothing scores high enough."""
+        matches = self.find_similar(name, top_k=1, min_similarity=min_similarity)
+        return matches[0][0] if matches else None
+
+    def _score(self, query: str, query_tokens: set, name_id: int, min_similarity: float) -> float:
+        """
+        Blend the edit similarity of the whole names with the share of query words found.
+
+        Scores that cannot reach min_similarity are only bounded, not computed exactly.
+        """
+        candidate = self._names[name_id]
+        shared_words = len(query_tokens & self._name_tokens[name_id]) / len(query_tokens)
+        longest = max(len(query), len(candidate))
+
+        # Edit distances above this cannot reach min_similarity whatever the word overlap
+        slack = (1.0 - (min_similarity - (1.0 - EDIT_WEIGHT) * shared_words) / EDIT_WEIGHT) * longest
+        limit = int(slack)
+        distance = edit_distance(query, candidate, limit) if slack >= 0 else limit + 1
+        if distance > limit:
+            return (1.0 - EDIT_WEIGHT) * shared_words  # Lower bound, below min_similarity
+        return EDIT_WEIGHT * (1.0 - distance / longest) + (1.0 - EDIT_WEIGHT) * shared_words
+
+
+# Matcher of the product list it was last built for
+_cached_matcher: Optional[ProductNameMatcher] = None
+
+
+def get_product_matcher(products: List) -> ProductNameMatcher:
+    """Get the matcher for a product list, reusing the last one built for the same list."""
+    global _cached_matcher
+    if _cached_matcher is None or _cached_matcher.products is not products:
+        _cached_matcher = ProductNameMatcher(products)
+    return _cached_matcher
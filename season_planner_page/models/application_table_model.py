@@ -14,6 +14,7 @@ from data.repository_product import ProductRepository
 from common.utils import get_preferences_manager
 from .application_validator import ApplicationValidator, ValidationState
 from .applications_eiq_calculator import ApplicationEIQCalculator
+from .eiq_calculation_service import BACKGROUND_MIN_APPLICATIONS, EIQCalculationService
 
 
 @dataclass
@@ -75,7 +76,16 @@ class ApplicationTableModel(QAbstractTableModel):
         
         # Service classes
         self._validator = ApplicationValidator()
-        self._eiq_calculator = ApplicationEIQCalculator(get_preferences_manager().get_section("user_preferences", {}))
+        self._user_preferences = get_preferences_manager().get_section("user_preferences", {})
+        self._eiq_calculator = ApplicationEIQCalculator(self._user_preferences)
+        get_preferences_manager().signals.section_changed.connect(self._on_preferences_changed)
+        
+        # Full recalculations of large seasons run on the calculation service
+        self._eiq_service = EIQCalculationService.get_instance()
+        self._eiq_service.scenario_calculated.connect(self._apply_eiq_result)
+        self._eiq_service.calculation_failed.connect(self._on_eiq_failed)
+        self._eiq_request_key = ("applications", id(self))
+        self._eiq_request_apps: List[Application] = []  # Applications of the pending request, in row order
         
         # Repository references
         self._products_repo = ProductRepository.get_instance()
@@ -195,7 +205,10 @@ class ApplicationTableModel(QAbstractTableModel):
             
             self.endInsertRows()
             self._clear_validation_cache()
-            self._recalculate_all_eiq()
+            
+            # New applications are empty, so they don't affect the other rows' EIQ
+            for app in self._applications[position:position + rows]:
+                self._eiq_calculator.update_application(app)
             self._emit_signals()
             return True
             
@@ -215,13 +228,17 @@ class ApplicationTableModel(QAbstractTableModel):
         try:
             self.beginRemoveRows(parent, position, position + rows - 1)
             
-            for _ in range(rows):
-                if position < len(self._applications):
-                    self._applications.pop(position)
+            removed = self._applications[position:position + rows]
+            del self._applications[position:position + rows]
             
             self.endRemoveRows()
             self._clear_validation_cache()
-            self._recalculate_all_eiq()
+            
+            average_changed = False
+            for app in removed:
+                average_changed = self._eiq_calculator.remove_application(app) or average_changed
+            if average_changed:
+                self._emit_field_eiq_changed()
             self._emit_signals()
             return True
             
@@ -289,7 +306,7 @@ class ApplicationTableModel(QAbstractTableModel):
         
         try:
             self._applications[row], self._applications[row - 1] = self._applications[row - 1], self._applications[row]
-            self._clear_validation_cache()
+            self._swap_validation_cache(row, row - 1)
             
             top_left = self.index(row - 1, 0)
             bottom_right = self.index(row, self.columnCount() - 1)
@@ -307,7 +324,7 @@ class ApplicationTableModel(QAbstractTableModel):
         
         try:
             self._applications[row], self._applications[row + 1] = self._applications[row + 1], self._applications[row]
-            self._clear_validation_cache()
+            self._swap_validation_cache(row, row + 1)
             
             top_left = self.index(row, 0)
             bottom_right = self.index(row + 1, self.columnCount() - 1)
@@ -491,26 +508,11 @@ class ApplicationTableModel(QAbstractTableModel):
                         app.product_type = product.product_type
                         app.application_method = product.application_method  # Update application method
 
-                # Clear validation cache and recalculate all EIQs
-                self._validation_cache.clear()
-                self._recalculate_all_eiq()
-
-                # Emit changes for the entire table since averages may have changed
-                if self.rowCount() > 0:
-                    top_left = self.index(0, 0)
-                    bottom_right = self.index(self.rowCount() - 1, self.columnCount() - 1)
-                    self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.BackgroundRole, Qt.ToolTipRole])
+                self._recalculate_application(row)
 
-            elif changed_col in {self._col_index("Rate"), self._col_index("Rate UOM")}:
-                # Rate or UOM changed - recalculate all EIQs to update averages
-                self._validation_cache.clear()
-                self._recalculate_all_eiq()
-                
-                # Emit change for the entire table since averages may have changed
-                if self.rowCount() > 0:
-                    top_left = self.index(0, 0)
-                    bottom_right = self.index(self.rowCount() - 1, self.columnCount() - 1)
-                    self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.BackgroundRole, Qt.ToolTipRole])
+            elif self._affects_validation(changed_col):
+                # Rate, UOM or area changed - only this row needs recalculating
+                self._recalculate_application(row)
         
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error in ApplicationTableModel._update_dependent_fields() method: {e}")
@@ -532,15 +534,88 @@ class ApplicationTableModel(QAbstractTableModel):
             QMessageBox.warning(None, "Error", f"Error in ApplicationTableModel._update_ai_groups() method: {e}")
             app.ai_groups = []
     
+    def _recalculate_application(self, row: int):
+        """
+        Recalculate EIQ for a single edited application.
+        
+        The row is repainted; other rows are only repainted if the estimate
+        average used by VALID_ESTIMATED applications changed.
+        """
+        try:
+            app = self._applications[row]
+            self._update_ai_groups(app, row)
+            self._validation_cache.pop(row, None)
+            
+            average_changed = self._eiq_calculator.update_application(app, self._get_validation(app, row))
+            if self._eiq_request_apps:
+                self._request_eiq_recalculation()  # The pending result no longer matches this row
+            
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1),
+                                  [Qt.DisplayRole, Qt.BackgroundRole, Qt.ToolTipRole])
+            if average_changed:
+                self._emit_field_eiq_changed()
+        except Exception as e:
+            QMessageBox.warning(None, "Error", f"Error in ApplicationTableModel._recalculate_application() method: {e}")
+    
+    def _emit_field_eiq_changed(self):
+        """Repaint the Field EIQ column after the estimate average changed."""
+        if self.rowCount() > 0:
+            eiq_col = self._col_index("Field EIQ")
+            self.dataChanged.emit(self.index(0, eiq_col), self.index(self.rowCount() - 1, eiq_col),
+                                  [Qt.DisplayRole, Qt.BackgroundRole, Qt.ToolTipRole])
+    
     def _recalculate_all_eiq(self):
-        """Recalculate EIQ for all applications."""
+        """
+        Recalculate EIQ for all applications.
+        
+        Seasons of BACKGROUND_MIN_APPLICATIONS or more are recalculated on the calculation
+        service; the rows keep their previous EIQ until the result arrives.
+        """
         try:
             for app in self._applications:
                 self._update_ai_groups(app, 0)  # Row doesn't matter for AI groups
             
+            if len(self._applications) >= BACKGROUND_MIN_APPLICATIONS:
+                self._request_eiq_recalculation()
+                return
+            
+            self._eiq_service.cancel(self._eiq_request_key)
+            self._eiq_request_apps = []
             self._eiq_calculator.calculate_all_eiq_values(self._applications)
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error in ApplicationTableModel._recalculate_all_eiq() method: {e}")
+    
+    def _request_eiq_recalculation(self):
+        """Recalculate all applications on the calculation service, superseding any pending request."""
+        self._eiq_request_apps = list(self._applications)
+        self._eiq_service.request_scenario(self._eiq_request_key, self._applications,
+                                           self._field_area, self._field_area_uom, self._user_preferences)
+    
+    def _apply_eiq_result(self, key, result):
+        """Load a background recalculation, or request a new one if rows changed meanwhile."""
+        if key != self._eiq_request_key:
+            return
+        
+        try:
+            if len(self._eiq_request_apps) != len(self._applications) or any(
+                    requested is not app for requested, app in zip(self._eiq_request_apps, self._applications)):
+                self._request_eiq_recalculation()  # Rows were inserted, removed or moved
+                return
+            
+            self._eiq_request_apps = []
+            self._eiq_calculator.set_row_state(self._applications, result.field_eiqs,
+                                               result.contributions, result.estimated_rows)
+            self._emit_field_eiq_changed()
+            self._emit_signals()
+        except Exception as e:
+            QMessageBox.warning(None, "Error", f"Error in ApplicationTableModel._apply_eiq_result() method: {e}")
+    
+    def _on_eiq_failed(self, key, message: str):
+        """Report a failed background recalculation."""
+        if key != self._eiq_request_key:
+            return
+        self._eiq_request_apps = []
+        QMessageBox.warning(None, "Error", f"Error in ApplicationTableModel._recalculate_all_eiq() method: {message}")
 
     def _get_validation(self, app: Application, row: int):
         """Get validation result with caching."""
@@ -552,6 +627,31 @@ class ApplicationTableModel(QAbstractTableModel):
         """Clear the validation cache."""
         self._validation_cache.clear()
     
+    def _swap_validation_cache(self, row_a: int, row_b: int):
+        """Swap the cached validation results of two rows that exchanged applications."""
+        result_a = self._validation_cache.pop(row_a, None)
+        result_b = self._validation_cache.pop(row_b, None)
+        if result_a is not None:
+            self._validation_cache[row_b] = result_a
+        if result_b is not None:
+            self._validation_cache[row_a] = result_b
+    
+    def _on_preferences_changed(self, section: str, data: dict):
+        """Recalculate and revalidate with the new user preferences (row spacing, seeding rate)."""
+        if section != "user_preferences":
+            return
+        
+        self._user_preferences = dict(data)
+        self._eiq_calculator = ApplicationEIQCalculator(self._user_preferences)
+        if not self._applications:
+            return
+        
+        self._clear_validation_cache()
+        self._recalculate_all_eiq()
+        self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1),
+                              [Qt.DisplayRole, Qt.BackgroundRole, Qt.ToolTipRole])
+        self._emit_signals()
+    
     def _emit_signals(self):
         """Emit change signals."""
         try:
@@ -562,16 +662,12 @@ class ApplicationTableModel(QAbstractTableModel):
             QMessageBox.warning(None, "Error", f"Error in ApplicationTableModel._emit_signals() method: {e}")
 
     def _find_product(self, product_name: str):
-        """Find a product by name in the filtered products list."""
+        """Find a product by name in the filtered products index."""
         try:
             if not product_name:
                 return None
             
-            filtered_products = self._products_repo.get_filtered_products()
-            for product in filtered_products:
-                if product.product_name == product_name:
-                    return product
-            return None
+            return self._products_repo.find_product(product_name)
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error in ApplicationTableModel._find_product() method: {e}")
             return None
@@ -596,15 +692,8 @@ class ApplicationTableModel(QAbstractTableModel):
             if not app.rate_uom and product.rate_uom:
                 app.rate_uom = product.rate_uom
             
-            # Clear validation cache and recalculate
-            self._validation_cache.pop(row, None)
-            self._recalculate_all_eiq()
-            
-            # Emit changes
-            if self.rowCount() > 0:
-                top_left = self.index(row, 0)
-                bottom_right = self.index(row, self.columnCount() - 1)
-                self.dataChanged.emit(top_left, bottom_right, [Qt.DisplayRole, Qt.BackgroundRole, Qt.ToolTipRole])
+            # Recalculate and repaint this row
+            self._recalculate_application(row)
             
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error in ApplicationTableModel.auto_populate_from_product() method: {e}")
\ No newline at end of file
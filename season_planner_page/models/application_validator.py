@@ -239,8 +239,8 @@ class ApplicationValidator:
             
             # Only convert if UOMs are different
             if app_rate_uom != label_rate_uom:
-                from_composite = CompositeUOM(app_rate_uom)
-                to_composite = CompositeUOM(label_rate_uom)
+                from_composite = CompositeUOM.intern(app_rate_uom)
+                to_composite = CompositeUOM.intern(label_rate_uom)
                 
                 converted_app_rate = uom_repo.convert_composite_uom(
                     app_rate, from_composite, to_composite, user_preferences
@@ -250,7 +250,10 @@ class ApplicationValidator:
                 
         except Exception as e:
             # If conversion fails, we can't validate - log the issue but don't block
-            QMessageBox.warning(None, "Warning", f"Could not convert rate units for validation: {app_rate_uom} -> {label_rate_uom}: {e}")
+            # (silently when validating on an EIQ calculation worker thread)
+            from common.utils import is_gui_thread
+            if is_gui_thread():
+                QMessageBox.warning(None, "Warning", f"Could not convert rate units for validation: {app_rate_uom} -> {label_rate_uom}: {e}")
             return None
         
         # Now compare converted rate with label rates
@@ -317,16 +320,12 @@ class ApplicationValidator:
         return base_status
     
     def _find_product(self, product_name: str):
-        """Find a product by name in the filtered products list."""
+        """Find a product by name in the filtered products index."""
         try:
             if not product_name:
                 return None
             
-            filtered_products = self._products_repo.get_filtered_products()
-            for product in filtered_products:
-                if product.product_name == product_name:
-                    return product
-            return None
+            return self._products_repo.find_product(product_name)
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error in ApplicationValidator._find_product() method: {e}")
             return None
@@ -2,14 +2,22 @@
 Application EIQ Calculator for the Season Planner.
 
 Handles EIQ calculations including estimation for applications with missing AI data.
+Keeps per-application results and a running estimate average, so editing one
+application only recomputes that application.
 """
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from PySide6.QtWidgets import QMessageBox
 from data.model_application import Application
 from data.repository_product import ProductRepository
 from common.calculations.layer_1_interface import eiq_calculator
-from .application_validator import ApplicationValidator, ValidationState
+from .application_validator import ApplicationValidator, ValidationState, ValidationResult
+
+# States whose EIQ is calculated directly from the product's AI data
+_DIRECT_EIQ_STATES = (ValidationState.VALID, ValidationState.RATE_ISSUES, ValidationState.INVALID_DATA)
+
+# Estimated EIQ used when no application contributes to the average
+DEFAULT_ESTIMATED_EIQ = 30.0
 
 
 class ApplicationEIQCalculator:
@@ -25,6 +33,11 @@ class ApplicationEIQCalculator:
         self._products_repo = ProductRepository.get_instance()
         self._validator = ApplicationValidator()
         self._user_preferences = user_preferences or {}
+        
+        # Incremental state, keyed by application identity
+        self._contributions: Dict[int, float] = {}      # Direct EIQs counted in the estimate average
+        self._estimated_apps: Dict[int, Application] = {}  # VALID_ESTIMATED applications
+        self._estimate_sum = 0.0
     
     def calculate_application_eiq(self, app: Application, all_applications: List[Application] = None) -> float:
         """
@@ -105,72 +118,210 @@ class ApplicationEIQCalculator:
     
     def calculate_all_eiq_values(self, applications: List[Application]) -> None:
         """
-        Calculate EIQ for all applications using a two-pass approach.
+        Calculate EIQ for all applications and rebuild the incremental state.
         
-        Pass 1: Calculate EIQ for VALID, RATE_ISSUES and INVALID_DATA applications (complete AI data)
-        Pass 2: Calculate estimated EIQ for VALID_ESTIMATED applications
+        Each application is validated and calculated once; VALID_ESTIMATED applications
+        then get the average of the direct EIQs (excluding fumigations).
         """
         try:
-            # Pass 1: Calculate EIQ for VALID, RATE_ISSUES and INVALID_DATA applications
-            for app in applications:
-                validation = self._validator.validate_application(app)
-                if validation.state in [ValidationState.VALID, ValidationState.RATE_ISSUES, ValidationState.INVALID_DATA]:
-                    app.field_eiq = self.calculate_application_eiq(app)
-                else:
-                    app.field_eiq = 0.0
-            
-            # Pass 2: Calculate estimated EIQ for VALID_ESTIMATED applications
-            for app in applications:
-                validation = self._validator.validate_application(app)
-                if validation.state == ValidationState.VALID_ESTIMATED:
-                    app.field_eiq = self.calculate_application_eiq(app, applications)
-                    
+            self.compute_all_eiq_values(applications)
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error in ApplicationEIQCalculator.calculate_all_eiq_values() method: {e}")
-
-    def get_total_eiq(self, applications: List[Application], field_area: float = None, field_area_uom: str = "acre") -> float:
-        """Calculate area-weighted EIQ for all applications."""
-        try:
-            if not applications:
-                return 0.0
-                
-            # If no field area provided, try to calculate simple sum as fallback
-            if field_area is None or field_area <= 0:
-                total_eiq = 0.0
-                for app in applications:
-                    if app.field_eiq and app.field_eiq > 0:
-                        total_eiq += app.field_eiq
-                return total_eiq
-            
-            # Use the standardizer to convert areas to hectares
-            from common.calculations.layer_2_uom_std import EIQUOMStandardizer
-            standardizer = EIQUOMStandardizer()
+    
+    def compute_all_eiq_values(self, applications: List[Application]) -> None:
+        """
+        Same as calculate_all_eiq_values, but raises instead of showing a message box.
+        
+        Safe to call from a worker thread on applications no other thread is using.
+        """
+        self._contributions.clear()
+        self._estimated_apps.clear()
+        self._estimate_sum = 0.0
+        
+        for app in applications:
+            self._evaluate_application(app)
+        
+        self._apply_estimated_average()
+    
+    def get_row_state(self, applications: List[Application]) -> Tuple[Dict[int, float], List[int]]:
+        """
+        Get the incremental state by row, so it can be moved to other Application objects.
+        
+        Returns:
+            Tuple of (direct EIQ counted in the estimate average by row, rows of VALID_ESTIMATED applications)
+        """
+        contributions = {row: self._contributions[id(app)] for row, app in enumerate(applications)
+                         if id(app) in self._contributions}
+        estimated_rows = [row for row, app in enumerate(applications) if id(app) in self._estimated_apps]
+        return contributions, estimated_rows
+    
+    def set_row_state(self, applications: List[Application], field_eiqs: List[float],
+                      contributions: Dict[int, float], estimated_rows: List[int]) -> None:
+        """
+        Load results computed elsewhere (see get_row_state) instead of recalculating.
+        
+        Args:
+            applications: Applications the results were computed for, in the same order
+            field_eiqs: Field EIQ of each application
+            contributions: Direct EIQ counted in the estimate average by row
+            estimated_rows: Rows of VALID_ESTIMATED applications
+        """
+        for app, field_eiq in zip(applications, field_eiqs):
+            app.field_eiq = field_eiq
+        self._contributions = {id(applications[row]): eiq for row, eiq in contributions.items()}
+        self._estimated_apps = {id(applications[row]): applications[row] for row in estimated_rows}
+        self._estimate_sum = sum(self._contributions.values())
+    
+    def update_application(self, app: Application, validation: Optional[ValidationResult] = None) -> bool:
+        """
+        Recalculate a single edited application.
+        
+        Args:
+            app: The edited application
+            validation: Its current validation result, if already known
             
-            # Prepare application data for standardization
-            app_data = []
-            for app in applications:
-                app_data.append({
-                    'area': getattr(app, 'area', 0) if hasattr(app, 'area') else 0
-                })
+        Returns:
+            bool: True if the estimate average changed, so VALID_ESTIMATED applications were updated too
+        """
+        try:
+            previous_average = self.estimated_average
+            self._forget_application(app)
+            self._evaluate_application(app, validation)
             
-            # Standardize areas to hectares
-            standardized_apps, field_area_ha = standardizer.standardize_scenario_areas(
-                app_data, field_area, field_area_uom, self._user_preferences
-            )
+            if self.estimated_average != previous_average:
+                self._apply_estimated_average()
+                return True
             
-            # Calculate area-weighted EIQ using standardized areas
-            total_eiq_units = 0.0
-            for i, app in enumerate(applications):
-                if app.field_eiq and app.field_eiq > 0:
-                    standardized_area = standardized_apps[i]['area'] if i < len(standardized_apps) else 0
-                    total_eiq_units += app.field_eiq * standardized_area
-                    
-            return total_eiq_units / field_area_ha if field_area_ha > 0 else 0.0
+            if id(app) in self._estimated_apps:
+                app.field_eiq = previous_average
+            return False
             
+        except Exception as e:
+            QMessageBox.warning(None, "Error", f"Error in ApplicationEIQCalculator.update_application() method: {e}")
+            return False
+    
+    def remove_application(self, app: Application) -> bool:
+        """
+        Drop a removed application from the incremental state.
+        
+        Returns:
+            bool: True if the estimate average changed, so VALID_ESTIMATED applications were updated
+        """
+        previous_average = self.estimated_average
+        self._forget_application(app)
+        if self.estimated_average != previous_average:
+            self._apply_estimated_average()
+            return True
+        return False
+    
+    @property
+    def estimated_average(self) -> float:
+        """Average direct EIQ used for VALID_ESTIMATED applications."""
+        if not self._contributions:
+            return DEFAULT_ESTIMATED_EIQ
+        return self._estimate_sum / len(self._contributions)
+    
+    def _evaluate_application(self, app: Application, validation: Optional[ValidationResult] = None) -> None:
+        """Calculate one application's EIQ and register its share of the estimate average."""
+        app.field_eiq = 0.0
+        
+        if not app.product_name or not app.rate or not app.rate_uom:
+            return
+        
+        product = self._find_product(app.product_name)
+        if not product:
+            return
+        
+        if validation is None:
+            validation = self._validator.validate_application(app)
+        
+        direct_eiq = None
+        if validation.state in _DIRECT_EIQ_STATES:
+            ai_data = product.get_ai_data()
+            if ai_data:
+                direct_eiq = eiq_calculator.calculate_product_field_eiq(
+                    active_ingredients=ai_data,
+                    application_rate=app.rate,
+                    application_rate_uom=app.rate_uom,
+                    applications=1,
+                    user_preferences=self._user_preferences
+                )
+        
+        # Exclude EIQ values >= 1000 (fumigations) from the estimate average
+        if direct_eiq is not None and 0 < direct_eiq < 1000:
+            self._contributions[id(app)] = direct_eiq
+            self._estimate_sum += direct_eiq
+        
+        # Adjuvants and biologicals don't contribute to the season EIQ
+        if self._is_adjuvant_or_biological(product):
+            return
+        
+        if validation.state in _DIRECT_EIQ_STATES:
+            app.field_eiq = direct_eiq or 0.0
+        elif validation.state == ValidationState.VALID_ESTIMATED:
+            self._estimated_apps[id(app)] = app
+    
+    def _forget_application(self, app: Application) -> None:
+        """Remove an application's share of the incremental state."""
+        contribution = self._contributions.pop(id(app), None)
+        if contribution is not None:
+            self._estimate_sum -= contribution
+        if not self._contributions:
+            self._estimate_sum = 0.0  # Reset accumulated rounding drift
+        self._estimated_apps.pop(id(app), None)
+    
+    def _apply_estimated_average(self) -> None:
+        """Assign the current estimate average to all VALID_ESTIMATED applications."""
+        average = self.estimated_average
+        for app in self._estimated_apps.values():
+            app.field_eiq = average
+
+    def get_total_eiq(self, applications: List[Application], field_area: float = None, field_area_uom: str = "acre") -> float:
+        """Calculate area-weighted EIQ for all applications."""
+        try:
+            return self.compute_total_eiq(applications, field_area, field_area_uom)
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error calculating total EIQ: {e}")
             return 0.0
     
+    def compute_total_eiq(self, applications: List[Application], field_area: float = None, field_area_uom: str = "acre") -> float:
+        """Same as get_total_eiq, but raises instead of showing a message box (safe on a worker thread)."""
+        if not applications:
+            return 0.0
+            
+        # If no field area provided, try to calculate simple sum as fallback
+        if field_area is None or field_area <= 0:
+            total_eiq = 0.0
+            for app in applications:
+                if app.field_eiq and app.field_eiq > 0:
+                    total_eiq += app.field_eiq
+            return total_eiq
+        
+        # Use the standardizer to convert areas to hectares
+        from common.calculations.layer_2_uom_std import EIQUOMStandardizer
+        standardizer = EIQUOMStandardizer()
+        
+        # Prepare application data for standardization
+        app_data = []
+        for app in applications:
+            app_data.append({
+                'area': getattr(app, 'area', 0) if hasattr(app, 'area') else 0
+            })
+        
+        # Standardize areas to hectares
+        standardized_apps, field_area_ha = standardizer.standardize_scenario_areas(
+            app_data, field_area, field_area_uom, self._user_preferences
+        )
+        
+        # Calculate area-weighted EIQ using standardized areas
+        total_eiq_units = 0.0
+        for i, app in enumerate(applications):
+            if app.field_eiq and app.field_eiq > 0:
+                standardized_area = standardized_apps[i]['area'] if i < len(standardized_apps) else 0
+                total_eiq_units += app.field_eiq * standardized_area
+                
+        return total_eiq_units / field_area_ha if field_area_ha > 0 else 0.0
+    
     def _calculate_average_eiq_for_estimation(self, applications: List[Application]) -> float:
         """
         Calculate average EIQ from applications that have valid EIQ calculations.
@@ -220,16 +371,12 @@ class ApplicationEIQCalculator:
             return 30.0
     
     def _find_product(self, product_name: str):
-        """Find a product by name in the filtered products list."""
+        """Find a product by name in the filtered products index."""
         try:
             if not product_name:
                 return None
             
-            filtered_products = self._products_repo.get_filtered_products()
-            for product in filtered_products:
-                if product.product_name == product_name:
-                    return product
-            return None
+            return self._products_repo.find_product(product_name)
         except Exception as e:
             QMessageBox.warning(None, "Error", f"Error in ApplicationEIQCalculator._find_product() method: {e}")
             return None
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""
+EIQ Calculation Service for the Season Planner.
+
+Runs full season EIQ recalculations on a worker thread, so the season planner and the
+scenarios comparison page stay responsive while large seasons or many scenarios
+recompute. Each request works on a snapshot of the applications and its result is
+delivered on the GUI thread through scenario_calculated.
+
+Requests are coalesced by key (one key per table model or compared scenario): a newer
+request supersedes the pending one, which is skipped if it has not started yet and
+whose result is dropped if it has.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List
+from PySide6.QtCore import QObject, QThreadPool, Signal
+from data.model_application import Application
+from common.utils import get_preferences_manager
+from .applications_eiq_calculator import ApplicationEIQCalculator
+
+# Seasons with fewer applications are recalculated synchronously by the table model
+BACKGROUND_MIN_APPLICATIONS = 100
+
+
+@dataclass
+class ScenarioEIQResult:
+    """EIQ of a season, by row in the order the applications were requested."""
+    field_eiqs: List[float] = field(default_factory=list)
+    contributions: Dict[int, float] = field(default_factory=dict)  # Direct EIQs in the estimate average, by row
+    estimated_rows: List[int] = field(default_factory=list)        # Rows using the estimate average
+    total_eiq: float = 0.0                                         # Area-weighted season Field EIQ
+    seconds: float = 0.0
+
+
+def calculate_scenario_eiq(applications: List[Application], field_area: float, field_area_uom: str,
+                           user_preferences: dict = None) -> ScenarioEIQResult:
+    """
+    Recalculate a season with its own ApplicationEIQCalculator.
+
+    Raises instead of showing message boxes, so it can run on a worker thread; the
+    applications' field_eiq values are overwritten.
+    """
+    start = time.perf_counter()
+    calculator = ApplicationEIQCalculator(user_preferences)
+    calculator.compute_all_eiq_values(applications)
+    contributions, estimated_rows = calculator.get_row_state(applications)
+
+    return ScenarioEIQResult(
+        field_eiqs=[app.field_eiq for app in applications],
+        contributions=contributions,
+        estimated_rows=estimated_rows,
+        total_eiq=calculator.compute_total_eiq(applications, field_area, field_area_uom),
+        seconds=time.perf_counter() - start,
+    )
+
+
+class EIQCalculationService(QObject):
+    """
+    Singleton running season EIQ recalculations on a worker thread.
+
+    Results and errors are emitted on the GUI thread, only for the latest request of a key.
+    """
+
+    scenario_calculated = Signal(object, object)   # (request key, ScenarioEIQResult)
+    calculation_failed = Signal(object, str)       # (request key, error message)
+
+    _result_ready = Signal(object, int, object, str)  # (key, generation, result or None, error message)
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Get the singleton instance."""
+        if cls._instance is None:
+            cls._instance = EIQCalculationService()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        """Initialize the service."""
+        super().__init__(parent)
+        self._generation = 0                              # Incremented by every request
+        self._pending: Dict[Hashable, int] = {}           # Key -> generation of its latest request
+
+        # One worker: the calculation is pure Python, so more threads would only contend for the GIL
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._result_ready.connect(self._deliver_result)
+
+    def request_scenario(self, key: Hashable, applications: List[Application], field_area: float,
+                         field_area_uom: str, user_preferences: dict = None) -> None:
+        """
+        Recalculate a season in the background, superseding any pending request for the key.
+
+        Args:
+            key: Identifies the requester; results are emitted with it
+            applications: Applications to calculate (copied; the originals are not touched)
+            field_area, field_area_uom: Field size used for the area-weighted total
+            user_preferences: Preferences for UOM conversions (default: the saved user preferences)
+        """
+        if user_preferences is None:
+            user_preferences = get_preferences_manager().get_section("user_preferences", {})
+        user_preferences = dict(user_preferences)
+        snapshot = [Application.from_dict(app.to_dict()) for app in applications]
+
+        self._generation += 1
+        generation = self._generation
+        self._pending[key] = generation
+        is_current = lambda: self._pending.get(key) == generation
+
+        def calculate():
+            if not is_current():
+                return
+            try:
+                result = calculate_scenario_eiq(snapshot, field_area, field_area_uom, user_preferences)
+                self._result_ready.emit(key, generation, result, "")
+            except Exception as e:
+                self._result_ready.emit(key, generation, None, str(e))
+
+        self._pool.start(calculate)
+
+    def cancel(self, key: Hashable) -> None:
+        """Drop the pending request of a key, if any."""
+        self._pending.pop(key, None)
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Whether a request of the key has not been delivered yet."""
+        return key in self._pending
+
+    def _deliver_result(self, key: Hashable, generation: int, result, error: str):
+        """Emit a worker's result on the GUI thread if it is still the latest request of its key."""
+        if self._pending.get(key) != generation:
+            return
+        del self._pending[key]
+        if result is None:
+            self.calculation_failed.emit(key, error)
+        else:
+            self.scenario_calculated.emit(key, result)
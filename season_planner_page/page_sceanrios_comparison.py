@@ -5,12 +5,13 @@ A container page that displays multiple ScenarioComparisonTable widgets
 to compare scenarios side by side.
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QMessageBox
 from PySide6.QtCore import Qt
 from common.constants import get_margin_large, get_spacing_medium
 from common.styles import get_medium_font
 from common.widgets.header_frame_buttons import HeaderWithHomeButton
 from common.widgets.scorebar import ScoreBar
+from .models.eiq_calculation_service import EIQCalculationService
 from .widgets.scenario_comparison_table import ScenarioComparisonTable
 
 
@@ -18,13 +19,20 @@ class ScenariosComparisonPage(QWidget):
     """
     Page for comparing scenarios side by side.
     
-    Acts as a container for multiple ScenarioComparisonTable widgets.
+    Acts as a container for multiple ScenarioComparisonTable widgets. Tables first show
+    the scenarios' stored EIQ values; every scenario is recalculated on the calculation
+    service and its table refreshed when the result arrives.
     """
     
     def __init__(self, parent=None):
         """Initialize the scenarios comparison page."""
         super().__init__(parent)
         self.parent = parent
+        self.scenarios = []
+        self._eiq_requests = {}  # Request key -> (scenario, table widget, requested applications)
+        self._eiq_service = EIQCalculationService.get_instance()
+        self._eiq_service.scenario_calculated.connect(self._apply_eiq_result)
+        self._eiq_service.calculation_failed.connect(self._on_eiq_failed)
         self.setup_ui()
         
     def setup_ui(self):
@@ -65,6 +73,12 @@ class ScenariosComparisonPage(QWidget):
     
     def load_scenarios(self):
         """Load scenarios from the parent scenarios manager."""
+        # Results of a previous load would target the tables being removed
+        for key in self._eiq_requests:
+            self._eiq_service.cancel(key)
+        self._eiq_requests.clear()
+        self.scenarios = []
+        
         # Clear existing scenario tables
         for i in reversed(range(self.scenarios_layout.count())):
             child = self.scenarios_layout.takeAt(i).widget()
@@ -95,8 +109,40 @@ class ScenariosComparisonPage(QWidget):
             scenario_widget = ScenarioComparisonTable(scenario, index)
             # Add each widget with stretch factor 1 to distribute space evenly
             self.scenarios_layout.addWidget(scenario_widget, 1)
+            self._request_eiq(index, scenario, scenario_widget)
         # Update the scorebar with scenario data
+        self.scenarios = scenarios
         self.update_scorebar(scenarios)
+    
+    def _request_eiq(self, index, scenario, scenario_widget):
+        """Recalculate a scenario's EIQ in the background."""
+        if not scenario.applications:
+            return
+        key = ("comparison", index)
+        self._eiq_requests[key] = (scenario, scenario_widget, list(scenario.applications))
+        self._eiq_service.request_scenario(key, scenario.applications, scenario.field_area, scenario.field_area_uom)
+    
+    def _apply_eiq_result(self, key, result):
+        """Store a scenario's recalculated EIQ values and refresh its table and the scorebar."""
+        request = self._eiq_requests.pop(key, None)
+        if request is None:
+            return
+        
+        scenario, scenario_widget, requested_apps = request
+        if len(requested_apps) != len(scenario.applications) or any(
+                requested is not app for requested, app in zip(requested_apps, scenario.applications)):
+            return  # The scenario was edited meanwhile
+        
+        for app, field_eiq in zip(scenario.applications, result.field_eiqs):
+            app.field_eiq = field_eiq
+        scenario_widget.refresh()
+        self.update_scorebar(self.scenarios)
+    
+    def _on_eiq_failed(self, key, message):
+        """Keep a scenario's stored EIQ values if its recalculation failed."""
+        request = self._eiq_requests.pop(key, None)
+        if request is not None:
+            QMessageBox.warning(self, "Error", f"Error calculating EIQ for {request[0].name}: {message}")
 
     def show_no_data_message(self, message):
         """Show a message when no data is available."""
@@ -4,7 +4,7 @@ Scenarios Manager Page for the Season Planner.
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTabWidget, 
-    QMessageBox, QInputDialog, QDialog, QTabBar
+    QMessageBox, QInputDialog, QDialog, QTabBar, QFileDialog
 )
 from PySide6.QtCore import QCoreApplication, Signal
 
@@ -15,7 +15,7 @@ from common.widgets.scorebar import ScoreBar
 from common.widgets.tracer import calculation_tracer
 from season_planner_page.import_export.exporter import ExcelScenarioExporter
 from season_planner_page.tab_scenario import ScenarioTabPage
-from season_planner_page.import_export.import_dialog import ImportScenarioDialog
+from season_planner_page.import_export.import_dialog import ImportScenarioDialog, MultiImportDialog
 from data.model_scenario import Scenario
 
 
@@ -71,6 +71,7 @@ class ScenariosManagerPage(QWidget):
         # Create buttons
         buttons = {
             "Import Scenario": ("white", self.import_scenario),
+            "Import Multiple": ("white", self.import_multiple_scenarios),
             "New Scenario": ("yellow", self.add_new_scenario),
             "Clone Current": ("white", self.clone_current_scenario),
             "Delete": ("white", self.delete_current_scenario),
@@ -364,6 +365,44 @@ class ScenariosManagerPage(QWidget):
                     f"Ready for review and editing."
                 )
     
+    def import_multiple_scenarios(self):
+        """Import several Excel files at once, one scenario per file."""
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Select Excel Files",
+            "",
+            "Excel Files (*.xlsx *.xlsm);;All Files (*)"
+        )
+        if not file_paths:
+            return
+        
+        dialog = MultiImportDialog(file_paths, self)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        
+        imported_scenarios = dialog.get_imported_scenarios()
+        if not imported_scenarios:
+            return
+        
+        # Check if we should remove the empty placeholder scenario
+        self._remove_empty_placeholder_if_needed()
+        
+        # add_new_scenario keeps the original names, only making them unique
+        for imported_scenario in imported_scenarios:
+            self.add_new_scenario(imported_scenario)
+        
+        # Force UI update before showing message
+        self.update_ui_state()
+        QCoreApplication.processEvents()
+        
+        apps_count = sum(len(scenario.applications) for scenario in imported_scenarios)
+        QMessageBox.information(
+            self, "Import Successful",
+            f"{len(imported_scenarios)} scenarios imported successfully!\n\n"
+            f"Applications imported: {apps_count}\n"
+            f"Ready for review and editing."
+        )
+    
     def _remove_empty_placeholder_if_needed(self):
         """Remove the empty placeholder scenario if it's the only one and is empty."""
         # Only proceed if there's exactly one scenario
@@ -102,13 +102,8 @@ class ScenarioComparisonTable(QWidget):
         """
         # Get the product - try different methods to find the product
         try:
-            # Try to get filtered products and find by name
-            filtered_products = self.product_repo.get_filtered_products()
-            product = None
-            for p in filtered_products:
-                if p.product_name == product_name:
-                    product = p
-                    break
+            # Look up the product by name in the filtered products index
+            product = self.product_repo.find_product(product_name)
             
             if not product:
                 return ""
@@ -262,6 +257,13 @@ class ScenarioComparisonTable(QWidget):
         # Resize rows to content
         self.table.resizeRowsToContents()
     
+    def refresh(self):
+        """Rebuild the table from the scenario's current applications."""
+        self.table.clearSpans()
+        self.table.clearContents()
+        self.table.setRowCount(0)
+        self.populate_data()
+    
     def _group_applications_by_type(self, applications):
         """Group applications by their product type (using first 2 words only)."""
         grouped = defaultdict(list)